@@ -7,6 +7,8 @@ from a2a.server.tasks import InMemoryTaskStore
 
 from src.a2a.executor import GreenAgentExecutor
 from src.a2a.agent_card import green_agent_card, specific_extended_agent_card
+from src.services.llm import DEFAULT_MAX_CONCURRENT_REQUESTS, init_llm_pool
+from src.services.llm_cache import DEFAULT_MAX_ENTRIES, PromptCache
 
 
 def main():
@@ -14,8 +16,29 @@ def main():
     parser.add_argument("--host", type=str, default="127.0.0.1", help="Host to bind the server")
     parser.add_argument("--port", type=int, default=9009, help="Port to bind the server")
     parser.add_argument("--card-url", type=str, help="URL to advertise in the agent card")
+    parser.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENT_REQUESTS,
+        help="Maximum filler LLM requests in flight across all games",
+    )
+    parser.add_argument("--llm-cache", action="store_true", help="Reuse filler LLM responses for identical prompts")
+    parser.add_argument(
+        "--llm-cache-size",
+        type=int,
+        default=DEFAULT_MAX_ENTRIES,
+        help="Number of cached LLM responses kept in memory",
+    )
+    parser.add_argument("--llm-cache-dir", type=str, help="Directory to persist the LLM response cache across restarts")
     args = parser.parse_args()
 
+    llm_cache = None
+    if args.llm_cache or args.llm_cache_dir:
+        llm_cache = PromptCache(max_entries=args.llm_cache_size, cache_dir=args.llm_cache_dir)
+
+    # Build the shared LLM client once, before the first evaluation arrives
+    init_llm_pool(max_concurrent_requests=args.llm_concurrency, cache=llm_cache).warm_up()
+
     # Update agent card URL if provided
     agent_card = green_agent_card.model_copy(
         update={"url": args.card_url} if args.card_url else {}
@@ -0,0 +1,94 @@
+"""
+Parse rate and cost of JSON extraction over a corpus of agent/LLM replies.
+
+Compares the old Participant.parse_json_response (whole-string json.loads, then
+code-fence slicing) with src.services.json_extract.extract_json_object. The
+extractor is a robustness change: it parses replies the legacy parser rejects,
+and pays for that with more time per response, which the last line reports.
+
+The default corpus is synthetic: 18 hand-written replies covering the shapes
+the extractor is meant to handle (bare JSON, code fences, leading prose,
+trailing commentary, trailing commas, single quotes). They are not captured
+participant replies, so its parse rates show which shapes each parser handles,
+not how often real agents produce them. Pass --corpus with one
+{"response": ...} object per line to measure captured replies instead.
+
+Usage:
+    python benchmarks/json_extraction.py [--repeat 2000] [--corpus benchmarks/data/agent_responses.jsonl]
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.services import json_extract  # noqa: E402
+from src.services.json_extract import extract_json_object  # noqa: E402
+
+DEFAULT_CORPUS = Path(__file__).resolve().parent / "data" / "agent_responses.jsonl"
+
+
+def legacy_parse(response: str) -> dict:
+    """The parser Participant used before the extractor."""
+    try:
+        return json.loads(response)
+    except json.JSONDecodeError:
+        json_match = response.find("```json")
+        if json_match != -1:
+            start = response.find("\n", json_match) + 1
+            end = response.find("```", start)
+            return json.loads(response[start:end].strip())
+
+        json_match = response.find("```")
+        if json_match != -1:
+            start = response.find("\n", json_match) + 1
+            end = response.find("```", start)
+            return json.loads(response[start:end].strip())
+
+        raise ValueError(f"Could not parse JSON from agent response: {response}")
+
+
+def measure(parse, corpus, repeat: int):
+    parsed = 0
+    for response in corpus:
+        try:
+            if isinstance(parse(response), dict):
+                parsed += 1
+        except ValueError:
+            pass
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for response in corpus:
+            try:
+                parse(response)
+            except ValueError:
+                pass
+    elapsed = time.perf_counter() - start
+    return parsed, elapsed / max(repeat * len(corpus), 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON extraction from agent replies")
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    args = parser.parse_args()
+
+    with open(args.corpus, encoding="utf-8") as f:
+        corpus = [json.loads(line)["response"] for line in f if line.strip()]
+
+    codec = "orjson" if json_extract.orjson is not None else "json"
+    print(f"{len(corpus)} responses, codec: {codec}")
+    results = {}
+    for name, parse in (("legacy", legacy_parse), ("extractor", extract_json_object)):
+        parsed, per_call = measure(parse, corpus, args.repeat)
+        results[name] = per_call
+        print(f"{name:>10}: parsed {parsed}/{len(corpus)}, {per_call * 1e6:.2f} us/response")
+
+    ratio = results["extractor"] / results["legacy"]
+    print(f"extractor time per response: {ratio:.2f}x legacy ({'slower' if ratio > 1 else 'faster'})")
+
+if __name__ == "__main__":
+    main()
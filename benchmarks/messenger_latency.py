@@ -0,0 +1,125 @@
+"""
+Per-call latency of Messenger against a local stub A2A agent.
+
+Compares the old behaviour (a fresh httpx client, card fetch and A2A client for
+every prompt) with a Messenger backed by a pooled keep-alive client.
+
+Usage:
+    python benchmarks/messenger_latency.py [--calls 200] [--port 9119]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import uvicorn
+from a2a.server.agent_execution import AgentExecutor, RequestContext
+from a2a.server.apps import A2AStarletteApplication
+from a2a.server.events import EventQueue
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.types import AgentCapabilities, AgentCard
+from a2a.utils import new_agent_text_message
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.a2a.messenger import Messenger, send_message  # noqa: E402
+
+
+STUB_RESPONSE = json.dumps({"bid_amount": 50, "reason": "stub"})
+
+
+class StubExecutor(AgentExecutor):
+    """Answers every prompt immediately with a fixed JSON payload."""
+
+    async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
+        await event_queue.enqueue_event(new_agent_text_message(STUB_RESPONSE, context_id=context.context_id))
+
+    async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
+        pass
+
+
+def build_stub_app(url: str):
+    card = AgentCard(
+        name="stub",
+        description="Benchmark stub participant",
+        url=url,
+        version="0.0.0",
+        skills=[],
+        default_input_modes=["text"],
+        default_output_modes=["text"],
+        capabilities=AgentCapabilities(streaming=True),
+    )
+    handler = DefaultRequestHandler(agent_executor=StubExecutor(), task_store=InMemoryTaskStore())
+    return A2AStarletteApplication(agent_card=card, http_handler=handler).build()
+
+
+async def start_stub(port: int) -> tuple[uvicorn.Server, asyncio.Task]:
+    url = f"http://127.0.0.1:{port}"
+    config = uvicorn.Config(build_stub_app(url), host="127.0.0.1", port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+    return server, task
+
+
+def summarize(name: str, samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    return (
+        f"{name:<24} mean={statistics.mean(samples) * 1000:7.2f}ms "
+        f"p50={statistics.median(samples) * 1000:7.2f}ms "
+        f"p95={p95 * 1000:7.2f}ms"
+    )
+
+
+async def bench_unpooled(url: str, calls: int) -> list[float]:
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await send_message(message="bid", base_url=url)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def bench_messenger(url: str, calls: int) -> list[float]:
+    messenger = Messenger()
+    samples = []
+    try:
+        for _ in range(calls):
+            start = time.perf_counter()
+            await messenger.talk_to_agent(message="bid", url=url, new_conversation=True)
+            samples.append(time.perf_counter() - start)
+    finally:
+        await messenger.close()
+    return samples
+
+
+async def main(calls: int, port: int):
+    url = f"http://127.0.0.1:{port}"
+    server, task = await start_stub(port)
+    try:
+        # Warm the server up so the first measured call is not an outlier
+        await send_message(message="warmup", base_url=url)
+
+        before = await bench_unpooled(url, calls)
+        after = await bench_messenger(url, calls)
+    finally:
+        server.should_exit = True
+        await task
+
+    print(f"{calls} calls against {url}")
+    print(summarize("per-call client (before)", before))
+    print(summarize("pooled Messenger (after)", after))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--port", type=int, default=9119)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.port))
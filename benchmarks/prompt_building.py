@@ -0,0 +1,73 @@
+"""
+Cost of building debate and vote prompts over a full discussion phase.
+
+Before: every prompt re-formats and re-joins the whole round's chat history.
+After: prompts read the round transcript, which renders each message once.
+
+Usage:
+    python benchmarks/prompt_building.py [--repeat 5]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.game.GameData import GameData  # noqa: E402
+from src.models.Message import Message  # noqa: E402
+from src.models.enum.Phase import Phase  # noqa: E402
+
+
+CONTENT = "I think we should look closely at who has been quiet this round and why. " * 2
+
+
+def rerender_debate(messages):
+    return "\n".join([f"{msg.sender_id}: {msg.content}" for msg in messages])
+
+
+def rerender_vote(messages):
+    return chr(10).join([f"{msg.sender_id} - {msg.content}" for msg in messages])
+
+
+def run_phase(players: int, turns: int, incremental: bool) -> float:
+    """Simulate one discussion phase plus voting, building every prompt's transcript section."""
+    game_data = GameData(current_round=1, turns_to_speak_per_round=turns)
+    game_data.chat_history[1] = []
+    speakers = [f"player_{i}" for i in range(players)]
+
+    start = time.perf_counter()
+    for _ in range(turns):
+        for speaker in speakers:
+            if incremental:
+                game_data.get_transcript(1).debate_text
+            else:
+                rerender_debate(game_data.chat_history[1])
+            game_data.record_message(Message(sender_id=speaker, content=CONTENT, phase=Phase.DISCUSSION))
+    for _ in speakers:
+        if incremental:
+            game_data.get_transcript(1).vote_text
+        else:
+            rerender_vote(game_data.chat_history[1])
+    return time.perf_counter() - start
+
+
+def best_of(repeat: int, *args) -> float:
+    return min(run_phase(*args) for _ in range(repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark transcript rendering for prompts")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'players':>8} {'turns':>6} {'rerender ms':>12} {'transcript ms':>14} {'speedup':>8}")
+    for players in (6, 12, 24):
+        for turns in (1, 3, 5):
+            before = best_of(args.repeat, players, turns, False)
+            after = best_of(args.repeat, players, turns, True)
+            print(f"{players:>8} {turns:>6} {before * 1000:>12.2f} {after * 1000:>14.2f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
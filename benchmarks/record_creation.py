@@ -0,0 +1,174 @@
+"""
+Cost of creating the per-player game records over a simulated 1,000-game run.
+
+Before: Vote, Bid, Event, Message and Elimination are pydantic models validated
+on every construction, and event descriptions are formatted eagerly.
+After: slotted records with no validation on construction and descriptions
+rendered only when read. The same pydantic models built with model_construct
+(no validation, eager descriptions) are measured for comparison.
+
+Each game keeps its records until it ends, like GameData does; the benchmark
+reports wall time and the peak memory traced while a game is live.
+
+Usage:
+    python benchmarks/record_creation.py [--games 1000] [--players 8] [--rounds 4]
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+
+import pydantic
+from pydantic import BaseModel
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.models.Bid import Bid  # noqa: E402
+from src.models.Elimination import Elimination  # noqa: E402
+from src.models.Event import Event  # noqa: E402
+from src.models.Message import Message  # noqa: E402
+from src.models.Vote import Vote  # noqa: E402
+from src.models.enum.EliminationType import EliminationType  # noqa: E402
+from src.models.enum.EventType import EventType  # noqa: E402
+from src.models.enum.Phase import Phase  # noqa: E402
+
+
+class PydanticVote(BaseModel):
+    voter_id: str
+    voted_for_id: str
+    rationale: str
+
+
+class PydanticBid(BaseModel):
+    participant_id: str
+    amount: int
+
+
+class PydanticEvent(BaseModel):
+    type: EventType
+    eliminated_player: str = None
+    player: str = None
+    description: str = None
+
+
+class PydanticMessage(BaseModel):
+    sender_id: str
+    content: str
+    phase: Optional[Phase] = None
+
+
+class PydanticElimination(BaseModel):
+    eliminated_participant: str
+    elimination_type: EliminationType
+
+
+RATIONALE = "They deflected every question about last night and pushed the vote elsewhere."
+CONTENT = "I think we should look closely at who has been quiet this round and why."
+
+
+def play_eager(players, rounds, turns):
+    records = []
+    for round_num in range(1, rounds + 1):
+        for i, player in enumerate(players):
+            records.append(PydanticBid(participant_id=player, amount=i))
+            records.append(PydanticEvent(type=EventType.BID_PLACED, player=player,
+                                         description=f"Placed a bid of {i} points for rationale: {RATIONALE}"))
+        records.append(PydanticEvent(type=EventType.SPEAKING_ORDER_SET, player="System",
+                                     description=f"Speaking order for round {round_num} set as: {', '.join(players)}"))
+        for _ in range(turns):
+            for player in players:
+                records.append(PydanticMessage(sender_id=player, content=CONTENT, phase=Phase.DISCUSSION))
+        for player in players:
+            records.append(PydanticVote(voter_id=player, voted_for_id=players[0], rationale=RATIONALE))
+            records.append(PydanticEvent(type=EventType.VOTE, player=player,
+                                         description=f"Voted for {players[0]} for rationale: {RATIONALE}"))
+        records.append(PydanticElimination(eliminated_participant=players[0], elimination_type=EliminationType.VOTED_OUT))
+        records.append(PydanticEvent(type=EventType.VILLAGE_ELIMINATION, eliminated_player=players[0],
+                                     description=f"Player {players[0]} was eliminated by village vote with {len(players)} votes"))
+    return records
+
+
+def play_construct(players, rounds, turns):
+    """The pydantic models again, built with model_construct to skip validation."""
+    records = []
+    for round_num in range(1, rounds + 1):
+        for i, player in enumerate(players):
+            records.append(PydanticBid.model_construct(participant_id=player, amount=i))
+            records.append(PydanticEvent.model_construct(type=EventType.BID_PLACED, player=player,
+                                                         description=f"Placed a bid of {i} points for rationale: {RATIONALE}"))
+        records.append(PydanticEvent.model_construct(type=EventType.SPEAKING_ORDER_SET, player="System",
+                                                     description=f"Speaking order for round {round_num} set as: {', '.join(players)}"))
+        for _ in range(turns):
+            for player in players:
+                records.append(PydanticMessage.model_construct(sender_id=player, content=CONTENT, phase=Phase.DISCUSSION))
+        for player in players:
+            records.append(PydanticVote.model_construct(voter_id=player, voted_for_id=players[0], rationale=RATIONALE))
+            records.append(PydanticEvent.model_construct(type=EventType.VOTE, player=player,
+                                                         description=f"Voted for {players[0]} for rationale: {RATIONALE}"))
+        records.append(PydanticElimination.model_construct(eliminated_participant=players[0], elimination_type=EliminationType.VOTED_OUT))
+        records.append(PydanticEvent.model_construct(type=EventType.VILLAGE_ELIMINATION, eliminated_player=players[0],
+                                                     description=f"Player {players[0]} was eliminated by village vote with {len(players)} votes"))
+    return records
+
+
+def play_lazy(players, rounds, turns):
+    records = []
+    for round_num in range(1, rounds + 1):
+        for i, player in enumerate(players):
+            records.append(Bid(participant_id=player, amount=i))
+            records.append(Event(type=EventType.BID_PLACED, player=player,
+                                 description="Placed a bid of {} points for rationale: {}", args=(i, RATIONALE)))
+        records.append(Event(type=EventType.SPEAKING_ORDER_SET, player="System",
+                             description="Speaking order for round {} set as: {}", args=(round_num, ", ".join(players))))
+        for _ in range(turns):
+            for player in players:
+                records.append(Message(sender_id=player, content=CONTENT, phase=Phase.DISCUSSION))
+        for player in players:
+            records.append(Vote(voter_id=player, voted_for_id=players[0], rationale=RATIONALE))
+            records.append(Event(type=EventType.VOTE, player=player,
+                                 description="Voted for {} for rationale: {}", args=(players[0], RATIONALE)))
+        records.append(Elimination(eliminated_participant=players[0], elimination_type=EliminationType.VOTED_OUT))
+        records.append(Event(type=EventType.VILLAGE_ELIMINATION, eliminated_player=players[0],
+                             description="Player {} was eliminated by village vote with {} votes",
+                             args=(players[0], len(players))))
+    return records
+
+
+def run(play, games, players, rounds, turns, traced):
+    ids = [f"player_{i:04d}" for i in range(players)]
+    if traced:
+        tracemalloc.start()
+    start = time.perf_counter()
+    created = 0
+    for _ in range(games):
+        created += len(play(ids, rounds, turns))
+    elapsed = time.perf_counter() - start
+    peak = 0
+    if traced:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak, created
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark game record creation")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=4)
+    parser.add_argument("--turns", type=int, default=2)
+    args = parser.parse_args()
+
+    print(f"pydantic {pydantic.VERSION}")
+    print(f"{'models':>10} {'ms':>10} {'us/record':>10} {'peak KiB/game':>14}")
+    for name, play in (("pydantic", play_eager), ("construct", play_construct), ("slotted", play_lazy)):
+        # Time without tracing (tracemalloc slows allocation), then trace one game for memory
+        elapsed, _, created = run(play, args.games, args.players, args.rounds, args.turns, traced=False)
+        _, peak, _ = run(play, 1, args.players, args.rounds, args.turns, traced=True)
+        print(f"{name:>10} {elapsed * 1000:>10.1f} {elapsed / created * 1e6:>10.2f} {peak / 1024:>14.1f}")
+    print(f"{created} records per run ({args.games} games)")
+
+
+if __name__ == "__main__":
+    main()
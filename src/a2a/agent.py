@@ -1,4 +1,5 @@
 
+import asyncio
 import random
 
 from typing import Any, Dict, List
@@ -8,8 +9,11 @@ from a2a.server.tasks import TaskUpdater
 from a2a.types import Message, TaskState, Part, TextPart, DataPart
 from a2a.utils import get_message_text, new_agent_text_message
 
+from src.a2a.call_policy import CallPolicy
+from src.a2a.circuit_breaker import CircuitOpenError
 from src.a2a.messenger import Messenger
 from src.models.EvalRequest import EvalRequest
+from src.models.EvalConfig import EvalConfig
 from src.game.Game import Game
 from src.models.Participant import Participant
 from src.models.enum.Phase import Phase
@@ -17,20 +21,33 @@ from src.models.enum.Phase import Phase
 from uuid import uuid4
 
 from src.models.enum.Role import Role
-from src.services.llm import LLM
+from src.services.deadline import Deadline, DeadlineExceeded, current_deadline
+from src.services.llm import LLM, get_llm_pool
 
 # Number of games to play per role
 GAMES_PER_ROLE = 2
 ROLES_TO_EVALUATE = [Role.VILLAGER, Role.WEREWOLF, Role.SEER]
 
+
+class EvaluationAborted(Exception):
+    """The participant became unreachable; carries the games finished before that."""
+
+    def __init__(self, reason: str, results: Dict[Role, List[Dict[str, Any]]], games_planned: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.results = results
+        self.games_planned = games_planned
+
 class GreenAgent:
     """Runs Werewolf evaluation across multiple games and roles."""
 
     def __init__(self):
+        # Owns the connection pool shared by the per-game messengers
         self.messenger = Messenger()
-        self.game = Game([])
-    
-        
+        # Filler participants all share the process-wide LLM client pool
+        self.llm = LLM(pool=get_llm_pool())
+        self.config = EvalConfig()
+
     async def run(self, message: Message, updater: TaskUpdater) -> None:
         """Implement your agent logic here.
 
@@ -52,46 +69,58 @@ class GreenAgent:
             await updater.reject(new_agent_text_message(f"Invalid request: {e}"))
             return
 
-        participant_url = str(next(iter(request.participants.values())))
+        try:
+            await self.run_evaluation(request, updater)
+        finally:
+            # Release pooled keep-alive connections once the evaluation is over
+            await self.messenger.close()
 
-        # Data structure to store results from all games, grouped by role
-        all_game_results: Dict[Role, List[Dict[str, Any]]] = {
-            role: [] for role in ROLES_TO_EVALUATE
-        }
+    async def run_evaluation(self, request: EvalRequest, updater: TaskUpdater) -> None:
+        """Play every game of the evaluation and publish the aggregate result."""
+        participant_url = str(next(iter(request.participants.values())))
+        self.config = request.config
+        max_concurrent_games = self.config.max_concurrent_games
+        self.messenger.pool.failure_threshold = self.config.breaker_failure_threshold
+        self.messenger.pool.reset_timeout = self.config.breaker_reset_timeout
+        self.messenger.pool.adaptive_concurrency = self.config.adaptive_concurrency
 
         total_games = GAMES_PER_ROLE * len(ROLES_TO_EVALUATE)
-        games_completed = 0
 
         await updater.update_status(
             TaskState.working,
-            new_agent_text_message(f"Starting evaluation: {total_games} games ({GAMES_PER_ROLE} per role)")
+            new_agent_text_message(
+                f"Starting evaluation: {total_games} games ({GAMES_PER_ROLE} per role, up to {max_concurrent_games} at once)"
+            )
         )
 
-        # Run games for each role
-        for role in ROLES_TO_EVALUATE:
+        aborted = None
+        try:
+            # Games started after the evaluation budget is spent end at once as timeouts
+            with Deadline(self.config.evaluation_time_budget).activate():
+                all_game_results = await self.run_games(participant_url, updater, max_concurrent_games)
+        except EvaluationAborted as e:
+            aborted = e
+            all_game_results = e.results
             await updater.update_status(
-                TaskState.working,
-                new_agent_text_message(f"Starting {GAMES_PER_ROLE} games as {role.name}")
+                TaskState.working, new_agent_text_message(f"Evaluation aborted: {e.reason}")
+            )
+        else:
+            await updater.update_status(
+                TaskState.working, new_agent_text_message("All games completed, compiling aggregate analytics")
             )
-
-            for game_num in range(1, GAMES_PER_ROLE + 1):
-                games_completed += 1
-
-                await updater.update_status(
-                    TaskState.working,
-                    new_agent_text_message(f"Game {games_completed}/{total_games}: Playing as {role.name} (game {game_num}/{GAMES_PER_ROLE})")
-                )
-
-                # Run a single game and collect analytics
-                game_analytics = await self.run_single_game(participant_url, role, updater)
-                all_game_results[role].append(game_analytics)
-
-        await updater.update_status(
-            TaskState.working, new_agent_text_message("All games completed, compiling aggregate analytics")
-        )
 
         # Compute aggregate analytics across all games
         aggregate_analytics = self.compute_aggregate_analytics(all_game_results, participant_url)
+        aggregate_analytics["card_cache"] = self.messenger.pool.clients.stats()
+        aggregate_analytics["llm_cache"] = self.llm.cache_stats()
+        aggregate_analytics["circuit_breakers"] = self.messenger.pool.breaker_stats()
+        aggregate_analytics["concurrency"] = self.messenger.pool.limiter_stats()
+        if aborted:
+            aggregate_analytics["aborted"] = {
+                "reason": aborted.reason,
+                "games_completed": aggregate_analytics["total_games"],
+                "games_planned": aborted.games_planned,
+            }
         summary_text = self.render_aggregate_summary(aggregate_analytics)
 
         await updater.add_artifact(
@@ -99,49 +128,127 @@ class GreenAgent:
                 Part(root=TextPart(text=summary_text)),
                 Part(root=DataPart(data=aggregate_analytics))
             ],
-            name="Result",
+            name="Partial Result" if aborted else "Result",
         )
+        if aborted:
+            await updater.failed(new_agent_text_message(f"Evaluation aborted: {aborted.reason}"))
+
+    async def run_games(
+        self,
+        participant_url: str,
+        updater: TaskUpdater,
+        max_concurrent_games: int = 1,
+    ) -> Dict[Role, List[Dict[str, Any]]]:
+        """
+        Run GAMES_PER_ROLE games for every role, at most max_concurrent_games at a time.
+
+        Every game gets its own Game, GameData and Messenger; the messengers share this
+        agent's connection pool. Results are grouped by role in game order, so the
+        aggregate is the same as for a sequential run.
+
+        If a game fails because the participant's circuit breaker opened, the other games are
+        cancelled and EvaluationAborted is raised with the finished games.
+        """
+        schedule = [
+            (role, game_num)
+            for role in ROLES_TO_EVALUATE
+            for game_num in range(1, GAMES_PER_ROLE + 1)
+        ]
+        total_games = len(schedule)
+        semaphore = asyncio.Semaphore(max_concurrent_games)
+        games_started = 0
+
+        async def play(role: Role, game_num: int) -> Dict[str, Any]:
+            nonlocal games_started
+            async with semaphore:
+                games_started += 1
+                await updater.update_status(
+                    TaskState.working,
+                    new_agent_text_message(f"Game {games_started}/{total_games}: Playing as {role.name} (game {game_num}/{GAMES_PER_ROLE})")
+                )
+                return await self.run_single_game(participant_url, role, updater)
+
+        tasks = [asyncio.create_task(play(role, game_num)) for role, game_num in schedule]
+        try:
+            results = await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            # Cancelled from outside (or a game was): never turn that into an abort
+            for task in tasks:
+                task.cancel()
+            raise
+        except Exception as e:
+            # Don't leave sibling games running against the participant after a failure
+            for task in tasks:
+                task.cancel()
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+            if isinstance(e, CircuitOpenError) or self.messenger.pool.breaker_for(participant_url).is_open:
+                finished = [
+                    (entry, outcome) for entry, outcome in zip(schedule, outcomes)
+                    if not isinstance(outcome, BaseException)
+                ]
+                reason = str(e) if isinstance(e, CircuitOpenError) else f"{participant_url} stopped responding ({type(e).__name__}: {e})"
+                raise EvaluationAborted(
+                    reason,
+                    self.group_results(finished),
+                    total_games,
+                ) from e
+            raise
+
+        return self.group_results(zip(schedule, results))
+
+    def group_results(self, played) -> Dict[Role, List[Dict[str, Any]]]:
+        """Group ((role, game_num), analytics) pairs by role, keeping game order."""
+        all_game_results: Dict[Role, List[Dict[str, Any]]] = {
+            role: [] for role in ROLES_TO_EVALUATE
+        }
+        for (role, _), game_analytics in played:
+            all_game_results[role].append(game_analytics)
+
+        return all_game_results
 
     async def run_single_game(self, participant_url: str, participant_role: Role, updater: TaskUpdater) -> Dict[str, Any]:
-        """Run a single game and return the analytics."""
-        # Reset state for new game
-        self.messenger.reset()
-        self.game = Game([])
+        """Run a single, isolated game and return the analytics."""
+        messenger = Messenger(
+            pool=self.messenger.pool,
+            streaming=self.config.streaming,
+            stop_on_json=self.config.stop_on_json,
+            policy=CallPolicy(max_retries=self.config.max_call_retries, hedge=self.config.hedge_requests),
+        )
+        game = Game([], messenger=messenger, config=self.config)
 
-        self.init_game(participant_url, participant_role)
-        self.game.updater = updater
+        self.init_game(game, messenger, participant_url, participant_role)
+        game.updater = updater
 
         # Store participant ID before game starts (they may be eliminated during the game)
-        participant_id = self.get_participant_id_by_url(participant_url)
-
-        game_over = False
-        while game_over == False:
-            await self.game.run_night_phase()
-            await self.game.run_bidding_phase()
-            await self.game.run_debate_phase()
-            await self.game.run_voting_phase()
-            await self.game.run_round_end_phase()
+        participant_id = self.get_participant_id_by_url(game, participant_url)
 
-            if self.game.current_phase == Phase.GAME_END:
-                game_over = True
+        # The game's budget also counts against whatever is left of the evaluation's
+        deadline = Deadline(self.config.game_time_budget, parent=current_deadline())
+        try:
+            with deadline.activate():
+                while game.current_phase != Phase.GAME_END:
+                    await game.run_round()
+        except DeadlineExceeded:
+            await game.log(f"[Game] Time budget ran out in round {game.state.current_round}, ending the game")
+            game.state.declare_timeout()
+            game.current_phase = Phase.GAME_END
 
-        analytics = await self.game.run_game_end_phase()
+        analytics = await game.run_game_end_phase()
 
         # Add participant-specific info to analytics
         if participant_id:
             analytics["participant_id"] = participant_id
             analytics["participant_role"] = participant_role.name
             analytics["participant_score"] = analytics.get("scores", {}).get(participant_id, 0)
-            # Check if participant survived by seeing if they're still in the final round's participants
-            final_round = self.game.state.current_round
-            final_participants = self.game.state.participants.get(final_round, [])
-            analytics["participant_survived"] = any(p.id == participant_id for p in final_participants)
+            analytics["participant_survived"] = game.state.is_alive(participant_id)
+
+        analytics["calls"] = messenger.call_stats()
 
         return analytics
 
-    def get_participant_id_by_url(self, url: str) -> str | None:
+    def get_participant_id_by_url(self, game: Game, url: str) -> str | None:
         """Find the participant ID for the given URL from round 1."""
-        round_1_participants = self.game.state.participants.get(1, [])
+        round_1_participants = game.state.participants.get(1, [])
         for p in round_1_participants:
             if hasattr(p, 'url') and p.url == url:
                 return p.id
@@ -164,6 +271,7 @@ class GreenAgent:
                 "games_played": len(games),
                 "wins": 0,
                 "losses": 0,
+                "timeouts": 0,
                 "survival_rate": 0,
                 "avg_score": 0,
                 "avg_rounds": 0,
@@ -185,7 +293,10 @@ class GreenAgent:
                 else:  # VILLAGER or SEER
                     won = winner == "villagers"
 
-                if won:
+                # A game cut short by its time budget is neither a win nor a loss
+                if game.get("timed_out"):
+                    role_stats["timeouts"] += 1
+                elif won:
                     role_stats["wins"] += 1
                 else:
                     role_stats["losses"] += 1
@@ -214,10 +325,19 @@ class GreenAgent:
 
     def render_aggregate_summary(self, analytics: Dict[str, Any]) -> str:
         """Render a human-readable summary of aggregate analytics."""
+        aborted = analytics.get("aborted")
         lines = [
             "=" * 60,
-            "WEREWOLF ARENA - EVALUATION COMPLETE",
+            "WEREWOLF ARENA - EVALUATION ABORTED" if aborted else "WEREWOLF ARENA - EVALUATION COMPLETE",
             "=" * 60,
+        ]
+        if aborted:
+            lines.extend([
+                f"Reason: {aborted['reason']}",
+                f"Partial result: {aborted['games_completed']} of {aborted['games_planned']} games completed",
+                "",
+            ])
+        lines += [
             f"Total Games Played: {analytics['total_games']}",
             f"Games Per Role: {analytics['games_per_role']}",
             f"Overall Win Rate: {analytics['overall_win_rate']:.1%}",
@@ -233,7 +353,7 @@ class GreenAgent:
                 "",
                 f"  {role_name}:",
                 f"    Games Played: {stats['games_played']}",
-                f"    Wins: {stats['wins']} | Losses: {stats['losses']}",
+                f"    Wins: {stats['wins']} | Losses: {stats['losses']} | Timeouts: {stats['timeouts']}",
                 f"    Win Rate: {stats['win_rate']:.1%}",
                 f"    Survival Rate: {stats['survival_rate']:.1%}",
                 f"    Avg Rounds per Game: {stats['avg_rounds']:.1f}",
@@ -248,11 +368,15 @@ class GreenAgent:
 
         return "\n".join(lines)
 
-    def init_game(self, participant_url: str, participant_role: Role):
+    def init_game(self, game: Game, messenger: Messenger, participant_url: str, participant_role: Role):
         """
         Takes one participant URL and their role, then creates LLM-based participants
         to fill out the rest of the game (3 villagers, 2 werewolves, 1 seer total)
 
+        :param game: The game to populate
+        :type game: Game
+        :param messenger: Messenger used by the game's participants
+        :type messenger: Messenger
         :param participant_url: URL of the real participant agent
         :type participant_url: str
         :param participant_role: Role assigned to the real participant
@@ -276,8 +400,8 @@ class GreenAgent:
             url=participant_url,
             role=participant_role,
             use_llm=False,
-            game_data=self.game.state,
-            messenger=self.messenger
+            game_data=game.state,
+            messenger=messenger
         )
         all_participants.append(real_participant)
 
@@ -297,9 +421,9 @@ class GreenAgent:
                     id=str(uuid4()),
                     role=role,
                     use_llm=True,
-                    game_data=self.game.state,
-                    messenger=self.messenger,
-                    llm=LLM()
+                    game_data=game.state,
+                    messenger=messenger,
+                    llm=self.llm
                 )
                 all_participants.append(llm_participant)
 
@@ -309,17 +433,22 @@ class GreenAgent:
                 elif role == Role.SEER:
                     seer = llm_participant
 
-        # Store participants by round number (round 1 initially)
-        self.game.state.participants[1] = all_participants
+        # Register everyone as alive in round 1 (handles follow this order)
+        game.state.register_participants(all_participants)
 
-        # Assign special role references (use first werewolf for night kill decisions)
-        self.game.state.werewolf = werewolves[0] if werewolves else None
-        self.game.state.seer = seer
+        # Assign special role references. Every living werewolf proposes a night kill;
+        # `werewolf` is only the first pack member, kept for backward compatibility
+        game.state.werewolves = werewolves
+        game.state.werewolf = werewolves[0] if werewolves else None
+        game.state.seer = seer
 
         # Set random speaking order for round 1
         shuffled_participants = all_participants.copy()
         random.shuffle(shuffled_participants)
-        self.game.state.speaking_order[1] = [p.id for p in shuffled_participants]
+        game.state.speaking_order[1] = [p.id for p in shuffled_participants]
+
+        # Prompts refer to players as P1..Pn; numbering follows the shuffled order so it says nothing about roles
+        game.state.aliases.assign(game.state.speaking_order[1])
     
     def validate_request(self, request: EvalRequest) -> tuple[bool, str]:
       if not request.participants:
@@ -0,0 +1,94 @@
+import asyncio
+import random
+from collections import deque
+from typing import Awaitable, Callable
+
+import httpx
+from a2a.client.errors import A2AClientHTTPError, A2AClientTimeoutError
+
+# HTTP statuses worth another attempt: request timeout, rate limiting, server errors
+RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+# Recent call durations kept per URL to estimate the hedge delay
+DEFAULT_LATENCY_WINDOW = 200
+
+
+# Failures that are always worth another attempt; A2AClientHTTPError depends on its status
+RETRYABLE_ERRORS = (httpx.TransportError, A2AClientTimeoutError, asyncio.TimeoutError)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Transport failures, timeouts and transient HTTP statuses; anything else is final."""
+    if isinstance(error, RETRYABLE_ERRORS):
+        return True
+    if isinstance(error, A2AClientHTTPError):
+        return error.status_code in RETRYABLE_STATUS
+    return False
+
+
+class LatencyWindow:
+    """Rolling window of recent successful call durations for one URL."""
+
+    def __init__(self, size: int = DEFAULT_LATENCY_WINDOW):
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+
+    def quantile(self, fraction: float) -> float | None:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class CallPolicy:
+    """
+    Retry and hedging rules for participant calls.
+
+    Retryable failures are retried up to max_retries times, sleeping a random
+    "full jitter" delay in [0, min(max_delay, base_delay * 2**attempt)] between
+    attempts so games hitting the same agent don't retry in lockstep.
+
+    With hedge enabled, a call still running after the URL's hedge_quantile
+    latency (once min_hedge_samples calls have been seen) gets a duplicate
+    request, and whichever reply arrives first is used.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 0,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        hedge: bool = False,
+        hedge_quantile: float = 0.95,
+        min_hedge_samples: int = 20,
+        rng: Callable[[], float] = random.random,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.min_hedge_samples = min_hedge_samples
+        self._rng = rng
+        self._sleep = sleep
+
+    def backoff(self, attempt: int) -> float:
+        """Jittered delay before retry number attempt + 1."""
+        return self._rng() * min(self.max_delay, self.base_delay * 2 ** attempt)
+
+    async def wait_before_retry(self, attempt: int) -> float:
+        delay = self.backoff(attempt)
+        await self._sleep(delay)
+        return delay
+
+    def hedge_delay(self, latency: LatencyWindow | None) -> float | None:
+        """Seconds to wait before hedging, or None if this call should not be hedged."""
+        if not self.hedge or latency is None or len(latency) < self.min_hedge_samples:
+            return None
+        return latency.quantile(self.hedge_quantile)
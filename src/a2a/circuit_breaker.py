@@ -0,0 +1,107 @@
+import time
+from enum import Enum
+from typing import Callable
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an agent whose circuit breaker is open."""
+
+    def __init__(self, url: str):
+        self.url = url
+        super().__init__(f"{url} is unavailable (circuit open after repeated failures)")
+
+
+class CircuitBreaker:
+    """
+    Failure tracker for one participant URL.
+
+    Closed: calls go through. After failure_threshold consecutive failures the
+    breaker opens and calls fail fast with CircuitOpenError. Once reset_timeout
+    seconds have passed it half-opens and lets a single probe call through: a
+    success closes it again, a failure re-opens it for another reset_timeout.
+
+    Callers pass probe=True when recording the outcome of the call that allow()
+    let through while half-open. Outcomes of calls that started before the
+    breaker opened arrive late and are ignored; they say nothing about recovery.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.times_opened = 0
+        self.rejected = 0
+        self._clock = clock
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == CircuitState.OPEN
+
+    @property
+    def is_half_open(self) -> bool:
+        return self.state == CircuitState.HALF_OPEN
+
+    def allow(self) -> bool:
+        """Whether a call may go out now. Counts a rejection if not."""
+        if self.state == CircuitState.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self.state = CircuitState.HALF_OPEN
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self, probe: bool = False):
+        if probe and self.state == CircuitState.HALF_OPEN:
+            self.state = CircuitState.CLOSED
+            self._probe_in_flight = False
+        if self.state == CircuitState.CLOSED:
+            self.consecutive_failures = 0
+
+    def record_failure(self, probe: bool = False):
+        if probe and self.state == CircuitState.HALF_OPEN:
+            self.consecutive_failures += 1
+            self._open()
+        elif self.state == CircuitState.CLOSED:
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= self.failure_threshold:
+                self._open()
+
+    def record_cancelled(self, probe: bool = False):
+        """A call was abandoned before finishing; free the probe slot without judging the agent."""
+        if probe:
+            self._probe_in_flight = False
+
+    def _open(self):
+        if self.state != CircuitState.OPEN:
+            self.times_opened += 1
+        self.state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._probe_in_flight = False
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,115 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Callable
+
+DEFAULT_INITIAL_LIMIT = 4
+DEFAULT_MAX_LIMIT = 64
+
+
+class AdaptiveLimiter:
+    """
+    AIMD cap on concurrent calls to one agent endpoint.
+
+    Every successful call that kept latency within latency_tolerance times the
+    baseline (a moving average of recent latencies) raises the limit by
+    1/limit, so about +1 per limit's worth of calls (additive increase). A
+    failed call, or one slower than that, multiplies the limit by
+    backoff_ratio (multiplicative decrease). Calls that started before the
+    last decrease don't trigger another, so one slow burst counts once. The
+    limit only grows while at least half of it is in use.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = 1,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        latency_tolerance: float = 2.0,
+        backoff_ratio: float = 0.75,
+        smoothing: float = 0.1,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+        self.smoothing = smoothing
+        self.baseline: float | None = None
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.increases = 0
+        self.decreases = 0
+        self._clock = clock
+        self._started = 0
+        self._last_decrease = 0
+        self._condition: asyncio.Condition | None = None
+
+    @property
+    def current_limit(self) -> int:
+        return max(self.min_limit, int(self.limit))
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one of the allowed in-flight slots for the duration of a call."""
+        ticket = await self._acquire()
+        started = self._clock()
+        try:
+            yield
+        except asyncio.CancelledError:
+            await self._release()
+            raise
+        except Exception:
+            self._on_error(ticket)
+            await self._release()
+            raise
+        self._on_success(ticket, self._clock() - started)
+        await self._release()
+
+    async def _acquire(self) -> int:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.current_limit)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            self._started += 1
+            return self._started
+
+    async def _release(self):
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def _on_success(self, ticket: int, latency: float):
+        if self.baseline is not None and latency > self.baseline * self.latency_tolerance:
+            self._decrease(ticket)
+        elif self.in_flight >= self.limit / 2 and self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self.increases += 1
+        # The baseline keeps moving so a lasting change in the agent's speed is absorbed
+        if self.baseline is None:
+            self.baseline = latency
+        else:
+            self.baseline += self.smoothing * (latency - self.baseline)
+
+    def _on_error(self, ticket: int):
+        self._decrease(ticket)
+
+    def _decrease(self, ticket: int):
+        if ticket <= self._last_decrease:
+            return
+        self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+        self._last_decrease = self._started
+        self.decreases += 1
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.current_limit,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "baseline_latency_s": self.baseline,
+        }
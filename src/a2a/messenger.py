@@ -1,9 +1,15 @@
+import asyncio
 import json
+import time
+from collections import Counter
+from typing import Callable
 from uuid import uuid4
 
 import httpx
 from a2a.client import (
     A2ACardResolver,
+    Client,
+    ClientCallContext,
     ClientConfig,
     ClientFactory,
     Consumer,
@@ -12,13 +18,37 @@ from a2a.types import (
     Message,
     Part,
     Role,
+    TaskArtifactUpdateEvent,
+    TaskStatusUpdateEvent,
     TextPart,
     DataPart,
 )
 
+from src.a2a.call_policy import CallPolicy, LatencyWindow, is_retryable
+from src.a2a.concurrency import AdaptiveLimiter
+from src.a2a.circuit_breaker import (
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_RESET_TIMEOUT,
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+from src.services.deadline import current_deadline, within_deadline
+from src.services.json_extract import extract_json_object
+
 
 DEFAULT_TIMEOUT = 300
 
+# Keep-alive limits for the pooled per-target HTTP clients
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=60,
+)
+
+# How long a fetched agent card (and the A2A client built from it) stays valid
+DEFAULT_CARD_TTL = 600
+
 
 def create_message(
     *, role: Role = Role.user, text: str, context_id: str | None = None
@@ -49,52 +79,409 @@ async def send_message(
     streaming: bool = False,
     timeout: int = DEFAULT_TIMEOUT,
     consumer: Consumer | None = None,
+    httpx_client: httpx.AsyncClient | None = None,
 ):
-    """Returns dict with context_id, response and status (if exists)"""
-    async with httpx.AsyncClient(timeout=timeout) as httpx_client:
-        resolver = A2ACardResolver(httpx_client=httpx_client, base_url=base_url)
-        agent_card = await resolver.get_agent_card()
-        config = ClientConfig(
-            httpx_client=httpx_client,
-            streaming=streaming,
-        )
-        factory = ClientFactory(config)
-        client = factory.create(agent_card)
-        if consumer:
-            await client.add_event_consumer(consumer)
-
-        outbound_msg = create_message(text=message, context_id=context_id)
-        last_event = None
-        outputs = {"response": "", "context_id": None}
-
-        # if streaming == False, only one event is generated
-        async for event in client.send_message(outbound_msg):
-            last_event = event
-
-        match last_event:
-            case Message() as msg:
-                outputs["context_id"] = msg.context_id
+    """Returns dict with context_id, response and status (if exists)
+
+    If httpx_client is given it is used as-is and left open, so callers can reuse
+    its keep-alive connections across messages. Otherwise a throwaway client is
+    created and closed for this single message.
+    """
+    if httpx_client is None:
+        async with httpx.AsyncClient(timeout=timeout) as httpx_client:
+            return await send_message(
+                message=message,
+                base_url=base_url,
+                context_id=context_id,
+                streaming=streaming,
+                timeout=timeout,
+                consumer=consumer,
+                httpx_client=httpx_client,
+            )
+
+    client = await create_client(httpx_client, base_url, streaming, timeout)
+    if consumer:
+        await client.add_event_consumer(consumer)
+    return await send_with_client(client, message, context_id, timeout)
+
+
+async def create_client(
+    httpx_client: httpx.AsyncClient,
+    base_url: str,
+    streaming: bool = False,
+    timeout: int = DEFAULT_TIMEOUT,
+) -> Client:
+    """Fetch the agent card for base_url and build an A2A client on top of httpx_client."""
+    resolver = A2ACardResolver(httpx_client=httpx_client, base_url=base_url)
+    agent_card = await resolver.get_agent_card(http_kwargs={"timeout": timeout})
+    config = ClientConfig(
+        httpx_client=httpx_client,
+        streaming=streaming,
+    )
+    factory = ClientFactory(config)
+    return factory.create(agent_card)
+
+
+async def send_with_client(
+    client: Client,
+    message: str,
+    context_id: str | None = None,
+    timeout: int = DEFAULT_TIMEOUT,
+):
+    """Send one message through an existing A2A client. Same return shape as send_message."""
+    outbound_msg = create_message(text=message, context_id=context_id)
+    call_context = ClientCallContext(state={"http_kwargs": {"timeout": timeout}})
+    last_event = None
+    outputs = {"response": "", "context_id": None}
+
+    # if streaming == False, only one event is generated
+    async for event in client.send_message(outbound_msg, context=call_context):
+        last_event = event
+
+    match last_event:
+        case Message() as msg:
+            outputs["context_id"] = msg.context_id
+            outputs["response"] += merge_parts(msg.parts)
+
+        case (task, update):
+            outputs["context_id"] = task.context_id
+            outputs["status"] = task.status.state.value
+            msg = task.status.message
+            if msg:
                 outputs["response"] += merge_parts(msg.parts)
+            if task.artifacts:
+                for artifact in task.artifacts:
+                    outputs["response"] += merge_parts(artifact.parts)
 
-            case (task, update):
-                outputs["context_id"] = task.context_id
-                outputs["status"] = task.status.state.value
-                msg = task.status.message
-                if msg:
-                    outputs["response"] += merge_parts(msg.parts)
-                if task.artifacts:
-                    for artifact in task.artifacts:
-                        outputs["response"] += merge_parts(artifact.parts)
+        case _:
+            pass
 
-            case _:
-                pass
+    return outputs
 
-        return outputs
 
+class ResponseAssembler:
+    """
+    Builds an agent's reply from streamed A2A events as they arrive.
+
+    Artifact chunks sent with append=True are concatenated as-is (streamed
+    fragments can split a JSON token, so they are not newline-joined the way
+    merge_parts joins whole parts). The reply is the status message text followed
+    by each artifact's text, the same order send_with_client uses.
+    """
 
-class Messenger:
     def __init__(self):
+        self.context_id: str | None = None
+        self.status: str | None = None
+        self._status_text = ""
+        self._artifacts: dict[str, list[str]] = {}
+
+    def add(self, event) -> str:
+        """Apply one client event and return the text it added."""
+        match event:
+            case Message() as msg:
+                self.context_id = msg.context_id
+                self._status_text = merge_parts(msg.parts)
+                return self._status_text
+
+            case (task, TaskArtifactUpdateEvent() as update):
+                self._track(task)
+                chunk = merge_parts(update.artifact.parts)
+                chunks = self._artifacts.setdefault(update.artifact.artifact_id, [])
+                if not update.append:
+                    chunks.clear()
+                chunks.append(chunk)
+                return chunk
+
+            case (task, TaskStatusUpdateEvent() as update):
+                self._track(task)
+                if update.status.message:
+                    self._status_text = merge_parts(update.status.message.parts)
+                    return self._status_text
+                return ""
+
+            case (task, None):
+                # Task snapshot (first or final event): pick up anything not streamed
+                self._track(task)
+                added = ""
+                if task.status.message and not self._status_text:
+                    self._status_text = added = merge_parts(task.status.message.parts)
+                for artifact in task.artifacts or []:
+                    if artifact.artifact_id not in self._artifacts:
+                        text = merge_parts(artifact.parts)
+                        self._artifacts[artifact.artifact_id] = [text]
+                        added += text
+                return added
+
+        return ""
+
+    def _track(self, task):
+        self.context_id = task.context_id
+        self.status = task.status.state.value
+
+    @property
+    def text(self) -> str:
+        return self._status_text + "".join("".join(chunks) for chunks in self._artifacts.values())
+
+
+def has_complete_json(text: str) -> bool:
+    try:
+        extract_json_object(text)
+    except ValueError:
+        return False
+    return True
+
+
+async def stream_with_client(
+    client: Client,
+    message: str,
+    context_id: str | None = None,
+    timeout: int = DEFAULT_TIMEOUT,
+    stop_on_json: bool = False,
+    clock: Callable[[], float] = time.perf_counter,
+):
+    """
+    Send one message through a streaming A2A client, assembling the reply as it arrives.
+
+    With stop_on_json the stream is closed as soon as the text holds a complete
+    JSON object, without waiting for the task to finish. Besides the send_message
+    keys, the result holds first_chunk_s/last_chunk_s (seconds from sending to the
+    first/last text chunk), chunks and stopped_early.
+    """
+    outbound_msg = create_message(text=message, context_id=context_id)
+    call_context = ClientCallContext(state={"http_kwargs": {"timeout": timeout}})
+    assembler = ResponseAssembler()
+    started = clock()
+    first_chunk = last_chunk = None
+    chunks = 0
+    stopped_early = False
+
+    stream = client.send_message(outbound_msg, context=call_context)
+    try:
+        async for event in stream:
+            chunk = assembler.add(event)
+            if not chunk:
+                continue
+            last_chunk = clock() - started
+            if first_chunk is None:
+                first_chunk = last_chunk
+            chunks += 1
+            # An object can only have closed in a chunk that contains a closing brace
+            if stop_on_json and "}" in chunk and has_complete_json(assembler.text):
+                stopped_early = True
+                break
+    finally:
+        await stream.aclose()
+
+    outputs = {
+        "response": assembler.text,
+        "context_id": assembler.context_id,
+        "first_chunk_s": first_chunk,
+        "last_chunk_s": last_chunk,
+        "chunks": chunks,
+        "stopped_early": stopped_early,
+    }
+    if assembler.status is not None:
+        outputs["status"] = assembler.status
+    return outputs
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float | None:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+class AgentClientCache:
+    """
+    TTL cache of A2A clients (and therefore agent cards) keyed by participant URL.
+
+    Entries expire after ttl seconds and can be dropped explicitly with invalidate(),
+    which the Messenger does whenever a call to that URL fails.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_CARD_TTL, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._clock = clock
+        self._entries: dict[tuple[str, bool], tuple[float, Client]] = {}
+        self._locks: dict[tuple[str, bool], asyncio.Lock] = {}
+
+    async def get(
+        self,
+        httpx_client: httpx.AsyncClient,
+        base_url: str,
+        streaming: bool = False,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> Client:
+        key = (base_url, streaming)
+        client = self._lookup(key)
+        if client is not None:
+            self.hits += 1
+            return client
+
+        # Serialize misses per URL so concurrent callers share one card fetch
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            client = self._lookup(key)
+            if client is not None:
+                self.hits += 1
+                return client
+            self.misses += 1
+            client = await create_client(httpx_client, base_url, streaming, timeout)
+            self._entries[key] = (self._clock() + self.ttl, client)
+            return client
+
+    def _lookup(self, key: tuple[str, bool]) -> Client | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, client = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            return None
+        return client
+
+    def invalidate(self, base_url: str):
+        """Drop every cached client for base_url so the next call refetches the card."""
+        for key in [k for k in self._entries if k[0] == base_url]:
+            del self._entries[key]
+            self.invalidations += 1
+
+    def clear(self):
+        self._entries = {}
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "cached": len(self._entries),
+        }
+
+
+class ConnectionPool:
+    """
+    Long-lived keep-alive HTTP clients, one per target agent URL.
+
+    A single pool is meant to live for a whole evaluation and be shared by every
+    Messenger (and therefore every phase) talking to the same participants, so
+    TCP/TLS handshakes are paid once per connection instead of once per prompt.
+    Agent cards and the A2A clients built from them are cached alongside, as is
+    a circuit breaker per URL so every game sees the same agent health.
+    """
+
+    def __init__(
+        self,
+        limits: httpx.Limits | None = None,
+        card_ttl: float = DEFAULT_CARD_TTL,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        adaptive_concurrency: bool = False,
+    ):
+        self.limits = limits or DEFAULT_POOL_LIMITS
+        self.clients = AgentClientCache(ttl=card_ttl)
+        self._http_clients: dict[str, httpx.AsyncClient] = {}
+        # Call durations per URL, shared by every game so hedge delays warm up quickly
+        self._latency: dict[str, LatencyWindow] = {}
+        # Settings for breakers created from now on
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.breakers: dict[str, CircuitBreaker] = {}
+        # Per-URL AIMD caps on in-flight calls; off unless adaptive_concurrency is set
+        self.adaptive_concurrency = adaptive_concurrency
+        self.limiters: dict[str, AdaptiveLimiter] = {}
+
+    def get_http_client(self, base_url: str) -> httpx.AsyncClient:
+        http_client = self._http_clients.get(base_url)
+        if http_client is None or http_client.is_closed:
+            # A recreated connection invalidates A2A clients bound to the old one
+            self.clients.invalidate(base_url)
+            http_client = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, limits=self.limits)
+            self._http_clients[base_url] = http_client
+        return http_client
+
+    async def get_client(
+        self,
+        base_url: str,
+        streaming: bool = False,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> Client:
+        """Return a cached A2A client for base_url, fetching the agent card on a miss."""
+        http_client = self.get_http_client(base_url)
+        return await self.clients.get(http_client, base_url, streaming, timeout)
+
+    def invalidate(self, base_url: str):
+        self.clients.invalidate(base_url)
+
+    def latency_for(self, base_url: str) -> LatencyWindow:
+        window = self._latency.get(base_url)
+        if window is None:
+            window = self._latency[base_url] = LatencyWindow()
+        return window
+
+    def breaker_for(self, base_url: str) -> CircuitBreaker:
+        breaker = self.breakers.get(base_url)
+        if breaker is None:
+            breaker = self.breakers[base_url] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return breaker
+
+    def breaker_stats(self) -> dict:
+        return {url: breaker.stats() for url, breaker in self.breakers.items()}
+
+    def limiter_for(self, base_url: str) -> AdaptiveLimiter | None:
+        if not self.adaptive_concurrency:
+            return None
+        limiter = self.limiters.get(base_url)
+        if limiter is None:
+            limiter = self.limiters[base_url] = AdaptiveLimiter()
+        return limiter
+
+    def limiter_stats(self) -> dict:
+        return {url: limiter.stats() for url, limiter in self.limiters.items()}
+
+    async def aclose(self):
+        self.clients.clear()
+        http_clients = list(self._http_clients.values())
+        self._http_clients = {}
+        for http_client in http_clients:
+            await http_client.aclose()
+
+
+class Messenger:
+    def __init__(
+        self,
+        pool: ConnectionPool | None = None,
+        limits: httpx.Limits | None = None,
+        card_ttl: float = DEFAULT_CARD_TTL,
+        streaming: bool = False,
+        stop_on_json: bool = False,
+        policy: CallPolicy | None = None,
+    ):
+        """
+        Args:
+            pool: Connection pool to share with other messengers. If omitted the
+                messenger creates (and owns) its own pool.
+            limits: Keep-alive/connection limits for an owned pool
+            card_ttl: Seconds an agent card stays cached in an owned pool
+            streaming: Request streamed replies and assemble them as they arrive
+            stop_on_json: When streaming, stop reading once a complete JSON object has arrived
+            policy: Retry/hedging rules; by default a failed call is not retried
+        """
         self._context_ids = {}
+        self._owns_pool = pool is None
+        self.pool = pool if pool is not None else ConnectionPool(limits, card_ttl)
+        self.streaming = streaming
+        self.stop_on_json = stop_on_json
+        self.policy = policy or CallPolicy()
+        # One entry per completed call: url, first/last chunk times, chunks, stopped_early
+        self.call_timings: list[dict] = []
+        # One entry per retry (url, attempt, error, delay_s) and per hedge (url, delay_s, won)
+        self.retries: list[dict] = []
+        self.hedges: list[dict] = []
 
     async def talk_to_agent(
         self,
@@ -110,7 +497,10 @@ class Messenger:
             message: The message to send to the agent
             url: The agent's URL endpoint
             new_conversation: If True, start fresh conversation; if False, continue existing conversation
-            timeout: Timeout in seconds for the request (default: 300)
+            timeout: Timeout in seconds for the request (default: 300). Inside a
+                game or evaluation time budget it is capped to the time left, and
+                the whole call, retries included, ends with DeadlineExceeded when
+                the budget runs out.
 
         Returns:
             str: The agent's response message
@@ -121,16 +511,165 @@ class Messenger:
         print(f"[Messenger] Message preview: {message[:200]}...")
         print(f"[Messenger] Context ID: {self._context_ids.get(url, None)}")
 
-        outputs = await send_message(
-            message=message,
-            base_url=url,
-            context_id=None if new_conversation else self._context_ids.get(url, None),
-            timeout=timeout,
-        )
-        if outputs.get("status", "completed") != "completed":
+        context_id = None if new_conversation else self._context_ids.get(url, None)
+        deadline = current_deadline()
+        if deadline is not None:
+            timeout = deadline.timeout(timeout)
+        async with within_deadline():
+            return await self._call_with_retries(message, url, context_id, timeout)
+
+    async def _call_with_retries(self, message: str, url: str, context_id: str | None, timeout: float) -> str:
+        """
+        Send with retries. The breaker judges the call as a whole: it counts one
+        failure when the last attempt fails, however many attempts that took.
+        """
+        breaker = self.pool.breaker_for(url)
+        if not breaker.allow():
+            raise CircuitOpenError(url)
+        probe = breaker.is_half_open
+        attempt = 0
+        try:
+            while True:
+                try:
+                    response = await self._send_hedged(url, lambda: self._send_once(message, url, context_id, timeout))
+                    break
+                except Exception as e:
+                    if attempt >= self.policy.max_retries or not is_retryable(e):
+                        raise
+                    delay = await self.policy.wait_before_retry(attempt)
+                    attempt += 1
+                    print(f"[Messenger] Retry {attempt}/{self.policy.max_retries} for {url} after {type(e).__name__}")
+                    self.retries.append({"url": url, "attempt": attempt, "error": type(e).__name__, "delay_s": delay})
+                    if breaker.is_open:
+                        # Other calls opened the breaker meanwhile; stop retrying against the agent
+                        raise CircuitOpenError(url) from e
+        except CircuitOpenError:
+            raise
+        except asyncio.CancelledError:
+            breaker.record_cancelled(probe)
+            raise
+        except Exception:
+            breaker.record_failure(probe)
+            raise
+        breaker.record_success(probe)
+        return response
+
+    async def _send_hedged(self, url: str, send):
+        """
+        Run send(); if it outlasts the hedge delay, race it against a duplicate.
+        Only a closed breaker hedges, so a half-open agent gets a single probe.
+        """
+        delay = self.policy.hedge_delay(self.pool.latency_for(url))
+        if delay is None or self.pool.breaker_for(url).state != CircuitState.CLOSED:
+            return await send()
+
+        primary = asyncio.ensure_future(send())
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+
+            hedge = asyncio.ensure_future(send())
+            record = {"url": url, "delay_s": delay, "won": False}
+            self.hedges.append(record)
+            pending.add(hedge)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        record["won"] = task is hedge
+                        return task.result()
+                    error = task.exception()
+            # Both copies failed; surface the last error
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send_once(self, message: str, url: str, context_id: str | None, timeout: int) -> str:
+        limiter = self.pool.limiter_for(url)
+        if limiter is None:
+            return await self._send_and_check(message, url, context_id, timeout)
+        async with limiter.slot():
+            return await self._send_and_check(message, url, context_id, timeout)
+
+    async def _send_and_check(self, message: str, url: str, context_id: str | None, timeout: int) -> str:
+        started = time.perf_counter()
+        try:
+            client = await self.pool.get_client(url, streaming=self.streaming, timeout=timeout)
+            if self.streaming:
+                outputs = await stream_with_client(
+                    client,
+                    message=message,
+                    context_id=context_id,
+                    timeout=timeout,
+                    stop_on_json=self.stop_on_json,
+                )
+            else:
+                outputs = await send_with_client(
+                    client,
+                    message=message,
+                    context_id=context_id,
+                    timeout=timeout,
+                )
+        except Exception:
+            # The card may be stale (agent redeployed, URL moved); refetch next time
+            self.pool.invalidate(url)
+            raise
+        # A stream closed early never sees the task complete
+        if not outputs.get("stopped_early") and outputs.get("status", "completed") != "completed":
+            self.pool.invalidate(url)
             raise RuntimeError(f"{url} responded with: {outputs}")
         self._context_ids[url] = outputs.get("context_id", None)
+        elapsed = time.perf_counter() - started
+        self.pool.latency_for(url).record(elapsed)
+        self.record_timing(url, outputs, elapsed)
         return outputs["response"]
 
+    def record_timing(self, url: str, outputs: dict, elapsed: float):
+        # Without streaming the whole reply arrives as one chunk
+        self.call_timings.append({
+            "url": url,
+            "first_chunk_s": outputs.get("first_chunk_s", elapsed),
+            "last_chunk_s": outputs.get("last_chunk_s", elapsed),
+            "chunks": outputs.get("chunks", 1),
+            "stopped_early": outputs.get("stopped_early", False),
+        })
+
+    def call_stats(self) -> dict:
+        """Time-to-first/last-chunk summary over this messenger's completed calls, plus its retries and hedges."""
+        timings = self.call_timings
+        first = sorted(t["first_chunk_s"] for t in timings if t["first_chunk_s"] is not None)
+        last = sorted(t["last_chunk_s"] for t in timings if t["last_chunk_s"] is not None)
+        return {
+            "calls": len(timings),
+            "streaming": self.streaming,
+            "stopped_early": sum(1 for t in timings if t["stopped_early"]),
+            "avg_first_chunk_s": sum(first) / len(first) if first else None,
+            "p95_first_chunk_s": percentile(first, 0.95),
+            "avg_last_chunk_s": sum(last) / len(last) if last else None,
+            "p95_last_chunk_s": percentile(last, 0.95),
+            "retries": len(self.retries),
+            "retry_errors": dict(Counter(r["error"] for r in self.retries)),
+            "hedges": len(self.hedges),
+            "hedge_wins": sum(1 for h in self.hedges if h["won"]),
+            # Every retry (url, attempt, error, delay_s) and hedge (url, delay_s, won), in order
+            "retry_log": [dict(r) for r in self.retries],
+            "hedge_log": [dict(h) for h in self.hedges],
+            # Current AIMD in-flight limit per agent this messenger talked to
+            "concurrency_limits": {
+                url: limiter.current_limit
+                for url in dict.fromkeys(t["url"] for t in timings)
+                if (limiter := self.pool.limiter_for(url)) is not None
+            },
+        }
+
     def reset(self):
-        self._context_ids = {}
\ No newline at end of file
+        self._context_ids = {}
+
+    async def close(self):
+        """Close pooled connections if this messenger owns its pool."""
+        if self._owns_pool:
+            await self.pool.aclose()
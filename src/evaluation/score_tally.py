@@ -0,0 +1,82 @@
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, Optional
+
+from src.models.Event import Event
+from src.models.Vote import Vote
+from src.models.enum.EventType import EventType
+
+if TYPE_CHECKING:
+    from src.game.GameData import GameData
+
+
+class ScoreTally:
+    """
+    Running totals behind the Scoring formulas, updated as votes and seer checks
+    are recorded so final scores are read in O(1) instead of rescanning the game.
+
+    Matches Scoring: werewolf/villager points depend on the votes cast against
+    any werewolf, the seer's on the round of the first investigation, and a
+    timed-out game earns no bonus for being short.
+    """
+
+    def __init__(self):
+        self.votes_cast = 0
+        self.votes_for: Counter = Counter()
+        self.first_investigation_round: Optional[int] = None
+
+    def record_vote(self, vote: Vote):
+        self.votes_cast += 1
+        self.votes_for[vote.voted_for_id] += 1
+
+    def record_event(self, round_num: int, event: Event):
+        if event.type == EventType.SEER_INVESTIGATION and self.first_investigation_round is None:
+            self.first_investigation_round = round_num
+
+    def votes_against_werewolves(self, game_state: "GameData") -> int:
+        return sum(self.votes_for[werewolf.id] for werewolf in game_state.get_werewolves())
+
+    def score_werewolf(self, game_state: "GameData") -> int:
+        if not game_state.get_werewolves():
+            return 0
+        score = game_state.current_round * 10
+        score += (self.votes_cast - self.votes_against_werewolves(game_state)) * 5
+        if game_state.winner == "werewolf":
+            score += 50
+        return score
+
+    def score_seer(self, game_state: "GameData") -> int:
+        if not game_state.seer:
+            return 0
+        revealed_round = self.first_investigation_round
+        if revealed_round:
+            # Penalty of 3, 6, 9, ... for every round after the reveal
+            rounds_after = max(0, game_state.current_round - revealed_round)
+            score = (10 - revealed_round) * 5 - 3 * rounds_after * (rounds_after + 1) // 2
+        elif game_state.timed_out:
+            score = 0
+        else:
+            score = (10 - game_state.current_round) * 5
+        return max(0, score)
+
+    def score_villager(self, game_state: "GameData") -> int:
+        if not game_state.get_werewolves():
+            return 0
+        score = self.votes_against_werewolves(game_state) * 10
+        if not game_state.timed_out:
+            score += (10 - game_state.current_round) * 3
+        if game_state.winner == "villagers":
+            score += 30
+        return score
+
+    def scores(self, game_state: "GameData") -> Dict[str, int]:
+        """Final score per player, keyed by player ID."""
+        scores = {}
+        werewolf_score = self.score_werewolf(game_state)
+        for werewolf in game_state.get_werewolves():
+            scores[werewolf.id] = werewolf_score
+        if game_state.seer:
+            scores[game_state.seer.id] = self.score_seer(game_state)
+        villager_score = self.score_villager(game_state)
+        for villager in game_state.villagers:
+            scores[villager.id] = villager_score
+        return scores
@@ -10,17 +10,18 @@ class Scoring(BaseModel):
         # Werewolf scores points the longer it lasts into the game
         # The werewolf also scores points for each agent it's able to convince it's not the werewolf
         # Scores bonus points of wins round
-        if not self.game_state.werewolf:
+        # Every werewolf in the pack shares the score; a vote for any of them counts against it
+        if not self.game_state.get_werewolves():
             return 0
         
         score = 0
-        werewolf_id = self.game_state.werewolf.id
+        werewolf_ids = {werewolf.id for werewolf in self.game_state.get_werewolves()}
         
         score += self.game_state.current_round * 10
         
         for round_num, votes in self.game_state.votes.items():
             for vote in votes:
-                if vote.voted_for_id != werewolf_id:
+                if vote.voted_for_id not in werewolf_ids:
                     score += 5
         
         if self.game_state.winner == "werewolf":
@@ -35,13 +36,7 @@ class Scoring(BaseModel):
             return 0
         
         score = 0
-        werewolf_revealed_round = None
-        
-        for round_num, events in self.game_state.events.items():
-            for event in events:
-                if event.type == EventType.SEER_INVESTIGATION:
-                    if werewolf_revealed_round is None:
-                        werewolf_revealed_round = round_num
+        werewolf_revealed_round = self.game_state.event_store.first_round(EventType.SEER_INVESTIGATION)
         
         if werewolf_revealed_round:
             score += (10 - werewolf_revealed_round) * 5
@@ -49,7 +44,8 @@ class Scoring(BaseModel):
             for round_num in range(werewolf_revealed_round + 1, self.game_state.current_round + 1):
                 penalty = (round_num - werewolf_revealed_round) * 3
                 score -= penalty
-        else:
+        elif not self.game_state.timed_out:
+            # A game cut short by its time budget earns no bonus for being short
             score += (10 - self.game_state.current_round) * 5
         
         return max(0, score)
@@ -57,18 +53,19 @@ class Scoring(BaseModel):
     def score_villager(self):
         # Scores points for correctly suspecting the werewolf
         # Bonus points for shorter rounds
-        if not self.game_state.werewolf:
+        if not self.game_state.get_werewolves():
             return 0
         
         score = 0
-        werewolf_id = self.game_state.werewolf.id
+        werewolf_ids = {werewolf.id for werewolf in self.game_state.get_werewolves()}
         
         for round_num, votes in self.game_state.votes.items():
             for vote in votes:
-                if vote.voted_for_id == werewolf_id:
+                if vote.voted_for_id in werewolf_ids:
                     score += 10
         
-        score += (10 - self.game_state.current_round) * 3
+        if not self.game_state.timed_out:
+            score += (10 - self.game_state.current_round) * 3
         
         if self.game_state.winner == "villagers":
             score += 30
@@ -0,0 +1,43 @@
+from typing import Dict, Iterable, Optional
+
+ALIAS_PREFIX = "P"
+
+
+class AliasRegistry:
+    """
+    Short per-game player aliases (P1..Pn) used in prompts instead of UUIDs.
+
+    Prompts only ever show aliases; replies are mapped back to real IDs with
+    resolve() before the phases see them.
+    """
+
+    def __init__(self):
+        self._by_id: Dict[str, str] = {}
+        self._by_alias: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def assign(self, player_ids: Iterable[str]):
+        """Give each player, in order, the next free alias."""
+        for player_id in player_ids:
+            self.alias(player_id)
+
+    def alias(self, player_id: str) -> str:
+        """Alias for a player, registering them on first use."""
+        alias = self._by_id.get(player_id)
+        if alias is None:
+            alias = f"{ALIAS_PREFIX}{len(self._by_id) + 1}"
+            self._by_id[player_id] = alias
+            self._by_alias[alias.upper()] = player_id
+        return alias
+
+    def resolve(self, value: Optional[str]) -> Optional[str]:
+        """Real ID for an alias (case-insensitive). Anything else is returned unchanged."""
+        if not isinstance(value, str):
+            return value
+        return self._by_alias.get(value.strip().upper(), value)
+
+    def to_dict(self) -> Dict[str, str]:
+        """alias -> real player ID"""
+        return {alias: player_id for player_id, alias in self._by_id.items()}
@@ -0,0 +1,75 @@
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.models.Event import Event
+from src.models.enum.EventType import EventType
+
+
+class EventStore:
+    """
+    Append-only log of game events with secondary indexes.
+
+    Every event is stored once with the round it happened in; indexes by
+    EventType, player, round and (round, EventType) hold positions into the log,
+    so queries touch only the matching events.
+    """
+
+    def __init__(self):
+        self._log: List[Tuple[int, Event]] = []
+        self._by_type: Dict[EventType, List[int]] = defaultdict(list)
+        self._by_player: Dict[str, List[int]] = defaultdict(list)
+        self._by_round: Dict[int, List[int]] = defaultdict(list)
+        self._by_round_type: Dict[Tuple[int, EventType], List[int]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self._log)
+
+    def __iter__(self) -> Iterator[Tuple[int, Event]]:
+        return iter(self._log)
+
+    def append(self, round_num: int, event: Event) -> int:
+        """Record an event and return its position in the log."""
+        position = len(self._log)
+        self._log.append((round_num, event))
+        self._by_type[event.type].append(position)
+        self._by_round[round_num].append(position)
+        self._by_round_type[(round_num, event.type)].append(position)
+        # An event concerns both the acting player and the eliminated one
+        for player_id in {event.player, event.eliminated_player} - {None}:
+            self._by_player[player_id].append(position)
+        return position
+
+    def _events(self, positions: List[int]) -> List[Event]:
+        return [self._log[position][1] for position in positions]
+
+    def of_type(self, event_type: EventType, round_num: Optional[int] = None) -> List[Event]:
+        """Events of a type, in order; limited to one round if round_num is given."""
+        if round_num is None:
+            return self._events(self._by_type.get(event_type, []))
+        return self._events(self._by_round_type.get((round_num, event_type), []))
+
+    def latest(self, event_type: EventType, round_num: Optional[int] = None) -> Optional[Event]:
+        """Most recent event of a type (in round_num, if given), or None."""
+        positions = (
+            self._by_type.get(event_type, [])
+            if round_num is None
+            else self._by_round_type.get((round_num, event_type), [])
+        )
+        return self._log[positions[-1]][1] if positions else None
+
+    def first_round(self, event_type: EventType) -> Optional[int]:
+        """Round of the first event of a type, or None if it never happened."""
+        positions = self._by_type.get(event_type)
+        return self._log[positions[0]][0] if positions else None
+
+    def by_player(self, player_id: str) -> List[Event]:
+        """Events where the player acted or was eliminated, in order."""
+        return self._events(self._by_player.get(player_id, []))
+
+    def in_round(self, round_num: int) -> List[Event]:
+        return self._events(self._by_round.get(round_num, []))
+
+    def count(self, event_type: EventType, round_num: Optional[int] = None) -> int:
+        if round_num is None:
+            return len(self._by_type.get(event_type, []))
+        return len(self._by_round_type.get((round_num, event_type), []))
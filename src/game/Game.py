@@ -4,8 +4,10 @@ from typing import List, Optional, Any
 from src.models.enum.EventType import EventType
 from src.models.enum.Phase import Phase
 from src.game.GameData import GameData
+from src.game.Transcript import Transcript
 from src.models.Event import Event
 from src.a2a.messenger import Messenger
+from src.models.EvalConfig import EvalConfig
 
 from a2a.types import TaskState
 from a2a.utils import new_agent_text_message
@@ -32,12 +34,19 @@ class Game(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
-    def __init__(self, participants: List[str], messenger: Optional[Messenger] = None):
+    def __init__(self, participants: List[str], messenger: Optional[Messenger] = None, config: Optional[EvalConfig] = None):
+        config = config or EvalConfig()
         super().__init__(
             current_phase=Phase.NIGHT,
             state=GameData(
                 current_round=1,
-                turns_to_speak_per_round=1
+                turns_to_speak_per_round=1,
+                sealed_bidding=config.sealed_bidding,
+                sealed_voting=config.sealed_voting,
+                action_timeout=config.action_timeout,
+                debate_mode=config.debate_mode,
+                prompt_style=config.prompt_style,
+                max_response_retries=config.max_response_retries
             ),
             messenger=messenger
         )
@@ -46,6 +55,7 @@ class Game(BaseModel):
         self.state.votes[1] = []
         self.state.bids[1] = []
         self.state.chat_history[1] = []
+        self.state.transcripts[1] = Transcript(render_id=self.state.alias_for)
         self.state.events[1] = []
 
         # Initialize phase controllers with game and messenger references
@@ -61,7 +71,7 @@ class Game(BaseModel):
        
     #Logs
     def log_event(self, round:int, event:Event):
-         self.state.events.setdefault(round, []).append(event)
+         self.state.record_event(round, event)
 
     async def log(self, message: str):
         """Log a message via the updater if available"""
@@ -72,19 +82,41 @@ class Game(BaseModel):
          
     # Prompts
     def get_night_elimination_message(self, round_num:int):
-        round_events = self.state.events[round_num]
-        eliminated_player = [e.eliminated_player for e in round_events if e.type == EventType.WEREWOLF_ELIMINATION]
+        events = self.state.event_store.of_type(EventType.WEREWOLF_ELIMINATION, round_num)
+        eliminated_player = [e.eliminated_player for e in events]
         
         return f"In the middle of the night, the werewolf eliminated player {eliminated_player}"
         
     def get_vote_elimination_message(self, round_num:int):
-        round_events = self.state.events[round_num]
-        eliminated_player = [e.eliminated_player for e in round_events if e.type == EventType.VILLAGE_ELIMINATION]
+        events = self.state.event_store.of_type(EventType.VILLAGE_ELIMINATION, round_num)
+        eliminated_player = [e.eliminated_player for e in events]
         
         return f"You all voted to eliminate player {eliminated_player}. They are not the werewolf."
         
         
     # Execute Phases
+    async def run_round(self):
+        """
+        Run one full round. If an elimination decides the game mid-round, the remaining
+        phases are skipped: the round's ROUND_END event is logged and the game moves
+        straight to GAME_END.
+        """
+        for run_phase in (
+            self.run_night_phase,
+            self.run_bidding_phase,
+            self.run_debate_phase,
+            self.run_voting_phase,
+            self.run_round_end_phase,
+        ):
+            await run_phase()
+            if self.current_phase == Phase.GAME_END:
+                return
+            if self.state.winner:
+                await self.log(f"[Game] {self.state.winner} win in round {self.state.current_round}, skipping to game end")
+                self.log_event(self.state.current_round, Event(type=EventType.ROUND_END))
+                self.current_phase = Phase.GAME_END
+                return
+
     async def run_night_phase(self):
         await self.log("Starting night phase...")
         await self.night_controller.run()
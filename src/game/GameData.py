@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, PrivateAttr
 from typing import Dict, List, Optional, TYPE_CHECKING, Any
 
 from src.models.enum.EliminationType import EliminationType
@@ -9,6 +9,15 @@ from src.models.Event import Event
 from src.models.Bid import Bid
 
 from src.models.enum.Role import Role
+from src.models.enum.DebateMode import DebateMode
+from src.models.enum.PromptStyle import PromptStyle
+from src.game.Transcript import Transcript
+from src.game.AliasRegistry import AliasRegistry
+from src.game.PlayerIndex import PlayerIndex
+from src.game.PlayerRegistry import PlayerRegistry
+from src.game.ParticipantsView import ParticipantsView
+from src.game.EventStore import EventStore
+from src.evaluation.score_tally import ScoreTally
 
 if TYPE_CHECKING:
     from src.models.Participant import Participant
@@ -18,19 +27,57 @@ class GameData(BaseModel):
 
     current_round: int
     winner: Optional[str] = None
+    timed_out: bool = False  # game cut short by its time budget; winner stays None
     turns_to_speak_per_round: int
-    participants: Dict[int, List[Any]] = {}  # List[Participant] at runtime
-    werewolf: Optional[Any] = None  # Participant at runtime
+    registry: PlayerRegistry = Field(default_factory=PlayerRegistry)  # handles, liveness, round membership
+    werewolf: Optional[Any] = None  # Participant at runtime (lead werewolf)
+    werewolves: List[Any] = []  # List[Participant] at runtime, lead werewolf first
     seer: Optional[Any] = None  # Participant at runtime
     villagers: List[Any] = []  # List[Participant] at runtime
     speaking_order: Dict[int, List[str]] = {}
     chat_history: Dict[int, List[Message]] = {}
+    transcripts: Dict[int, Transcript] = {}
+    aliases: AliasRegistry = Field(default_factory=AliasRegistry)
     bids: Dict[int, List[Bid]] = {}
     votes: Dict[int, List[Vote]] = {}
     eliminations: Dict[int, List[Elimination]] = {}
     events: Dict[int, List[Event]] = {}
+    event_store: EventStore = Field(default_factory=EventStore)  # indexed copy of every logged event
+    score_tally: ScoreTally = Field(default_factory=ScoreTally)  # running totals for the final scores
     seer_checks: List[tuple] = []
     latest_werewolf_kill: Optional[str] = None
+    sealed_bidding: bool = False
+    sealed_voting: bool = False
+    action_timeout: Optional[float] = None
+    debate_mode: DebateMode = DebateMode.SEQUENTIAL
+    prompt_style: PromptStyle = PromptStyle.VERBOSE
+    prompt_tokens: Dict[str, List[int]] = {}  # estimated tokens per call, by prompt name
+    max_response_retries: int = 2
+    response_repairs: Dict[str, Dict[str, int]] = {}  # corrective re-prompts and fallbacks, by action
+    _player_index: Optional[tuple] = PrivateAttr(default=None)  # (key, PlayerIndex)
+
+    @property
+    def participants(self) -> ParticipantsView:
+        """Read-only {round: living participants} view; use register_participants/eliminate_player to change it."""
+        return ParticipantsView(self.registry)
+
+    def register_participants(self, participants: List[Any]):
+        """Add participants to the game as living members of the current round."""
+        self.registry.register_all(participants, self.current_round)
+
+    def get_participant(self, player_id: str) -> Optional[Any]:
+        return self.registry.get(player_id)
+
+    def is_alive(self, player_id: str) -> bool:
+        return self.registry.is_alive(player_id)
+
+    def count_alive(self, *roles: Role) -> int:
+        """Living players with any of the given roles, or all living players."""
+        return self.registry.count_alive(*roles)
+
+    def get_werewolves(self) -> List[Any]:
+        """Every werewolf in the game, alive or not, lead first."""
+        return self.werewolves or ([self.werewolf] if self.werewolf else [])
 
     def set_status(self, status: str):  # assignment | player_actions | bidding | discussion | voting | end | reset
         pass
@@ -38,47 +85,93 @@ class GameData(BaseModel):
     def declare_winner(self, winner: str):
         self.winner = winner
 
+    def declare_timeout(self):
+        """End the game undecided because its time budget ran out."""
+        self.timed_out = True
+
     def place_bid(self, participant_id: str, bid_amount: int):
         pass
 
     def cast_vote(self, voter: str, voting_for: str, rationale: str):
-        vote = Vote(voter_id=voter, voted_for_id=voting_for, rationale=rationale)
-        if self.current_round not in self.votes:
-            self.votes[self.current_round] = []
-        self.votes[self.current_round].append(vote)
+        self.record_vote(Vote(voter_id=voter, voted_for_id=voting_for, rationale=rationale))
+
+    def record_vote(self, vote: Vote):
+        """Add a vote to the current round and the running score totals."""
+        self.votes.setdefault(self.current_round, []).append(vote)
+        self.score_tally.record_vote(vote)
+
+    def record_event(self, round_num: int, event: Event):
+        """Append an event to the round's list and the indexed event store."""
+        self.events.setdefault(round_num, []).append(event)
+        self.event_store.append(round_num, event)
+        self.score_tally.record_event(round_num, event)
+
+    def record_message(self, message: Message):
+        """Store a chat message for the current round and render it into the round transcript."""
+        transcript = self.get_transcript(self.current_round)
+        self.chat_history.setdefault(self.current_round, []).append(message)
+        transcript.append(message)
+
+    def get_transcript(self, round_num: int) -> Transcript:
+        """Return the round's transcript, catching up on messages stored without record_message."""
+        messages = self.chat_history.get(round_num, [])
+        transcript = self.transcripts.get(round_num)
+        if transcript is None:
+            transcript = Transcript(messages, render_id=self.alias_for)
+            self.transcripts[round_num] = transcript
+        elif len(transcript) < len(messages):
+            for message in messages[len(transcript):]:
+                transcript.append(message)
+        return transcript
+
+    def record_prompt_tokens(self, prompt_name: str, tokens: int):
+        self.prompt_tokens.setdefault(prompt_name, []).append(tokens)
+
+    def alias_for(self, player_id: str) -> str:
+        """The short alias prompts use for a player."""
+        return self.aliases.alias(player_id)
+
+    def resolve_alias(self, value: Optional[str]) -> Optional[str]:
+        """Map an alias from a reply back to the real player ID."""
+        return self.aliases.resolve(value)
+
+    def get_player_index(self) -> PlayerIndex:
+        """
+        Index for resolving player references in replies. Rebuilt only when the
+        round or its living players change.
+        """
+        key = (self.current_round, self.count_alive(), len(self.registry), len(self.aliases))
+        if self._player_index is None or self._player_index[0] != key:
+            aliases = self.aliases.to_dict()
+            roster = list(aliases.values()) + [p.id for p in self.registry.players]
+            self._player_index = (key, PlayerIndex(roster, aliases))
+        return self._player_index[1]
+
+    def record_response_repair(self, action: str, retries: int, fell_back: bool):
+        """Count corrective re-prompts for an action, and whether the fallback had to be used."""
+        stats = self.response_repairs.setdefault(action, {"retries": 0, "repaired": 0, "fallbacks": 0})
+        stats["retries"] += retries
+        stats["fallbacks" if fell_back else "repaired"] += 1
 
     def add_participant(self, participant_id: str, url: str):
         # Add participant to round 1's participant list
         participant = Participant(id=participant_id, url=url, role=Role.VILLAGER)
-        if 1 not in self.participants:
-            self.participants[1] = []
-        self.participants[1].append(participant)
+        self.registry.register(participant, 1)
 
     def assign_role_to_participant(self, participant_id: str, role: str):
-        # Find and update the participant in round 1 (initial setup)
-        if 1 in self.participants:
-            for participant in self.participants[1]:
-                if participant.id == participant_id:
-                    participant.role = getattr(Role, role.upper())
-                    break
+        self.registry.set_role(participant_id, getattr(Role, role.upper()))
 
     def eliminate_player(self, participant_id: str, elimination_type: EliminationType = EliminationType.VOTED_OUT):
         """
         Eliminate a player from the current round.
 
-        Removes the player from the current round's participant list and tracks the elimination.
+        Clears the player's alive bit (so they drop out of the current round's members) and tracks the elimination.
 
         Args:
             participant_id: The ID of the participant to eliminate
             elimination_type: Type of elimination (VOTED_OUT or NIGHT_KILL)
         """
-        current_participants = self.participants.get(self.current_round, [])
-
-        # Remove the participant from the current round's list
-        self.participants[self.current_round] = [
-            p for p in current_participants
-            if p.id != participant_id
-        ]
+        self.registry.eliminate(participant_id, self.current_round)
 
         # Add to eliminations tracking
         elimination = Elimination(
@@ -89,6 +182,32 @@ class GameData(BaseModel):
             self.eliminations[self.current_round] = []
         self.eliminations[self.current_round].append(elimination)
 
+        # Decide the game as soon as an elimination settles it, so the remaining
+        # phases of the round can be skipped
+        if self.winner is None:
+            winner = self.check_winner()
+            if winner:
+                self.declare_winner(winner)
+
+    def check_winner(self) -> Optional[str]:
+        """
+        Evaluate the win conditions against the current round's living players.
+
+        Returns "villagers" once every werewolf is gone, "werewolf" once the living
+        werewolves equal or outnumber the villagers (including the seer), otherwise None.
+        """
+        if not self.count_alive():
+            return None
+
+        werewolf_count = self.count_alive(Role.WEREWOLF)
+        villager_count = self.count_alive(Role.VILLAGER, Role.SEER)
+
+        if not werewolf_count:
+            return "villagers"
+        if villager_count <= werewolf_count:
+            return "werewolf"
+        return None
+
     def initialize_next_round(self):
         """
         Initialize the next round with current participants and reset round-specific data.
@@ -98,13 +217,13 @@ class GameData(BaseModel):
         """
         next_round = self.current_round + 1
 
-        # Copy current participants to next round (they're already filtered)
-        current_participants = self.participants.get(self.current_round, [])
-        self.participants[next_round] = current_participants.copy()
+        # The next round starts with everyone still alive
+        self.registry.start_round(next_round)
 
         # Initialize empty data structures for the new round
         # These will be populated during the respective phases
         self.chat_history[next_round] = []
+        self.transcripts[next_round] = Transcript(render_id=self.alias_for)
         self.bids[next_round] = []
         self.votes[next_round] = []
         self.events[next_round] = []
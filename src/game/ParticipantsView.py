@@ -0,0 +1,31 @@
+from collections.abc import Mapping
+from typing import Any, Iterator, Tuple
+
+from src.game.PlayerRegistry import PlayerRegistry
+
+
+class ParticipantsView(Mapping):
+    """
+    Read-only {round: participants} view over a PlayerRegistry.
+
+    Keeps the old GameData.participants dict-of-lists API for readers; each
+    round's members come back as a tuple in registration order.
+    """
+
+    def __init__(self, registry: PlayerRegistry):
+        self._registry = registry
+
+    def __getitem__(self, round_num: int) -> Tuple[Any, ...]:
+        return self._registry.members(round_num)
+
+    def __contains__(self, round_num: object) -> bool:
+        return self._registry.has_round(round_num)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._registry.rounds())
+
+    def __len__(self) -> int:
+        return len(self._registry.rounds())
+
+    def __repr__(self) -> str:
+        return f"ParticipantsView({dict(self)!r})"
@@ -0,0 +1,77 @@
+from typing import Dict, Iterable, List, Optional
+
+# Shortest prefix accepted as a player reference (logs show id[:8])
+MIN_PREFIX_LENGTH = 4
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, or limit + 1 as soon as it is known to exceed limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class PlayerIndex:
+    """
+    Resolves the player references agents send back to real player IDs.
+
+    Tries an exact ID or alias match first, then a unique prefix, then the single
+    closest ID by edit distance. Matching runs over the whole roster, so a
+    reference to an eliminated player resolves to that player (and fails the
+    phase's checks) instead of being bent into a living one.
+    """
+
+    def __init__(self, roster: Iterable[str], aliases: Optional[Dict[str, str]] = None):
+        self.roster: List[str] = list(dict.fromkeys(roster))
+        self._by_key: Dict[str, str] = {player_id.lower(): player_id for player_id in self.roster}
+        for alias, player_id in (aliases or {}).items():
+            self._by_key.setdefault(alias.lower(), player_id)
+
+    def resolve(self, reference: Optional[str]) -> Optional[str]:
+        """Real player ID for a reference, or None if nothing matches unambiguously."""
+        if not isinstance(reference, str):
+            return None
+        key = reference.strip().strip("\"'`").lower()
+        if not key:
+            return None
+
+        exact = self._by_key.get(key)
+        if exact is not None:
+            return exact
+
+        if len(key) >= MIN_PREFIX_LENGTH:
+            matches = [player_id for player_id in self.roster if player_id.lower().startswith(key)]
+            if len(matches) == 1:
+                return matches[0]
+            if matches:
+                return None
+
+        return self._closest(key)
+
+    def _closest(self, key: str) -> Optional[str]:
+        best = None
+        best_distance = None
+        tied = False
+        for player_id in self.roster:
+            # Allow roughly one typo per eight characters
+            limit = max(1, len(player_id) // 8)
+            distance = edit_distance(key, player_id.lower(), limit)
+            if distance > limit:
+                continue
+            if best_distance is None or distance < best_distance:
+                best, best_distance, tied = player_id, distance, False
+            elif distance == best_distance:
+                tied = True
+        return None if tied else best
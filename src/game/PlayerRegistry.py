@@ -0,0 +1,104 @@
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.models.enum.Role import Role
+
+
+class PlayerRegistry:
+    """
+    Every participant of a game, addressed by an integer handle.
+
+    Liveness is one int used as a bitset (bit h set = handle h alive), role
+    counts of living players are kept up to date, and each round's membership is
+    the alive bitset as of that round. Eliminating a player or starting a round
+    is O(1); lists of participants are only built when a round's members are read.
+    """
+
+    def __init__(self):
+        self._players: List[Any] = []  # Participant at runtime, indexed by handle
+        self._handles: Dict[str, int] = {}
+        self._alive = 0
+        self._alive_roles: Counter = Counter()
+        self._membership: Dict[int, int] = {}
+        # members() results by bitset; cleared whenever the roster changes
+        self._members_cache: Dict[int, Tuple[Any, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def register(self, participant: Any, round_num: int) -> int:
+        """Add a living participant to round_num and return their handle."""
+        handle = self._handles.get(participant.id)
+        if handle is None:
+            handle = len(self._players)
+            self._players.append(participant)
+            self._handles[participant.id] = handle
+            self._members_cache.clear()
+        if not self._alive >> handle & 1:
+            self._alive |= 1 << handle
+            self._alive_roles[participant.role] += 1
+        self._membership[round_num] = self._alive
+        return handle
+
+    def handle(self, player_id: str) -> Optional[int]:
+        return self._handles.get(player_id)
+
+    def get(self, player_id: str) -> Optional[Any]:
+        handle = self._handles.get(player_id)
+        return None if handle is None else self._players[handle]
+
+    @property
+    def players(self) -> Tuple[Any, ...]:
+        """Everyone registered, alive or not, in handle order."""
+        return tuple(self._players)
+
+    def is_alive(self, player_id: str) -> bool:
+        handle = self._handles.get(player_id)
+        return handle is not None and bool(self._alive >> handle & 1)
+
+    def count_alive(self, *roles: Role) -> int:
+        """Living players with any of the given roles, or all living players."""
+        if not roles:
+            return self._alive.bit_count()
+        return sum(self._alive_roles[role] for role in roles)
+
+    def eliminate(self, player_id: str, round_num: int) -> bool:
+        """Mark a player dead as of round_num. Returns False if they weren't alive."""
+        if not self.is_alive(player_id):
+            return False
+        handle = self._handles[player_id]
+        self._alive &= ~(1 << handle)
+        self._alive_roles[self._players[handle].role] -= 1
+        self._membership[round_num] = self._alive
+        return True
+
+    def set_role(self, player_id: str, role: Role):
+        participant = self.get(player_id)
+        if participant is None:
+            return
+        if self.is_alive(player_id):
+            self._alive_roles[participant.role] -= 1
+            self._alive_roles[role] += 1
+        participant.role = role
+
+    def start_round(self, round_num: int):
+        """Snapshot the living players as round_num's members."""
+        self._membership[round_num] = self._alive
+
+    def rounds(self) -> List[int]:
+        return sorted(self._membership)
+
+    def has_round(self, round_num: int) -> bool:
+        return round_num in self._membership
+
+    def members(self, round_num: int) -> Tuple[Any, ...]:
+        """Participants alive in round_num, in handle order. Raises KeyError for unknown rounds."""
+        mask = self._membership[round_num]
+        members = self._members_cache.get(mask)
+        if members is None:
+            members = tuple(p for handle, p in enumerate(self._players) if mask >> handle & 1)
+            self._members_cache[mask] = members
+        return members
+
+    def register_all(self, participants: Iterable[Any], round_num: int) -> List[int]:
+        return [self.register(participant, round_num) for participant in participants]
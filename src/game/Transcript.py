@@ -0,0 +1,48 @@
+from typing import Callable, Iterable, Optional
+
+from src.models.Message import Message
+
+
+class Transcript:
+    """
+    A round's chat transcript, rendered incrementally.
+
+    Each message is formatted once, when it is appended, into a line for each
+    layout the prompts use. The lines are joined on first read and the result is
+    cached until the next append, so prompt builders asking several times between
+    messages don't re-join the round, and appending never copies the text so far.
+    """
+
+    def __init__(self, messages: Iterable[Message] = (), render_id: Optional[Callable[[str], str]] = None):
+        # Maps a sender ID to how it is shown in prompts (e.g. its alias)
+        self._render_id = render_id or str
+        self._debate_lines: list[str] = []
+        self._vote_lines: list[str] = []
+        self._debate_text: Optional[str] = ""
+        self._vote_text: Optional[str] = ""
+        for message in messages:
+            self.append(message)
+
+    def __len__(self) -> int:
+        return len(self._debate_lines)
+
+    def append(self, message: Message):
+        sender = self._render_id(message.sender_id)
+        self._debate_lines.append(f"{sender}: {message.content}")
+        self._vote_lines.append(f"{sender} - {message.content}")
+        self._debate_text = None
+        self._vote_text = None
+
+    @property
+    def debate_text(self) -> str:
+        """Lines formatted as "<sender>: <content>"."""
+        if self._debate_text is None:
+            self._debate_text = "\n".join(self._debate_lines)
+        return self._debate_text
+
+    @property
+    def vote_text(self) -> str:
+        """Lines formatted as "<sender> - <content>"."""
+        if self._vote_text is None:
+            self._vote_text = "\n".join(self._vote_lines)
+        return self._vote_text
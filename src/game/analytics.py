@@ -4,6 +4,7 @@ from typing import Any, Dict
 from collections import defaultdict
 
 from src.game.GameData import GameData
+from src.game.AliasRegistry import AliasRegistry
 from src.models.enum.EliminationType import EliminationType
 
 
@@ -71,16 +72,35 @@ def compute_game_analytics(state: GameData) -> Dict[str, Any]:
             if getattr(e, "elimination_type", None) == EliminationType.NIGHT_KILL:
                 werewolf_kills += 1
 
+    # Estimated prompt tokens per call, by prompt
+    prompt_tokens = {}
+    for name, counts in (getattr(state, "prompt_tokens", {}) or {}).items():
+        if not counts:
+            continue
+        prompt_tokens[name] = {
+            "calls": len(counts),
+            "total": sum(counts),
+            "avg": sum(counts) / len(counts),
+            "max": max(counts),
+        }
+
+    aliases = getattr(state, "aliases", None)
+
     winner = getattr(state, "winner", None)
 
     return {
         "winner": winner,
+        "timed_out": bool(getattr(state, "timed_out", False)),
         "rounds_played": rounds_played,
         "avg_bid_per_agent": avg_bid_per_agent,
         "avg_words_per_agent": avg_words_per_agent,
         "seer_checks": seer_checks,
         "seer_found_werewolf": seer_found_werewolf,
         "werewolf_kills": werewolf_kills,
+        "prompt_tokens": prompt_tokens,
+        "prompt_tokens_total": sum(p["total"] for p in prompt_tokens.values()),
+        "response_repairs": {action: dict(stats) for action, stats in (getattr(state, "response_repairs", {}) or {}).items()},
+        "aliases": aliases.to_dict() if isinstance(aliases, AliasRegistry) else {},
     }
 
 
@@ -90,7 +110,7 @@ def render_summary_text(analytics: Dict[str, Any]) -> str:
     
     return (
         "Game complete.\n"
-        f"- Winner: {analytics.get('winner', 'unknown')}\n"
+        f"- Winner: {'none (time budget ran out)' if analytics.get('timed_out') else analytics.get('winner', 'unknown')}\n"
         f"- Rounds played: {analytics.get('rounds_played', '?')}\n"
         f"- Werewolf kills: {analytics.get('werewolf_kills', 0)}\n"
         f"- Seer found werewolf: {analytics.get('seer_found_werewolf', False)}\n"
@@ -1,5 +1,11 @@
-from pydantic import BaseModel
+from src.models.abstract.Record import Record
+
+class Bid(Record):
+    __slots__ = ("participant_id", "amount")
 
-class Bid(BaseModel):
     participant_id: str
-    amount: int
\ No newline at end of file
+    amount: int
+
+    def __init__(self, participant_id: str, amount: int):
+        self.participant_id = participant_id
+        self.amount = amount
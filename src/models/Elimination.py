@@ -1,6 +1,12 @@
-from pydantic import BaseModel
+from src.models.abstract.Record import Record
 from src.models.enum.EliminationType import EliminationType
 
-class Elimination(BaseModel):
+class Elimination(Record):
+    __slots__ = ("eliminated_participant", "elimination_type")
+
     eliminated_participant: str
-    elimination_type: EliminationType
\ No newline at end of file
+    elimination_type: EliminationType
+
+    def __init__(self, eliminated_participant: str, elimination_type: EliminationType):
+        self.eliminated_participant = eliminated_participant
+        self.elimination_type = elimination_type
@@ -0,0 +1,43 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from src.models.enum.DebateMode import DebateMode
+from src.models.enum.PromptStyle import PromptStyle
+
+class EvalConfig(BaseModel):
+    """Optional evaluation settings sent in EvalRequest.config."""
+    # Upper bound on how many games of the evaluation run at the same time
+    max_concurrent_games: int = Field(default=3, ge=1)
+    # Sealed phases prompt every player at once; nobody sees the others' bids/votes
+    sealed_bidding: bool = False
+    sealed_voting: bool = False
+    # Per-call timeout (seconds) for concurrent phase fan-out; None waits indefinitely
+    action_timeout: Optional[float] = Field(default=None, gt=0)
+    # "simultaneous" lets every player speak at once within each debate turn
+    debate_mode: DebateMode = DebateMode.SEQUENTIAL
+    # "compact" sends terse prompts; "verbose" keeps the full instructions
+    prompt_style: PromptStyle = PromptStyle.VERBOSE
+    # Corrective re-prompts allowed for an invalid reply before a default is used
+    max_response_retries: int = Field(default=2, ge=0)
+    # Ask participant agents for streamed replies; stop_on_json stops reading once
+    # a complete JSON object has arrived instead of waiting for the task to close
+    streaming: bool = False
+    stop_on_json: bool = False
+    # Retries (with jittered exponential backoff) for a participant call that fails
+    # with a transport error, timeout or 408/429/5xx status
+    max_call_retries: int = Field(default=2, ge=0)
+    # Send a duplicate request when a call outlasts the agent's p95 latency
+    hedge_requests: bool = False
+    # Consecutive failed calls that open a participant's circuit breaker, which
+    # ends the evaluation early with a partial result; and how long (seconds)
+    # before an open breaker lets a probe call through
+    breaker_failure_threshold: int = Field(default=5, ge=1)
+    breaker_reset_timeout: float = Field(default=30.0, gt=0)
+    # Cap in-flight calls per participant agent with an AIMD limit that grows
+    # while latency stays flat and shrinks on slow or failed calls
+    adaptive_concurrency: bool = False
+    # Wall-clock budgets in seconds for each game and for the whole evaluation;
+    # every participant call is limited to what is left. None means no limit
+    game_time_budget: Optional[float] = Field(default=None, gt=0)
+    evaluation_time_budget: Optional[float] = Field(default=None, gt=0)
@@ -1,5 +1,8 @@
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
+
+from src.models.EvalConfig import EvalConfig
 
 class EvalRequest(BaseModel):
     """Request format sent by the AgentBeats platform to green agents."""
-    participants: dict[str, HttpUrl]
\ No newline at end of file
+    participants: dict[str, HttpUrl]
+    config: EvalConfig = Field(default_factory=EvalConfig)
@@ -1,8 +1,41 @@
-from pydantic import BaseModel
+from typing import Any, Optional, Tuple
+from src.models.abstract.Record import Record
 from src.models.enum.EventType import EventType
 
-class Event(BaseModel):
-    type:EventType
-    eliminated_player: str = None
-    player: str = None
-    description:str = None
\ No newline at end of file
+class Event(Record):
+    """
+    A logged game event. When args are given, description is a str.format
+    template that is only rendered the first time it is read.
+    """
+    __slots__ = ("type", "eliminated_player", "player", "_description", "_args")
+
+    type: EventType
+    eliminated_player: Optional[str]
+    player: Optional[str]
+    description: Optional[str]
+
+    def __init__(
+        self,
+        type: EventType,
+        eliminated_player: Optional[str] = None,
+        player: Optional[str] = None,
+        description: Optional[str] = None,
+        args: Tuple[Any, ...] = (),
+    ):
+        self.type = type
+        self.eliminated_player = eliminated_player
+        self.player = player
+        self._description = description
+        self._args = args
+
+    @property
+    def description(self) -> Optional[str]:
+        if self._args:
+            self._description = self._description.format(*self._args)
+            self._args = ()
+        return self._description
+
+    @description.setter
+    def description(self, value: Optional[str]):
+        self._description = value
+        self._args = ()
@@ -1,8 +1,15 @@
 from typing import Optional
-from pydantic import BaseModel
+from src.models.abstract.Record import Record
 from src.models.enum.Phase import Phase
 
-class Message(BaseModel):
+class Message(Record):
+    __slots__ = ("sender_id", "content", "phase")
+
     sender_id: str
     content: str
-    phase: Optional[Phase] = None
\ No newline at end of file
+    phase: Optional[Phase]
+
+    def __init__(self, sender_id: str, content: str, phase: Optional[Phase] = None):
+        self.sender_id = sender_id
+        self.content = content
+        self.phase = phase
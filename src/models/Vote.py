@@ -1,6 +1,13 @@
-from pydantic import BaseModel
+from src.models.abstract.Record import Record
+
+class Vote(Record):
+    __slots__ = ("voter_id", "voted_for_id", "rationale")
 
-class Vote(BaseModel):
     voter_id:str
     voted_for_id:str
-    rationale:str
\ No newline at end of file
+    rationale:str
+
+    def __init__(self, voter_id: str, voted_for_id: str, rationale: str):
+        self.voter_id = voter_id
+        self.voted_for_id = voted_for_id
+        self.rationale = rationale
@@ -1,9 +1,18 @@
-from typing import TYPE_CHECKING
+import asyncio
+from typing import TYPE_CHECKING, Any, Collection, List, Optional, Sequence, Type
 from abc import ABC, abstractmethod
 
+from a2a.client.errors import A2AClientHTTPError
+from pydantic import ValidationError
+
+from src.prompts import render_correction
+from src.a2a.call_policy import RETRYABLE_ERRORS, is_retryable
+
 if TYPE_CHECKING:
     from src.game.Game import Game
     from src.a2a.messenger import Messenger
+    from src.models.Participant import Participant
+    from src.models.response.ActionResponse import ActionResponse
 
 class Phase(ABC):
 
@@ -13,4 +22,94 @@ class Phase(ABC):
 
     @abstractmethod
     async def run(self):
-        pass
\ No newline at end of file
+        pass
+
+    async def ask(
+        self,
+        participant: "Participant",
+        prompt: str,
+        response_model: Optional[Type["ActionResponse"]] = None,
+        valid_ids: Optional[Collection[str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[Any]:
+        """
+        Prompt a participant and validate the reply against response_model.
+
+        An unparseable or invalid reply gets a short corrective re-prompt, up to
+        max_response_retries times; after that the model's fallback is returned.
+        A call that exceeds timeout, or still fails with a transient error after
+        the messenger's retries, yields None; repeated failures open the agent's
+        circuit breaker and CircuitOpenError ends the game instead. Without a
+        response_model the parsed reply is returned as-is.
+        """
+        game_state = self.game.state
+        retries = 0
+        attempt_prompt = prompt
+        while True:
+            try:
+                reply = await asyncio.wait_for(participant.talk_to_agent(prompt=attempt_prompt), timeout)
+            except asyncio.TimeoutError:
+                await self.game.log(f"[{type(self).__name__}] {participant.id[:8]} timed out after {timeout}s")
+                return None
+            except ValueError:  # reply had no JSON object
+                error = "the reply was not a JSON object"
+            except (*RETRYABLE_ERRORS, A2AClientHTTPError) as e:
+                if not is_retryable(e):  # a 4xx other than 408/429 is a bug, not a missed turn
+                    raise
+                await self.game.log(f"[{type(self).__name__}] {participant.id[:8]} could not be reached ({type(e).__name__}), skipping")
+                return None
+            else:
+                if response_model is None:
+                    return reply
+                try:
+                    response = response_model.model_validate(
+                        reply,
+                        context={"valid_ids": valid_ids, "player_index": game_state.get_player_index()},
+                    )
+                    if retries:
+                        game_state.record_response_repair(response_model.action, retries, fell_back=False)
+                    return response
+                except ValidationError as e:
+                    error = describe_validation_error(e)
+
+            if response_model is None or retries >= game_state.max_response_retries:
+                break
+            retries += 1
+            await self.game.log(f"[{type(self).__name__}] {participant.id[:8]} sent an invalid reply ({error}), retry {retries}")
+            attempt_prompt = f"{prompt}\n\n{render_correction(error)}"
+
+        if response_model is None:
+            raise ValueError(f"Invalid reply from {participant.id}: {error}")
+        await self.game.log(f"[{type(self).__name__}] {participant.id[:8]} gave no valid reply, using the default")
+        game_state.record_response_repair(response_model.action, retries, fell_back=True)
+        return response_model.fallback()
+
+    async def gather_responses(
+        self,
+        requests: Sequence[tuple],
+        timeout: Optional[float] = None,
+    ) -> List[Optional[Any]]:
+        """
+        Send every request concurrently through ask() and wait for all answers.
+
+        Each request is (participant, prompt) or (participant, prompt, response_model, valid_ids).
+        Results come back in request order regardless of completion order. If any
+        request raises, the others are cancelled and awaited before the error propagates.
+        """
+        tasks = [asyncio.ensure_future(self.ask(*request, timeout=timeout)) for request in requests]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+
+def describe_validation_error(error: ValidationError) -> str:
+    """One line per problem, e.g. "bid_amount: Input should be less than or equal to 100"."""
+    problems = []
+    for item in error.errors(include_url=False):
+        field = ".".join(str(part) for part in item["loc"]) or "reply"
+        problems.append(f"{field}: {item['msg']}")
+    return "; ".join(problems)
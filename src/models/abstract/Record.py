@@ -0,0 +1,54 @@
+from typing import Any, ClassVar, Dict, Optional, Tuple, Type, get_type_hints
+
+from pydantic import BaseModel, create_model
+from pydantic_core import core_schema
+
+
+class Record:
+    """
+    Slotted game record created in the phases' per-player loops.
+
+    Records skip pydantic validation when they are built; the class annotations
+    describe the fields, and to_dict() validates against a pydantic model built
+    from them, so type checks run only at the serialization boundary.
+    """
+    __slots__ = ()
+
+    _fields: ClassVar[Tuple[str, ...]] = ()
+    _schema: ClassVar[Optional[Type[BaseModel]]] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(name for name in cls.__dict__.get("__annotations__", {}) if not name.startswith("_"))
+        cls._schema = None
+
+    @classmethod
+    def schema(cls) -> Type[BaseModel]:
+        """Pydantic model mirroring the record's fields, built on first use."""
+        if cls._schema is None:
+            hints = get_type_hints(cls)
+            cls._schema = create_model(cls.__name__, **{name: (hints[name], ...) for name in cls._fields})
+        return cls._schema
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Validate the record and return it as JSON-compatible values."""
+        values = {name: getattr(self, name) for name in self._fields}
+        return self.schema().model_validate(values).model_dump(mode="json")
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source, handler):
+        # Containers of records (GameData.votes etc.) only check the type
+        return core_schema.is_instance_schema(
+            cls, serialization=core_schema.plain_serializer_function_ser_schema(lambda record: record.to_dict())
+        )
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
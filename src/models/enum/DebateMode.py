@@ -0,0 +1,5 @@
+from enum import Enum
+
+class DebateMode(Enum):
+    SEQUENTIAL = "sequential"
+    SIMULTANEOUS = "simultaneous"
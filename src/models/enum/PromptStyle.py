@@ -0,0 +1,5 @@
+from enum import Enum
+
+class PromptStyle(Enum):
+    VERBOSE = "verbose"
+    COMPACT = "compact"
@@ -0,0 +1,14 @@
+from typing import ClassVar, Optional
+
+from pydantic import BaseModel
+
+
+class ActionResponse(BaseModel):
+    """Validated reply to an action prompt."""
+    # Name used in analytics (response_repairs)
+    action: ClassVar[str] = "action"
+
+    @classmethod
+    def fallback(cls) -> Optional["ActionResponse"]:
+        """Default used when a player never sends a valid reply. None means no action."""
+        return None
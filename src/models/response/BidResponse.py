@@ -0,0 +1,18 @@
+from typing import ClassVar, Optional
+
+from pydantic import Field
+
+from src.models.response.ActionResponse import ActionResponse
+
+
+class BidResponse(ActionResponse):
+    """Bid for speaking order."""
+    action: ClassVar[str] = "bid"
+
+    bid_amount: int = Field(ge=0, le=100)
+    reason: str = ""
+
+    @classmethod
+    def fallback(cls) -> Optional["BidResponse"]:
+        # No valid bid: speak last
+        return cls(bid_amount=0, reason="No valid bid received")
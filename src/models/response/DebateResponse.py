@@ -0,0 +1,12 @@
+from typing import ClassVar
+
+from pydantic import Field
+
+from src.models.response.ActionResponse import ActionResponse
+
+
+class DebateResponse(ActionResponse):
+    """Message to the group during the debate."""
+    action: ClassVar[str] = "debate"
+
+    message: str = Field(min_length=1)
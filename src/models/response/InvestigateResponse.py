@@ -0,0 +1,8 @@
+from typing import ClassVar
+
+from src.models.response.TargetResponse import TargetResponse
+
+
+class InvestigateResponse(TargetResponse):
+    """Seer's choice of player to investigate."""
+    action: ClassVar[str] = "investigate"
@@ -0,0 +1,8 @@
+from typing import ClassVar
+
+from src.models.response.TargetResponse import TargetResponse
+
+
+class KillResponse(TargetResponse):
+    """Werewolf's choice of victim."""
+    action: ClassVar[str] = "kill"
@@ -0,0 +1,26 @@
+from pydantic import ValidationInfo, field_validator
+
+from src.models.response.ActionResponse import ActionResponse
+
+
+class TargetResponse(ActionResponse):
+    """
+    Reply that names another player. Validation context may hold "player_index"
+    (a PlayerIndex) to resolve prefixes and near-miss IDs, and "valid_ids" to
+    restrict which players can be named.
+    """
+    player_id: str
+    reason: str = ""
+
+    @field_validator("player_id")
+    @classmethod
+    def check_player(cls, player_id: str, info: ValidationInfo) -> str:
+        context = info.context or {}
+        player_index = context.get("player_index")
+        if player_index is not None:
+            player_id = player_index.resolve(player_id) or player_id
+
+        valid_ids = context.get("valid_ids")
+        if valid_ids is not None and player_id not in valid_ids:
+            raise ValueError("must be one of the players listed in the prompt")
+        return player_id
@@ -0,0 +1,8 @@
+from typing import ClassVar
+
+from src.models.response.TargetResponse import TargetResponse
+
+
+class VoteResponse(TargetResponse):
+    """Player to eliminate by village vote."""
+    action: ClassVar[str] = "vote"
@@ -4,6 +4,7 @@ from src.models.abstract.Phase import Phase
 from src.models.Bid import Bid
 from src.models.Event import Event
 from src.models.enum.EventType import EventType
+from src.models.response.BidResponse import BidResponse
 
 if TYPE_CHECKING:
     from src.game.Game import Game
@@ -24,34 +25,64 @@ class Bidding(Phase):
 
         current_participants = game_state.participants[current_round]
 
+        if game_state.sealed_bidding:
+            await self.collect_sealed_bids(current_participants)
+            return
+
         for participant in current_participants:
             await self.game.log(f"[Bidding] {participant.id[:8]} placing bid...")
-            response = await participant.talk_to_agent(
-                prompt=participant.get_bid_prompt(),
-            )
+            response = await self.ask(participant, participant.get_bid_prompt(), BidResponse)
+            if response is None:
+                await self.record_bid(participant, 0, "No bid received")
+                continue
+
+            await self.record_bid(participant, response.bid_amount, response.reason)
 
-            bid_amount = response["bid_amount"]
-            reason = response["reason"]
-            await self.game.log(f"[Bidding] {participant.id[:8]} bid {bid_amount}")
+    async def collect_sealed_bids(self, participants):
+        """
+        Ask every participant for a bid at the same time. All prompts are built before any
+        bid is recorded, so nobody sees another player's bid. Bids are committed in
+        participant order; a player who times out bids 0 and speaks last.
+        """
+        game_state = self.game.state
+        await self.game.log(f"[Bidding] Collecting {len(participants)} sealed bids...")
 
-            player_bid = Bid(
-                participant_id=participant.id,
-                amount=bid_amount
-            )
+        responses = await self.gather_responses(
+            [(participant, participant.get_bid_prompt(), BidResponse) for participant in participants],
+            timeout=game_state.action_timeout,
+        )
 
-            if current_round not in game_state.bids:
-                game_state.bids[current_round] = []
+        for participant, response in zip(participants, responses):
+            if response is None:
+                await self.record_bid(participant, 0, "No bid received before the timeout")
+            else:
+                await self.record_bid(participant, response.bid_amount, response.reason)
+
+    async def record_bid(self, participant, bid_amount: int, reason: str):
+        game_state = self.game.state
+        current_round = game_state.current_round
 
-            game_state.bids[current_round].append(player_bid)
+        await self.game.log(f"[Bidding] {participant.id[:8]} bid {bid_amount}")
 
-            # Log Event
-            bid_event = Event(
-                type=EventType.BID_PLACED,
-                player=participant.id,
-                description=f"Placed a bid of {bid_amount} points for rationale: {reason}"
-            )
+        player_bid = Bid(
+            participant_id=participant.id,
+            amount=bid_amount
+        )
+
+        if current_round not in game_state.bids:
+            game_state.bids[current_round] = []
+
+        game_state.bids[current_round].append(player_bid)
+
+        # Log Event
+        bid_event = Event(
+            type=EventType.BID_PLACED,
+            player=participant.id,
+            description="Placed a bid of {} points for rationale: {}",
+            args=(bid_amount, reason),
+        )
 
-            self.game.log_event(current_round, bid_event)
+        self.game.log_event(current_round, bid_event)
 
     def tally_bids_and_set_order(self):
         game_state = self.game.state
@@ -69,7 +100,8 @@ class Bidding(Phase):
         order_event = Event(
             type=EventType.SPEAKING_ORDER_SET,
             player="System",
-            description=f"Speaking order for round {current_round} set as: {', '.join(speaking_order)}"
+            description="Speaking order for round {} set as: {}",
+            args=(current_round, ", ".join(speaking_order)),
         )
 
         self.game.log_event(current_round, order_event)
\ No newline at end of file
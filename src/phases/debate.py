@@ -3,6 +3,8 @@ from typing import TYPE_CHECKING
 from src.models.abstract.Phase import Phase as PhaseBase
 from src.models.Message import Message
 from src.models.enum.Phase import Phase as PhaseEnum
+from src.models.enum.DebateMode import DebateMode
+from src.models.response.DebateResponse import DebateResponse
 
 if TYPE_CHECKING:
     from src.game.Game import Game
@@ -16,35 +18,58 @@ class Debate(PhaseBase):
         game_state = self.game.state
         current_round = game_state.current_round
         speaking_order = game_state.speaking_order.get(current_round, [])
-        participants = game_state.participants.get(current_round, [])
-
-        # Create a dict for easy lookup by participant_id
-        participants_dict = {p.id: p for p in participants}
 
         # Filter speaking order to only include current participants (exclude eliminated)
-        active_speaking_order = [pid for pid in speaking_order if pid in participants_dict]
+        active_speaking_order = [pid for pid in speaking_order if game_state.is_alive(pid)]
+        participants_dict = {pid: game_state.get_participant(pid) for pid in active_speaking_order}
 
         await self.game.log(f"[Debate] {len(active_speaking_order)} participants debating...")
 
         for _ in range(self.game.state.turns_to_speak_per_round):
+            if game_state.debate_mode == DebateMode.SIMULTANEOUS:
+                await self.run_simultaneous_turn(active_speaking_order, participants_dict)
+                continue
+
             for participant_id in active_speaking_order:
                 participant = participants_dict[participant_id]
 
                 await self.game.log(f"[Debate] {participant_id[:8]} speaking...")
-                response = await participant.talk_to_agent(
-                    prompt=participant.get_debate_prompt(),
-                )
-
-                message_content = response["message"]
-                await self.game.log(f"[Debate] {participant_id[:8]}: {message_content[:50]}...")
-
-                # Store response in chat history
-                message = Message(
-                    sender_id=participant_id,
-                    content=message_content,
-                    phase=PhaseEnum.DISCUSSION
-                )
-                if current_round not in game_state.chat_history:
-                    game_state.chat_history[current_round] = []
-
-                game_state.chat_history[current_round].append(message)
\ No newline at end of file
+                response = await self.ask(participant, participant.get_debate_prompt(), DebateResponse)
+                if response is None:
+                    await self.game.log(f"[Debate] {participant_id[:8]} stayed silent")
+                    continue
+
+                await self.store_message(participant_id, response.message)
+
+    async def run_simultaneous_turn(self, active_speaking_order, participants_dict):
+        """
+        Everyone speaks at once. All prompts are built before any message of this turn
+        is stored, so each speaker sees the transcript as of the end of the previous
+        turn. Messages are then appended in bid order.
+        """
+        speakers = [participants_dict[pid] for pid in active_speaking_order]
+        await self.game.log(f"[Debate] {len(speakers)} participants speaking simultaneously...")
+
+        responses = await self.gather_responses(
+            [(speaker, speaker.get_debate_prompt(), DebateResponse) for speaker in speakers],
+            timeout=self.game.state.action_timeout,
+        )
+
+        for speaker, response in zip(speakers, responses):
+            if response is None:
+                await self.game.log(f"[Debate] {speaker.id[:8]} stayed silent")
+                continue
+            await self.store_message(speaker.id, response.message)
+
+    async def store_message(self, participant_id: str, message_content: str):
+        game_state = self.game.state
+
+        await self.game.log(f"[Debate] {participant_id[:8]}: {message_content[:50]}...")
+
+        # Store response in chat history (and the round's rendered transcript)
+        message = Message(
+            sender_id=participant_id,
+            content=message_content,
+            phase=PhaseEnum.DISCUSSION
+        )
+        game_state.record_message(message)
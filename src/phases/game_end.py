@@ -2,7 +2,6 @@ from typing import TYPE_CHECKING, Dict, Any
 
 from src.models.abstract.Phase import Phase
 from src.game.analytics import compute_game_analytics, render_summary_text
-from src.evaluation.scoring import Scoring
 from src.models.enum.Role import Role
 
 if TYPE_CHECKING:
@@ -22,16 +21,5 @@ class GameEnd(Phase):
         return analytics
     
     def compute_scores(self) -> Dict[str, int]:
-        scoring = Scoring(game_state=self.game.state)
-        scores = {}
-        
-        if self.game.state.werewolf:
-            scores[self.game.state.werewolf.id] = scoring.score_werewolf()
-        
-        if self.game.state.seer:
-            scores[self.game.state.seer.id] = scoring.score_seer()
-        
-        for villager in self.game.state.villagers:
-            scores[villager.id] = scoring.score_villager()
-        
-        return scores
\ No newline at end of file
+        # Totals are kept up to date as votes and seer checks are recorded
+        return self.game.state.score_tally.scores(self.game.state)
\ No newline at end of file
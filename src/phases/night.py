@@ -1,43 +1,141 @@
-from typing import TYPE_CHECKING
+from collections import Counter
+from typing import TYPE_CHECKING, List, Optional
 
 from src.models.abstract.Phase import Phase
 from src.models.Event import Event
 from src.models.enum.EventType import EventType
 from src.models.enum.EliminationType import EliminationType
+from src.models.response.KillResponse import KillResponse
+from src.models.response.InvestigateResponse import InvestigateResponse
 
 if TYPE_CHECKING:
     from src.game.Game import Game
     from src.a2a.messenger import Messenger
+    from src.models.Participant import Participant
 
 class Night(Phase):
     def __init__(self, game: "Game", messenger: "Messenger"):
         super().__init__(game, messenger)
 
     async def run(self):
-        await self.game.log(f"[Night] Round {self.game.state.current_round}")
-        await self.execute_werewolf_kill()
-        await self.execute_seer_investigation()
+        game_state = self.game.state
+        await self.game.log(f"[Night] Round {game_state.current_round}")
+
+        pack = self.get_living_werewolves()
+        seer = await self.get_investigating_seer()
+
+        # Every werewolf and the seer decide at the same time; the night takes as long
+        # as the slowest single actor. Results are applied in a fixed order afterwards.
+        requests = self.kill_requests(pack)
+        if seer is not None:
+            requests.append(self.investigation_request(seer))
+
+        responses = await self.gather_responses(requests, timeout=game_state.action_timeout)
 
-        self.game.log_event(self.game.state.current_round, Event(type=EventType.NIGHT_END))
+        await self.resolve_werewolf_kill(pack, responses[:len(pack)])
+        await self.resolve_seer_investigation(seer, responses[len(pack)] if seer is not None else None)
+
+        self.game.log_event(game_state.current_round, Event(type=EventType.NIGHT_END))
+
+    def get_alive_ids(self) -> set:
+        game_state = self.game.state
+        return {p.id for p in game_state.participants.get(game_state.current_round, [])}
+
+    def kill_requests(self, pack: List["Participant"]) -> List[tuple]:
+        """One kill prompt per werewolf; any living non-werewolf is a valid victim."""
+        victims = self.get_alive_ids() - {werewolf.id for werewolf in pack}
+        return [(werewolf, werewolf.get_werewolf_prompt(), KillResponse, victims) for werewolf in pack]
+
+    def investigation_request(self, seer: "Participant") -> tuple:
+        """The seer's prompt; any other living player may be investigated."""
+        return (seer, seer.get_seer_prompt(), InvestigateResponse, self.get_alive_ids() - {seer.id})
+
+    def get_living_werewolves(self) -> List["Participant"]:
+        game_state = self.game.state
+        return [werewolf for werewolf in game_state.get_werewolves() if game_state.is_alive(werewolf.id)]
+
+    def get_living_seer(self) -> Optional["Participant"]:
+        game_state = self.game.state
+        seer = game_state.seer
+        if seer is None:
+            return None
+        return seer if game_state.is_alive(seer.id) else None
+
+    def seer_found_all_werewolves(self) -> bool:
+        """True once every living werewolf has already been revealed to the seer."""
+        found = {player for player, is_werewolf in self.game.state.seer_checks if is_werewolf}
+        pack = self.get_living_werewolves()
+        return bool(found) and all(werewolf.id in found for werewolf in pack)
+
+    async def get_investigating_seer(self) -> Optional["Participant"]:
+        """The seer if they should investigate tonight, None if dead or already done."""
+        seer = self.get_living_seer()
+        if seer is None:
+            await self.game.log("[Night] Seer is dead, skipping investigation")
+            return None
+        if self.seer_found_all_werewolves():
+            await self.game.log("[Night] Seer has already found the werewolf, skipping investigation")
+            return None
+        return seer
 
     async def execute_werewolf_kill(self):
+        pack = self.get_living_werewolves()
+        responses = await self.gather_responses(self.kill_requests(pack), timeout=self.game.state.action_timeout)
+        await self.resolve_werewolf_kill(pack, responses)
+
+    async def execute_seer_investigation(self):
+        seer = await self.get_investigating_seer()
+        response = None
+        if seer is not None:
+            [response] = await self.gather_responses(
+                [self.investigation_request(seer)],
+                timeout=self.game.state.action_timeout,
+            )
+        await self.resolve_seer_investigation(seer, response)
+
+    def choose_kill(self, pack: List["Participant"], responses: List[Optional[KillResponse]]) -> Optional[tuple]:
+        """
+        Resolve the werewolves' proposals into one target.
+
+        The most proposed player is killed. Ties go to the werewolf whose turn it is:
+        the pack takes turns by round, so in round r the tie is broken by the first
+        tied proposal at or after pack position (r - 1), wrapping around.
+        Returns (werewolf, target, rationale) or None when nobody proposed a kill.
+        """
+        proposals = [
+            (werewolf, response.player_id, response.reason)
+            for werewolf, response in zip(pack, responses)
+            if response is not None
+        ]
+        if not proposals:
+            return None
+
+        counts = Counter(target for _, target, _ in proposals)
+        most_votes = max(counts.values())
+        tied = [p for p in proposals if counts[p[1]] == most_votes]
+        seat = {werewolf.id: index for index, werewolf in enumerate(pack)}
+        turn = (self.game.state.current_round - 1) % len(pack)
+        return min(tied, key=lambda p: (seat[p[0].id] - turn) % len(pack))
+
+    async def resolve_werewolf_kill(self, pack: List["Participant"], responses: List[Optional[KillResponse]]):
         game_state = self.game.state
 
-        # Check if werewolf is still alive
-        if game_state.werewolf is None:
-            await self.game.log("[Night] Werewolf is dead, skipping kill")
+        if not pack:
+            await self.game.log("[Night] Every werewolf is dead, skipping kill")
             return
 
-        await self.game.log(f"[Night] Werewolf {game_state.werewolf.id[:8]} choosing victim...")
-        response = await game_state.werewolf.talk_to_agent(
-            prompt=game_state.werewolf.get_werewolf_prompt(),
-        )
+        choice = self.choose_kill(pack, responses)
+        if choice is None:
+            await self.game.log("[Night] No werewolf chose a victim")
+            return
 
-        player = response["player_id"]
-        rationale = response["reason"]
-        await self.game.log(f"[Night] Werewolf eliminated {player[:8]}: {rationale[:50]}...")
+        werewolf, player, rationale = choice
+        if len(pack) > 1:
+            proposed = ", ".join(r.player_id[:8] for r in responses if r is not None)
+            await self.game.log(f"[Night] Werewolves proposed: {proposed}")
+        await self.game.log(f"[Night] Werewolf {werewolf.id[:8]} eliminated {player[:8]}: {rationale[:50]}...")
 
-        self.game.state.eliminate_player(player, EliminationType.NIGHT_KILL)
+        game_state.eliminate_player(player, EliminationType.NIGHT_KILL)
         werewolf_elimination_event = Event(
             type=EventType.WEREWOLF_ELIMINATION,
             eliminated_player=player,
@@ -46,22 +144,19 @@ class Night(Phase):
         self.game.log_event(game_state.current_round, werewolf_elimination_event)
         game_state.latest_werewolf_kill = player
 
-    async def execute_seer_investigation(self):
+    async def resolve_seer_investigation(self, seer: Optional["Participant"], response: Optional[InvestigateResponse]):
         game_state = self.game.state
-        seer = game_state.seer
 
-        # Check if seer is still alive
+        # Seer is dead or has nothing left to find
         if seer is None:
-            await self.game.log("[Night] Seer is dead, skipping investigation")
             return
 
-        await self.game.log(f"[Night] Seer {seer.id[:8]} choosing target...")
-        response = await seer.talk_to_agent(
-            prompt=seer.get_seer_prompt(),
-        )
+        if response is None:
+            await self.game.log("[Night] Seer made no investigation")
+            return
 
-        player = response["player_id"]
-        rationale = response["reason"]
+        player = response.player_id
+        rationale = response.reason
 
         seer_investigation_event = Event(
             type=EventType.SEER_INVESTIGATION,
@@ -72,10 +167,10 @@ class Night(Phase):
         self.game.log_event(game_state.current_round, seer_investigation_event)
 
         # Reveal investigation result to seer
-        is_werewolf = game_state.werewolf.id == player if game_state.werewolf else False
+        is_werewolf = any(werewolf.id == player for werewolf in game_state.get_werewolves())
         await self.game.log(f"[Night] Seer investigated {player[:8]}: {'WEREWOLF' if is_werewolf else 'not werewolf'}")
 
         # Store the seer check for future reference
         # Note: For LLM participants, they don't have persistent memory so we skip the reveal call
         # The seer_checks list is used to include this info in future prompts
-        game_state.seer_checks.append((player, is_werewolf))
\ No newline at end of file
+        game_state.seer_checks.append((player, is_werewolf))
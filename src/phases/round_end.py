@@ -19,27 +19,27 @@ class RoundEnd(Phase):
         self.log_event(EventType.ROUND_END)
         
     #Check if the game is over
+    # GameData.check_winner holds the win conditions; they are also checked after every elimination
     async def check_win_conditions(self):
         game_state = self.game.state
         current_round = game_state.current_round
-        current_participants = game_state.participants.get(current_round, [])
+        alive_count = game_state.count_alive()
 
-        if not current_participants:
+        if not alive_count:
             return
 
-        werewolf_alive = self.is_werewolf_alive(current_participants)
-        villager_count = self.count_villagers(current_participants)
+        await self.game.log(f"[RoundEnd] Round {current_round}: {alive_count} alive, {self.count_werewolves()} werewolves, {self.count_villagers()} villagers")
 
-        await self.game.log(f"[RoundEnd] Round {current_round}: {len(current_participants)} alive, werewolf {'alive' if werewolf_alive else 'dead'}, {villager_count} villagers")
+        winner = game_state.check_winner()
 
         #villagers win
-        if not werewolf_alive:
+        if winner == "villagers":
             await self.game.log("[RoundEnd] VILLAGERS WIN!")
             game_state.declare_winner("villagers")
             self.game.current_phase = PhaseEnum.GAME_END
 
         #werewolves win
-        elif werewolf_alive and villager_count <= 1:
+        elif winner == "werewolf":
             await self.game.log("[RoundEnd] WEREWOLF WIN!")
             game_state.declare_winner("werewolf")
             self.game.current_phase = PhaseEnum.GAME_END
@@ -49,15 +49,21 @@ class RoundEnd(Phase):
             game_state.current_round += 1
             self.game.current_phase = PhaseEnum.NIGHT
     
-    #Check if the werewolf is alive
-    def is_werewolf_alive(self, participants):
-        if not self.game.state.werewolf:
-            return False
-        werewolf_id = self.game.state.werewolf.id
-        return any(p.id == werewolf_id for p in participants)
+    #Check if any werewolf is alive
+    # Without a participants list these read GameData's alive index in O(1)
+    def is_werewolf_alive(self, participants=None):
+        return self.count_werewolves(participants) > 0
+
+    #Check for number of living werewolves
+    def count_werewolves(self, participants=None):
+        if participants is None:
+            return self.game.state.count_alive(Role.WEREWOLF)
+        return sum(1 for p in participants if p.role == Role.WEREWOLF)
     
     #Check for number of villagers and seers
-    def count_villagers(self, participants):
+    def count_villagers(self, participants=None):
+        if participants is None:
+            return self.game.state.count_alive(Role.VILLAGER, Role.SEER)
         return sum(1 for p in participants if p.role in [Role.VILLAGER, Role.SEER])
     
     #end of round logging
@@ -4,6 +4,7 @@ from src.models.abstract.Phase import Phase
 from src.models import Event, Vote
 from src.models.enum.EventType import EventType
 from src.models.enum.EliminationType import EliminationType
+from src.models.response.VoteResponse import VoteResponse
 
 if TYPE_CHECKING:
     from src.game.Game import Game
@@ -24,35 +25,75 @@ class Voting(Phase):
 
         current_participants = game_state.participants[current_round]
 
+        if game_state.sealed_voting:
+            await self.collect_sealed_votes(current_participants)
+            return
+
         #Send prompt for player vote
         for participant in current_participants:
             await self.game.log(f"[Voting] {participant.id[:8]} voting...")
-            response = await participant.talk_to_agent(
-                prompt=participant.get_vote_prompt(),
+            response = await self.ask(
+                participant,
+                participant.get_vote_prompt(),
+                VoteResponse,
+                self.vote_candidates(participant, current_participants),
             )
+            if response is None:
+                await self.game.log(f"[Voting] {participant.id[:8]} abstained")
+                continue
+
+            await self.record_vote(participant, response.player_id, response.reason)
+
+    async def collect_sealed_votes(self, participants):
+        """
+        Ask every participant for a vote at the same time. Votes are committed in
+        participant order so tallying (and tie-breaking) matches the sequential mode.
+        A player who times out abstains.
+        """
+        game_state = self.game.state
+        await self.game.log(f"[Voting] Collecting {len(participants)} sealed votes...")
+
+        responses = await self.gather_responses(
+            [
+                (participant, participant.get_vote_prompt(), VoteResponse, self.vote_candidates(participant, participants))
+                for participant in participants
+            ],
+            timeout=game_state.action_timeout,
+        )
+
+        for participant, response in zip(participants, responses):
+            if response is None:
+                await self.game.log(f"[Voting] {participant.id[:8]} abstained")
+                continue
+            await self.record_vote(participant, response.player_id, response.reason)
+
+    def vote_candidates(self, participant, participants):
+        """Players a participant may vote for: anyone still in the game."""
+        return {p.id for p in participants}
+
+    async def record_vote(self, participant, voted_for: str, rationale: str):
+        game_state = self.game.state
+        current_round = game_state.current_round
 
-            voted_for = response["player_id"]
-            rationale = response["reason"]
-            await self.game.log(f"[Voting] {participant.id[:8]} voted for {voted_for[:8]}")
-
-            round_votes = game_state.votes[current_round]
+        await self.game.log(f"[Voting] {participant.id[:8]} voted for {voted_for[:8]}")
 
-            player_vote = Vote(
-                voter_id=participant.id,
-                voted_for_id=voted_for,
-                rationale=rationale
-            )
+        player_vote = Vote(
+            voter_id=participant.id,
+            voted_for_id=voted_for,
+            rationale=rationale
+        )
 
-            round_votes.append(player_vote)
+        game_state.record_vote(player_vote)
 
-            # Log Event
-            player_vote_event = Event(
-                type=EventType.VOTE,
-                player=participant.id,
-                description=f"Voted for {voted_for} for rationale: {rationale}"
-            )
+        # Log Event
+        player_vote_event = Event(
+            type=EventType.VOTE,
+            player=participant.id,
+            description="Voted for {} for rationale: {}",
+            args=(voted_for, rationale),
+        )
 
-            self.game.log_event(current_round, player_vote_event)
+        self.game.log_event(current_round, player_vote_event)
         
     async def tally_and_eliminate(self):
         game_state = self.game.state
@@ -89,6 +130,7 @@ class Voting(Phase):
             elimination_event = Event(
                 type=EventType.VILLAGE_ELIMINATION,
                 eliminated_player=eliminated_player_id,
-                description=f"Player {eliminated_player_id} was eliminated by village vote with {player_to_eliminate[1]} votes"
+                description="Player {} was eliminated by village vote with {} votes",
+                args=(eliminated_player_id, player_to_eliminate[1]),
             )
             self.game.log_event(current_round, elimination_event)
\ No newline at end of file
@@ -1,3 +1,17 @@
+import math
+import re
+import string
+import textwrap
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.models.enum.PromptStyle import PromptStyle
+
+# Rough Gemini tokenizer ratio; good enough to compare prompt sizes without an API call
+CHARS_PER_TOKEN = 4
+
+_STANDALONE_FIELD = re.compile(r"^\{(\w+)\}$")
+
+
 def get_game_rules_prompt(self):
     return """
         This is the game of werewolf. The main objective is for villagers to detect the werewolf and for the werewolf to avoid detection
@@ -12,9 +26,253 @@ def get_game_rules_prompt(self):
 
         Once discussion ends, each participant votes for one person to eliminate. The person with the highest votes is removed from the game.
 
-        The game ends if the werewolf is eliminated (villagers wins) or if the werewolf ends up alone with another villager, in other words all other villagers
-        are eliminated expect one (werewolf wins).
+        The game ends if every werewolf is eliminated (villagers win) or if the werewolves equal or outnumber the villagers left, in other words
+        with a single werewolf all other villagers are eliminated except one (werewolves win).
 
         If no winning condition is met after voting, the next round begins at the NIGHT phase
     
-    """
\ No newline at end of file
+    """
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a prompt."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+
+# Shared boilerplate, written once and composed into every template
+CONTEXT = {
+    PromptStyle.VERBOSE: """
+        You are a participant in a game of werewolf.
+        Your player ID: {player_id}
+        Your role: {role}
+    """,
+    PromptStyle.COMPACT: "Werewolf game. You are player {player_id}, role {role}.",
+}
+
+CORRECTION = "Your previous reply was rejected ({error}). Reply again with only the corrected JSON object."
+
+JSON_ONLY = "IMPORTANT: You MUST respond with valid JSON only. Do not include any text, markdown, or explanation before or after the JSON object."
+
+def render_correction(error: str) -> str:
+    """Note appended to a prompt when the reply to it did not validate."""
+    return CORRECTION.format(error=error)
+
+
+# (key, description, quoted) for each field of the expected JSON reply
+ResponseField = Tuple[str, str, bool]
+
+
+def render_response_format(fields: Sequence[ResponseField], style: PromptStyle) -> str:
+    """The "respond in JSON" block for a prompt, with format-string braces escaped."""
+    if style == PromptStyle.COMPACT:
+        pairs = ", ".join(f'"{key}": {_json_value(description, quoted)}' for key, description, quoted in fields)
+        return "Reply with only this JSON: {{" + pairs + "}}"
+
+    lines = [f'    "{key}": {_json_value(description, quoted)}' for key, description, quoted in fields]
+    return "Respond in JSON format:\n{{\n" + ",\n".join(lines) + "\n}}\n\n" + JSON_ONLY
+
+
+def _json_value(description: str, quoted: bool) -> str:
+    return f'"{description}"' if quoted else description
+
+
+class PromptTemplate:
+    """
+    A prompt compiled once per style into dedented lines.
+
+    Lines holding nothing but a single {field} are dropped when that field renders
+    empty, and runs of blank lines collapse to one, so optional sections don't
+    leave gaps behind.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        verbose: str,
+        compact: Optional[str] = None,
+        response: Sequence[ResponseField] = (),
+        context: bool = True,
+    ):
+        self.name = name
+        # Per style: (text, has_fields, standalone_field) for every line
+        self._lines: Dict[PromptStyle, List[Tuple[str, bool, Optional[str]]]] = {
+            style: self._compile(body, style, response, context)
+            for style, body in ((PromptStyle.VERBOSE, verbose), (PromptStyle.COMPACT, compact or verbose))
+        }
+
+    @staticmethod
+    def _compile(body: str, style: PromptStyle, response: Sequence[ResponseField], context: bool):
+        sections = []
+        if context:
+            sections.append(textwrap.dedent(CONTEXT[style]).strip())
+        sections.append(textwrap.dedent(body).strip())
+        if response:
+            sections.append(render_response_format(response, style))
+
+        separator = "\n" if style == PromptStyle.COMPACT else "\n\n"
+        lines = []
+        for line in separator.join(sections).split("\n"):
+            line = line.rstrip()
+            has_fields = any(field is not None for _, field, _, _ in string.Formatter().parse(line))
+            match = _STANDALONE_FIELD.match(line)
+            # Lines without fields are unescaped here so render can use them as-is
+            lines.append((line if has_fields else line.format(), has_fields, match.group(1) if match else None))
+        return lines
+
+    def render(self, style: PromptStyle = PromptStyle.VERBOSE, **fields) -> str:
+        out: List[str] = []
+        for line, has_fields, standalone in self._lines[style]:
+            if standalone is not None and not fields.get(standalone):
+                continue
+            rendered = line.format(**fields) if has_fields else line
+            if not rendered and (not out or not out[-1]):
+                continue
+            out.append(rendered)
+        return "\n".join(out).strip()
+
+
+VOTE_PROMPT = PromptTemplate(
+    "vote",
+    verbose="""
+        It's time to vote for a player to eliminate.
+
+        Here is all of the conversations from this round:
+        {transcript}
+
+        Pick a single player to eliminate and provide an explanation as to why.
+        Here are the players to choose from:
+        {candidates}
+    """,
+    compact="""
+        Vote to eliminate one player.
+        Round conversation:
+        {transcript}
+        Candidates:
+        {candidates}
+    """,
+    response=[
+        ("player_id", "the player ID you want to eliminate", True),
+        ("reason", "your explanation for why you are eliminating this player", True),
+    ],
+)
+
+WEREWOLF_PROMPT = PromptTemplate(
+    "werewolf",
+    verbose="""
+        ROUND {round}:
+
+        YOU ARE THE WEREWOLF
+
+        {pack_info}
+
+        Pick one participant to eliminate. Here is a list of the participants:
+        {candidates}
+
+        Be sure to also explain why you are choosing to eliminate this player.
+    """,
+    compact="""
+        Round {round}. You are the werewolf.
+        {pack_info}
+        Choose one player to eliminate:
+        {candidates}
+    """,
+    response=[
+        ("player_id", "the player ID you want to eliminate", True),
+        ("reason", "your explanation for why you are eliminating this player", True),
+    ],
+)
+
+SEER_PROMPT = PromptTemplate(
+    "seer",
+    verbose="""
+        ROUND {round}:
+
+        YOU ARE THE SEER
+
+        Pick one participant to investigate. If you already know who the werewolf is, you don't have
+        to investigate someone again.
+
+        Participants you have not checked:
+        {remaining}
+
+        Participants you have checked:
+        {checked}
+
+        Explain why you are choosing to investigate this player.
+    """,
+    compact="""
+        Round {round}. You are the seer. Choose one player to investigate.
+        Unchecked:
+        {remaining}
+        Checked:
+        {checked}
+    """,
+    response=[
+        ("player_id", "the player ID you want to investigate", True),
+        ("reason", "your explanation for why you are investigating this player", True),
+    ],
+)
+
+SEER_REVEAL_PROMPT = PromptTemplate(
+    "seer_reveal",
+    verbose="""
+        Here are the results of your investigation:
+
+        You investigated player: {player}
+        They {verdict} the werewolf
+    """,
+    compact="""
+        Investigation result: {player} {verdict} the werewolf.
+    """,
+)
+
+BID_PROMPT = PromptTemplate(
+    "bid",
+    verbose="""
+        It is time to place your bid for speaking order in the upcoming debate round.
+
+        Place a bid between 0 and 100 points to determine your speaking order.
+
+        Remember, your bid will determine when you get to speak, with higher bids allowing you to speak earlier.
+        Consider your strategy carefully based on the current state of the game.
+
+        Current bids from other participants:
+        {bids}
+    """,
+    compact="""
+        Bid 0-100 points for speaking order; higher bids speak earlier.
+        Current bids:
+        {bids}
+    """,
+    response=[
+        ("bid_amount", "<your_bid_amount>", False),
+        ("reason", "your explanation for your bid", True),
+    ],
+)
+
+DEBATE_PROMPT = PromptTemplate(
+    "debate",
+    verbose="""
+        ROUND {round} - Debate Phase
+
+        {night_info}
+
+        Speaking order: {order}
+
+        Conversation so far:
+        {transcript}
+
+        Share your thoughts with the group. Try to identify the werewolf (or deflect suspicion if you are the werewolf).
+    """,
+    compact="""
+        Round {round} debate.
+        {night_info}
+        Speaking order: {order}
+        Conversation:
+        {transcript}
+        Speak to the group: find the werewolf (or deflect suspicion if you are it).
+    """,
+    response=[
+        ("message", "your message to the group", True),
+    ],
+)
@@ -0,0 +1,89 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+
+class DeadlineExceeded(Exception):
+    """The game's or the evaluation's time budget ran out."""
+
+
+class Deadline:
+    """
+    A time budget, optionally nested inside a parent budget.
+
+    remaining() is the time left on this budget or any parent, whichever is
+    less, or None when neither has a limit. A deadline is made current for a
+    block of code with activate(); asyncio tasks created inside inherit it,
+    so every call in a game sees the game's deadline.
+    """
+
+    def __init__(
+        self,
+        budget: Optional[float] = None,
+        parent: Optional["Deadline"] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.budget = budget
+        self.parent = parent
+        self._clock = clock
+        self.expires_at = clock() + budget if budget is not None else None
+
+    def remaining(self) -> Optional[float]:
+        own = None if self.expires_at is None else max(0.0, self.expires_at - self._clock())
+        inherited = self.parent.remaining() if self.parent is not None else None
+        if own is None:
+            return inherited
+        if inherited is None:
+            return own
+        return min(own, inherited)
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def timeout(self, default: float) -> float:
+        """default capped to the time left. Raises DeadlineExceeded once nothing is left."""
+        if self.expired:
+            raise DeadlineExceeded("time budget exhausted")
+        remaining = self.remaining()
+        return default if remaining is None else min(default, remaining)
+
+    @contextmanager
+    def activate(self):
+        token = _current_deadline.set(self)
+        try:
+            yield self
+        finally:
+            _current_deadline.reset(token)
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("current_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+
+@asynccontextmanager
+async def within_deadline():
+    """
+    Bound the block by the current deadline, if any. Raises DeadlineExceeded
+    up front when the budget is already spent, or when it runs out mid-block.
+    """
+    deadline = current_deadline()
+    if deadline is None:
+        yield None
+        return
+    if deadline.expired:
+        raise DeadlineExceeded("time budget exhausted")
+    scope = asyncio.timeout(deadline.remaining())
+    try:
+        async with scope:
+            yield deadline
+    except TimeoutError:
+        if scope.expired():
+            raise DeadlineExceeded("time budget exhausted") from None
+        raise
@@ -0,0 +1,145 @@
+import json
+import re
+from typing import Any, Dict, Optional
+
+try:  # optional fast codec: pip install greenagent[fast]
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+    _loads = json.loads
+
+# Both codecs raise ValueError subclasses on bad input
+_DECODE_ERRORS = (ValueError, TypeError)
+
+# The only characters the scanner has to look at
+_STRUCTURAL = re.compile(r"""[{}"'\\]""")
+_raw_decode = json.JSONDecoder().raw_decode
+
+
+def find_json_object(text: str, start: int = 0) -> Optional[tuple[int, int]]:
+    """
+    Locate the first balanced {...} object at or after start in one pass.
+
+    Braces inside double- or single-quoted strings are ignored. Returns the
+    (start, end) slice bounds, or None if no object closes.
+    """
+    begin = text.find("{", start)
+    if begin == -1:
+        return None
+
+    depth = 0
+    quote = None
+    escaped_at = -1  # index of the character after a backslash inside a string
+    for match in _STRUCTURAL.finditer(text, begin):
+        i = match.start()
+        if i == escaped_at:
+            continue
+        char = text[i]
+        if quote:
+            if char == "\\":
+                escaped_at = i + 1
+            elif char == quote:
+                quote = None
+        elif char == '"' or char == "'":
+            quote = char
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return begin, i + 1
+    return None
+
+
+def repair_json(text: str) -> str:
+    """
+    Fix the near-misses LLMs produce most: single-quoted strings and trailing
+    commas before } or ]. Double-quoted strings are copied through untouched.
+    """
+    out = []
+    i = 0
+    length = len(text)
+    while i < length:
+        char = text[i]
+        if char == '"' or char == "'":
+            quote = char
+            out.append('"')
+            i += 1
+            while i < length and text[i] != quote:
+                if text[i] == "\\" and i + 1 < length:
+                    # \' is not a valid JSON escape; the quote needs no escaping in a "..." string
+                    out.append("'" if text[i + 1] == "'" else text[i:i + 2])
+                    i += 2
+                    continue
+                out.append('\\"' if quote == "'" and text[i] == '"' else text[i])
+                i += 1
+            out.append('"')
+            i += 1
+        elif char == ",":
+            j = i + 1
+            while j < length and text[j].isspace():
+                j += 1
+            if j < length and text[j] in "}]":
+                i += 1  # drop the trailing comma
+                continue
+            out.append(char)
+            i += 1
+        else:
+            out.append(char)
+            i += 1
+    return "".join(out)
+
+
+def _decode_object(text: str) -> Optional[Dict[str, Any]]:
+    try:
+        value = _loads(text)
+    except _DECODE_ERRORS:
+        try:
+            value = _loads(repair_json(text))
+        except _DECODE_ERRORS:
+            return None
+    return value if isinstance(value, dict) else None
+
+
+def extract_json_object(response: str) -> Dict[str, Any]:
+    """
+    Parse the JSON object out of an agent/LLM reply.
+
+    Accepts bare JSON, fenced code blocks, prose before or after the object and
+    near-valid JSON that repair_json can fix. Raises ValueError if no object
+    can be recovered.
+    """
+    if not isinstance(response, str):
+        raise ValueError(f"Could not parse JSON from agent response: {response!r}")
+
+    stripped = response.strip()
+    if stripped.startswith("{"):
+        # Fast path: the whole reply is the object
+        try:
+            value = _loads(stripped)
+            if isinstance(value, dict):
+                return value
+        except _DECODE_ERRORS:
+            pass
+
+    position = response.find("{")
+    while position != -1:
+        # Well-formed object embedded in prose: decode in place, ignoring what follows
+        try:
+            value, _ = _raw_decode(response, position)
+            if isinstance(value, dict):
+                return value
+        except ValueError:
+            pass
+
+        bounds = find_json_object(response, position)
+        if bounds is None:
+            break
+        start, end = bounds
+        value = _decode_object(response[start:end])
+        if value is not None:
+            return value
+        position = response.find("{", start + 1)
+
+    raise ValueError(f"Could not parse JSON from agent response: {response}")
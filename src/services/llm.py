@@ -1,13 +1,35 @@
+import asyncio
 import os
+import weakref
 from google import genai
 from pydantic import BaseModel
-from typing import Optional, Any
+from typing import Optional, Any, Dict
 
-class LLM(BaseModel):
-    model_config = {"arbitrary_types_allowed": True}
+from src.services.llm_cache import PromptCache
 
-    model: str = "gemini-2.0-flash"
-    _client: Optional[Any] = None
+# Global cap on Gemini requests in flight across every game in the process
+DEFAULT_MAX_CONCURRENT_REQUESTS = 16
+
+
+class LLMPool:
+    """
+    Process-wide Gemini client shared by every filler participant.
+
+    One genai.Client (and so one set of HTTP connections) is reused for all calls,
+    and a semaphore caps how many requests are in flight at once. An optional
+    PromptCache answers repeated prompts without calling Gemini.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        cache: Optional[PromptCache] = None,
+    ):
+        self.max_concurrent_requests = max_concurrent_requests
+        self.cache = cache
+        self._client: Optional[genai.Client] = None
+        # One semaphore per event loop; asyncio primitives can't be shared across loops
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
     @property
     def client(self) -> genai.Client:
@@ -18,11 +40,118 @@ class LLM(BaseModel):
             self._client = genai.Client(api_key=api_key)
         return self._client
 
-    def execute_prompt(self, prompt: str) -> str:
+    def warm_up(self) -> bool:
+        """Create the shared client ahead of the first game. Returns False if it can't be built yet."""
+        try:
+            self.client
+        except ValueError as e:
+            print(f"[LLMPool] Skipping warm-up: {e}")
+            return False
+        return True
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    def generate(self, model: str, prompt: str, settings: Optional[Dict[str, Any]] = None) -> str:
         response = self.client.models.generate_content(
-            model=self.model,
-            contents=prompt
+            model=model,
+            contents=prompt,
+            **({"config": settings} if settings else {})
         )
         return response.text
-        
-        
\ No newline at end of file
+
+    async def generate_async(self, model: str, prompt: str, settings: Optional[Dict[str, Any]] = None) -> str:
+        async with self._get_semaphore():
+            response = await self.client.aio.models.generate_content(
+                model=model,
+                contents=prompt,
+                **({"config": settings} if settings else {})
+            )
+        return response.text
+
+
+_llm_pool: Optional[LLMPool] = None
+
+
+def get_llm_pool() -> LLMPool:
+    """Return the process-wide LLM pool, creating it with defaults on first use."""
+    global _llm_pool
+    if _llm_pool is None:
+        _llm_pool = LLMPool()
+    return _llm_pool
+
+
+def init_llm_pool(
+    max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+    cache: Optional[PromptCache] = None,
+) -> LLMPool:
+    """(Re)create the process-wide LLM pool. Call at server startup, before any game runs."""
+    global _llm_pool
+    _llm_pool = LLMPool(max_concurrent_requests=max_concurrent_requests, cache=cache)
+    return _llm_pool
+
+
+class LLM(BaseModel):
+    model_config = {"arbitrary_types_allowed": True}
+
+    model: str = "gemini-2.0-flash"
+    generation_config: Dict[str, Any] = {}
+    pool: Optional[Any] = None  # LLMPool; defaults to the process-wide pool
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def get_pool(self) -> LLMPool:
+        return self.pool if self.pool is not None else get_llm_pool()
+
+    @property
+    def client(self) -> genai.Client:
+        return self.get_pool().client
+
+    def execute_prompt(self, prompt: str) -> str:
+        pool = self.get_pool()
+        key, cached = self._lookup(pool, prompt)
+        if cached is not None:
+            return cached
+        response = pool.generate(self.model, prompt, self.generation_config)
+        self._store(pool, key, response)
+        return response
+
+    async def execute_prompt_async(self, prompt: str) -> str:
+        """Same as execute_prompt, but uses the SDK's async client so the event loop keeps running."""
+        pool = self.get_pool()
+        key, cached = self._lookup(pool, prompt)
+        if cached is not None:
+            return cached
+        response = await pool.generate_async(self.model, prompt, self.generation_config)
+        self._store(pool, key, response)
+        return response
+
+    def _lookup(self, pool: LLMPool, prompt: str) -> tuple[Optional[str], Optional[str]]:
+        if pool.cache is None:
+            return None, None
+        key = PromptCache.make_key(self.model, prompt, self.generation_config)
+        cached = pool.cache.get(key)
+        if cached is None:
+            self.cache_misses += 1
+        else:
+            self.cache_hits += 1
+        return key, cached
+
+    def _store(self, pool: LLMPool, key: Optional[str], response: Optional[str]):
+        if pool.cache is not None and key is not None and response is not None:
+            pool.cache.put(key, response)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Cache hits/misses for prompts sent through this LLM."""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "enabled": self.get_pool().cache is not None,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0,
+        }
@@ -0,0 +1,105 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class PromptCache:
+    """
+    Content-addressed cache of LLM responses.
+
+    Keys are a hash of the model, the generation settings and the prompt. Recent
+    entries live in a bounded in-memory LRU; when cache_dir is set every entry is
+    also written to disk (one JSON file per key) so the cache survives restarts.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, cache_dir: Optional[str] = None):
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(model: str, prompt: str, settings: Optional[Dict[str, Any]] = None) -> str:
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        material = json.dumps(
+            {"model": model, "settings": settings or {}, "prompt": prompt_hash},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.memory_hits += 1
+            return self._entries[key]
+
+        response = self._read_disk(key)
+        if response is not None:
+            self.disk_hits += 1
+            self._remember(key, response)
+            return response
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, response: str):
+        self._remember(key, response)
+        self._write_disk(key, response)
+
+    def _remember(self, key: str, response: str):
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)["response"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write_disk(self, key: str, response: str):
+        if not self.cache_dir:
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so a crash never leaves a torn entry behind
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"response": response}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[PromptCache] Failed to persist {key[:8]}: {e}")
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            "hits": hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0,
+            "entries": len(self._entries),
+        }
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, Mock, MagicMock
 from dotenv import load_dotenv
@@ -7,13 +9,20 @@ load_dotenv()
 
 from src.models.Participant import Participant
 from src.models.enum.Role import Role
+from src.models.enum.DebateMode import DebateMode
+from src.models.enum.PromptStyle import PromptStyle
 from src.models.Message import Message
 from src.models.Event import Event
 from src.models.Vote import Vote
 from src.models.Bid import Bid
 from src.game.Game import Game
 from src.game.GameData import GameData
-from src.a2a.messenger import Messenger
+from src.game.AliasRegistry import AliasRegistry
+from src.game.PlayerIndex import PlayerIndex
+from src.game.EventStore import EventStore
+from src.evaluation.score_tally import ScoreTally
+from src.a2a.call_policy import CallPolicy
+from src.a2a.messenger import ConnectionPool, Messenger
 
 
 @pytest.fixture
@@ -35,12 +44,68 @@ def mock_game_data():
     game_data.participants = {}
     game_data.speaking_order = {}
     game_data.chat_history = {}
+    game_data.transcripts = {}
     game_data.bids = {}
     game_data.votes = {}
     game_data.eliminations = {}
     game_data.events = {}
+    game_data.event_store = EventStore()
+    game_data.score_tally = ScoreTally()
+    game_data.timed_out = False
+    game_data.record_event = lambda round_num, event: GameData.record_event(game_data, round_num, event)
+    game_data.record_vote = lambda vote: GameData.record_vote(game_data, vote)
     game_data.seer_checks = []
     game_data.latest_werewolf_kill = None
+    game_data.sealed_bidding = False
+    game_data.sealed_voting = False
+    game_data.action_timeout = None
+    game_data.debate_mode = DebateMode.SEQUENTIAL
+    game_data.prompt_style = PromptStyle.VERBOSE
+    game_data.prompt_tokens = {}
+    game_data.max_response_retries = 2
+    game_data.response_repairs = {}
+    game_data.werewolf = None
+    game_data.werewolves = []
+    game_data.get_werewolves = lambda: GameData.get_werewolves(game_data)
+    game_data.seer = None
+    # Use the real message/transcript bookkeeping against the mock's attributes
+    game_data.record_message = lambda message: GameData.record_message(game_data, message)
+    game_data.get_transcript = lambda round_num: GameData.get_transcript(game_data, round_num)
+    game_data.aliases = AliasRegistry()
+    game_data.alias_for = lambda player_id: GameData.alias_for(game_data, player_id)
+    game_data.resolve_alias = lambda value: GameData.resolve_alias(game_data, value)
+    # Liveness queries answered from the mocked participants dict
+    def living():
+        return game_data.participants.get(game_data.current_round, [])
+
+    game_data.is_alive = lambda player_id: any(p.id == player_id for p in living())
+    game_data.count_alive = lambda *roles: sum(1 for p in living() if not roles or p.role in roles)
+    game_data.check_winner = lambda: GameData.check_winner(game_data)
+    game_data.get_participant = lambda player_id: next(
+        (p for members in game_data.participants.values() for p in members if p.id == player_id), None
+    )
+    game_data.get_player_index = lambda: PlayerIndex(
+        [p.id for members in game_data.participants.values() for p in members], game_data.aliases.to_dict()
+    )
+    game_data.record_response_repair = lambda *args, **kwargs: GameData.record_response_repair(game_data, *args, **kwargs)
+    return game_data
+
+
+@pytest.fixture
+def game_data():
+    """Real GameData with 1 werewolf, 1 seer and 3 villagers in round 1."""
+    game_data = GameData(current_round=1, turns_to_speak_per_round=1)
+    roles = [("werewolf_1", Role.WEREWOLF), ("seer_1", Role.SEER)] + [(f"villager_{i}", Role.VILLAGER) for i in range(1, 4)]
+    players = [
+        Participant(id=pid, role=role, game_data=game_data, use_llm=True, messenger=None)
+        for pid, role in roles
+    ]
+    game_data.register_participants(players)
+    game_data.werewolf = players[0]
+    game_data.werewolves = [players[0]]
+    game_data.seer = players[1]
+    # P1=werewolf_1, P2=seer_1, P3..P5=villager_1..3
+    game_data.aliases.assign(pid for pid, _ in roles)
     return game_data
 
 
@@ -121,6 +186,7 @@ def sample_participants(mock_game_data, mock_messenger):
     mock_game_data.participants = {1: participants_list}
     mock_game_data.speaking_order = {1: [p.id for p in participants_list]}
     mock_game_data.werewolf = participants["werewolf"]
+    mock_game_data.werewolves = [participants["werewolf"]]
     mock_game_data.seer = participants["seer"]
     mock_game_data.villagers = [participants["villager1"], participants["villager2"], participants["villager3"]]
 
@@ -178,3 +244,72 @@ def debate_message_response():
 def agent_url():
     """Default agent URL for testing."""
     return "http://localhost:9999"
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when a test sets now."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """A FakeClock starting at 0."""
+    return FakeClock()
+
+
+class FakeSend:
+    """Replacement for send_with_client driven by a list of outcomes: an exception or (delay, text)."""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def __call__(self, client, message, context_id=None, timeout=None):
+        outcome = self.outcomes[min(self.calls, len(self.outcomes) - 1)]
+        self.calls += 1
+        if isinstance(outcome, BaseException):
+            raise outcome
+        delay, result = outcome
+        await asyncio.sleep(delay)
+        if isinstance(result, BaseException):
+            raise result
+        return {"response": result, "context_id": "ctx", "status": "completed"}
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    """Let every connection pool hand out a dummy A2A client without fetching an agent card."""
+    async def fake_get_client(self, url, streaming=False, timeout=None):
+        return object()
+
+    monkeypatch.setattr(ConnectionPool, "get_client", fake_get_client)
+
+
+@pytest.fixture
+def send_outcomes(monkeypatch, fake_client):
+    """Install a FakeSend for the given outcomes as the messenger's transport and return it."""
+    def install(outcomes):
+        send = FakeSend(outcomes)
+        monkeypatch.setattr("src.a2a.messenger.send_with_client", send)
+        return send
+
+    return install
+
+
+async def no_sleep(delay):
+    pass
+
+
+@pytest.fixture
+def messenger_with(send_outcomes):
+    """Build a Messenger whose calls follow the given outcomes, with retries that don't sleep."""
+    def build(outcomes, **policy):
+        send = send_outcomes(outcomes)
+        return Messenger(policy=CallPolicy(sleep=no_sleep, **policy)), send
+
+    return build
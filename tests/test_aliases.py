@@ -0,0 +1,78 @@
+import pytest
+
+from src.game.AliasRegistry import AliasRegistry
+from src.game.analytics import compute_game_analytics
+
+
+class TestAliasRegistry:
+    """Test suite for per-game player aliases."""
+
+    def test_assigns_in_order(self):
+        """Test that aliases are handed out P1..Pn in assignment order."""
+        registry = AliasRegistry()
+        registry.assign(["uuid-b", "uuid-a"])
+
+        assert registry.alias("uuid-b") == "P1"
+        assert registry.alias("uuid-a") == "P2"
+        assert registry.alias("uuid-c") == "P3"
+
+    def test_resolve_round_trip(self):
+        """Test that aliases map back to real IDs, ignoring case and whitespace."""
+        registry = AliasRegistry()
+        registry.assign(["uuid-a", "uuid-b"])
+
+        assert registry.resolve("P2") == "uuid-b"
+        assert registry.resolve(" p1 ") == "uuid-a"
+
+    def test_unknown_values_pass_through(self):
+        """Test that real IDs and unknown text are returned unchanged."""
+        registry = AliasRegistry()
+        registry.assign(["uuid-a"])
+
+        assert registry.resolve("uuid-a") == "uuid-a"
+        assert registry.resolve("P9") == "P9"
+        assert registry.resolve(None) is None
+
+
+class TestAliasesInGame:
+    """Test suite for aliases in prompts, replies and analytics."""
+
+    def test_prompts_show_only_aliases(self, game_data):
+        """Test that prompts never contain the real player IDs."""
+        game_data.speaking_order[1] = ["seer_1", "villager_1"]
+        game_data.latest_werewolf_kill = "villager_3"
+        werewolf, seer, villager = game_data.participants[1][:3]
+
+        prompts = [
+            villager.get_debate_prompt(),
+            villager.get_vote_prompt(),
+            werewolf.get_werewolf_prompt(),
+            seer.get_seer_prompt(),
+        ]
+
+        for prompt in prompts:
+            assert "villager_" not in prompt and "seer_1" not in prompt and "werewolf_1" not in prompt
+        assert "Speaking order: P2, P3" in prompts[0]
+        assert "Last night, P5 was eliminated" in prompts[0]
+
+    @pytest.mark.asyncio
+    async def test_reply_mapped_to_real_id(self, game_data):
+        """Test that a player_id alias in a reply is resolved before phases see it."""
+        villager = game_data.participants[1][2]
+
+        async def reply(prompt):
+            return '{"player_id": "P1", "reason": "suspicious"}'
+
+        villager.llm = type("FakeLLM", (), {"execute_prompt_async": staticmethod(reply)})()
+
+        response = await villager.talk_to_agent(villager.get_vote_prompt())
+
+        assert response["player_id"] == "werewolf_1"
+
+    def test_aliases_recorded_in_analytics(self, game_data):
+        """Test that the alias table is part of the game analytics."""
+
+        analytics = compute_game_analytics(game_data)
+
+        assert analytics["aliases"]["P1"] == "werewolf_1"
+        assert len(analytics["aliases"]) == 5
@@ -1,9 +1,11 @@
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock
 
 from src.phases.bidding import Bidding
 from src.models.Bid import Bid
 from src.models.enum.EventType import EventType
+from src.a2a.circuit_breaker import CircuitOpenError
 
 
 class TestBiddingPhase:
@@ -182,3 +184,115 @@ class TestBiddingPhase:
 
         # Verify max bid is first in speaking order
         assert mock_game.state.speaking_order[1][0] == "werewolf_1"
+
+
+class TestSealedBidding:
+    """Test suite for sealed (concurrent) bidding."""
+
+    @pytest.mark.asyncio
+    async def test_sealed_bids_sent_concurrently(self, mock_game, mock_messenger, sample_participants):
+        """Test that all bid prompts are in flight at the same time."""
+        bidding = Bidding(mock_game, mock_messenger)
+        participants = list(sample_participants.values())
+        in_flight = 0
+        peak = 0
+
+        async def slow_bid(prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"bid_amount": 50, "reason": "sealed"}
+
+        for participant in participants:
+            participant.talk_to_agent.side_effect = slow_bid
+
+        mock_game.state.sealed_bidding = True
+        mock_game.state.current_round = 1
+        mock_game.state.participants = {1: participants}
+        mock_game.state.bids = {}
+
+        await bidding.collect_round_bids()
+
+        assert peak == len(participants)
+        assert len(mock_game.state.bids[1]) == len(participants)
+
+    @pytest.mark.asyncio
+    async def test_sealed_bids_committed_in_participant_order(self, mock_game, mock_messenger, sample_participants):
+        """Test that bids are stored in participant order even when answers arrive out of order."""
+        bidding = Bidding(mock_game, mock_messenger)
+        participants = list(sample_participants.values())
+
+        for index, participant in enumerate(participants):
+            async def bid(prompt, index=index):
+                # Later participants answer first
+                await asyncio.sleep(0.01 * (len(participants) - index))
+                return {"bid_amount": 50, "reason": "tie"}
+            participant.talk_to_agent.side_effect = bid
+
+        mock_game.state.sealed_bidding = True
+        mock_game.state.current_round = 1
+        mock_game.state.participants = {1: participants}
+        mock_game.state.bids = {}
+
+        await bidding.run()
+
+        assert [b.participant_id for b in mock_game.state.bids[1]] == [p.id for p in participants]
+        # Tied bids keep participant order, exactly as in sequential bidding
+        assert mock_game.state.speaking_order[1] == [p.id for p in participants]
+
+    @pytest.mark.asyncio
+    async def test_sealed_bid_timeout_bids_zero(self, mock_game, mock_messenger, sample_participants):
+        """Test that a participant who misses the timeout bids 0 and speaks last."""
+        bidding = Bidding(mock_game, mock_messenger)
+        participants = list(sample_participants.values())
+
+        for participant in participants:
+            participant.talk_to_agent.return_value = {"bid_amount": 40, "reason": "fast"}
+
+        async def hang(prompt):
+            await asyncio.sleep(10)
+
+        sample_participants["werewolf"].talk_to_agent.side_effect = hang
+
+        mock_game.state.sealed_bidding = True
+        mock_game.state.action_timeout = 0.05
+        mock_game.state.current_round = 1
+        mock_game.state.participants = {1: participants}
+        mock_game.state.bids = {}
+
+        await bidding.run()
+
+        werewolf_bid = next(b for b in mock_game.state.bids[1] if b.participant_id == "werewolf_1")
+        assert werewolf_bid.amount == 0
+        assert mock_game.state.speaking_order[1][-1] == "werewolf_1"
+
+    @pytest.mark.asyncio
+    async def test_sealed_bid_error_cancels_other_bids(self, mock_game, mock_messenger, sample_participants):
+        """Test that one bid raising cancels the bids still in flight before the error propagates."""
+        bidding = Bidding(mock_game, mock_messenger)
+        participants = list(sample_participants.values())
+        cancelled = []
+
+        for participant in participants:
+            async def hang(prompt, participant_id=participant.id):
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(participant_id)
+                    raise
+            participant.talk_to_agent.side_effect = hang
+        sample_participants["werewolf"].talk_to_agent.side_effect = CircuitOpenError("http://localhost:8001")
+
+        mock_game.state.sealed_bidding = True
+        mock_game.state.current_round = 1
+        mock_game.state.participants = {1: participants}
+        mock_game.state.bids = {}
+
+        with pytest.raises(CircuitOpenError):
+            await bidding.collect_round_bids()
+
+        others = [p.id for p in participants if p.id != "werewolf_1"]
+        assert sorted(cancelled) == sorted(others)
+        assert 1 not in mock_game.state.bids or not mock_game.state.bids[1]
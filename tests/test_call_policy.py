@@ -0,0 +1,117 @@
+import httpx
+import pytest
+from a2a.client.errors import A2AClientHTTPError, A2AClientJSONError, A2AClientTimeoutError
+
+from src.a2a.call_policy import CallPolicy, LatencyWindow, is_retryable
+
+
+URL = "http://localhost:8001"
+
+
+class TestCallPolicy:
+    """Test suite for the retry/hedge rules."""
+
+    def test_retryable_errors(self):
+        """Test which errors are worth another attempt."""
+        assert is_retryable(httpx.ConnectError("down"))
+        assert is_retryable(httpx.ReadTimeout("slow"))
+        assert is_retryable(A2AClientTimeoutError("slow"))
+        assert is_retryable(A2AClientHTTPError(503, "unavailable"))
+        assert is_retryable(A2AClientHTTPError(429, "slow down"))
+        assert not is_retryable(A2AClientHTTPError(404, "not found"))
+        assert not is_retryable(A2AClientJSONError("bad payload"))
+        assert not is_retryable(RuntimeError("task failed"))
+
+    def test_backoff_is_jittered_and_capped(self):
+        """Test full-jitter backoff bounds."""
+        policy = CallPolicy(base_delay=1.0, max_delay=5.0, rng=lambda: 1.0)
+
+        assert [policy.backoff(attempt) for attempt in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+        assert CallPolicy(rng=lambda: 0.25, base_delay=2.0).backoff(1) == 1.0
+
+    def test_hedge_delay_needs_samples(self):
+        """Test that hedging waits for enough latency samples and uses the quantile."""
+        window = LatencyWindow()
+        policy = CallPolicy(hedge=True, min_hedge_samples=20, hedge_quantile=0.95)
+        for i in range(19):
+            window.record(i / 10)
+
+        assert policy.hedge_delay(window) is None
+        window.record(1.9)
+        assert policy.hedge_delay(window) == pytest.approx(1.9)
+        assert CallPolicy(hedge=False).hedge_delay(window) is None
+
+
+class TestMessengerRetries:
+    """Test suite for retries in Messenger.talk_to_agent."""
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors(self, messenger_with):
+        """Test that a transport error is retried and the retry is recorded."""
+        messenger, send = messenger_with([httpx.ConnectError("down"), (0, "ok")], max_retries=2)
+
+        assert await messenger.talk_to_agent("hi", URL) == "ok"
+        assert send.calls == 2
+        stats = messenger.call_stats()
+        assert stats["retries"] == 1
+        assert stats["retry_errors"] == {"ConnectError": 1}
+        assert stats["retry_log"] == [{"url": URL, "attempt": 1, "error": "ConnectError", "delay_s": pytest.approx(0.0, abs=0.5)}]
+
+    @pytest.mark.asyncio
+    async def test_retries_are_bounded(self, messenger_with):
+        """Test that the last error is raised once retries run out."""
+        messenger, send = messenger_with([httpx.ConnectError("down")], max_retries=2)
+
+        with pytest.raises(httpx.ConnectError):
+            await messenger.talk_to_agent("hi", URL)
+        assert send.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_fails_fast(self, messenger_with):
+        """Test that a permanent error is not retried."""
+        messenger, send = messenger_with([A2AClientHTTPError(404, "not found")], max_retries=2)
+
+        with pytest.raises(A2AClientHTTPError):
+            await messenger.talk_to_agent("hi", URL)
+        assert send.calls == 1
+        assert messenger.retries == []
+
+
+class TestMessengerHedging:
+    """Test suite for hedged requests."""
+
+    def warm_up(self, messenger, seconds=0.01, samples=20):
+        for _ in range(samples):
+            messenger.pool.latency_for(URL).record(seconds)
+
+    @pytest.mark.asyncio
+    async def test_slow_call_is_hedged(self, messenger_with):
+        """Test that the duplicate answers first when the original is slow."""
+        messenger, send = messenger_with([(1.0, "slow"), (0, "fast")], hedge=True)
+        self.warm_up(messenger)
+
+        assert await messenger.talk_to_agent("hi", URL) == "fast"
+        assert send.calls == 2
+        assert messenger.call_stats()["hedges"] == 1
+        assert messenger.call_stats()["hedge_wins"] == 1
+        assert messenger.call_stats()["hedge_log"] == [{"url": URL, "delay_s": 0.01, "won": True}]
+
+    @pytest.mark.asyncio
+    async def test_fast_call_is_not_hedged(self, messenger_with):
+        """Test that a call finishing within the hedge delay sends no duplicate."""
+        messenger, send = messenger_with([(0, "fast")], hedge=True)
+        self.warm_up(messenger, seconds=0.5)
+
+        assert await messenger.talk_to_agent("hi", URL) == "fast"
+        assert send.calls == 1
+        assert messenger.hedges == []
+
+    @pytest.mark.asyncio
+    async def test_hedge_survives_failed_original(self, messenger_with):
+        """Test that the original failing after the hedge went out does not fail the call."""
+        messenger, send = messenger_with([(0.05, httpx.ReadError("reset")), (0.1, "hedged")], hedge=True)
+        self.warm_up(messenger)
+
+        assert await messenger.talk_to_agent("hi", URL) == "hedged"
+        assert messenger.hedges[0]["won"] is True
+        assert messenger.retries == []
@@ -0,0 +1,166 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.a2a.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+
+
+URL = "http://localhost:8001"
+
+
+class TestCircuitBreaker:
+    """Test suite for the per-URL circuit breaker."""
+
+    def test_opens_after_consecutive_failures(self, clock):
+        """Test that the breaker opens at the failure threshold and then rejects calls."""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+
+        for _ in range(2):
+            assert breaker.allow()
+            breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.record_failure()
+
+        assert breaker.is_open
+        assert not breaker.allow()
+        assert breaker.stats()["rejected"] == 1
+
+    def test_success_resets_failure_count(self, clock):
+        """Test that only consecutive failures count."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=clock)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_allows_one_probe(self, clock):
+        """Test that after the reset timeout a single probe goes through."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 30
+        assert breaker.allow()
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert not breaker.allow()
+
+        breaker.record_success(probe=True)
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow()
+
+    def test_failed_probe_reopens(self, clock):
+        """Test that a failed probe re-opens the breaker for another timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 30
+        breaker.allow()
+
+        breaker.record_failure(probe=True)
+
+        assert breaker.is_open
+        clock.now = 59
+        assert not breaker.allow()
+        clock.now = 60
+        assert breaker.allow()
+
+    def test_cancelled_probe_frees_slot(self, clock):
+        """Test that an abandoned probe lets the next caller probe instead."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=1, clock=clock)
+        breaker.record_failure()
+        clock.now = 1
+        breaker.allow()
+
+        breaker.record_cancelled(probe=True)
+
+        assert breaker.allow()
+
+    def test_late_success_does_not_close_open_breaker(self, clock):
+        """Test that a call started before the breaker opened cannot close it by succeeding late."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+
+        breaker.record_success()
+
+        assert breaker.is_open
+        assert breaker.stats()["consecutive_failures"] == 1
+        assert not breaker.allow()
+
+    def test_late_outcomes_do_not_settle_the_probe(self, clock):
+        """Test that while half-open only the probe's own outcome closes, re-opens or frees the breaker."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 30
+        assert breaker.allow()
+
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_cancelled()
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert not breaker.allow()
+        breaker.record_success(probe=True)
+        assert breaker.state == CircuitState.CLOSED
+
+
+class TestMessengerBreaker:
+    """Test suite for circuit breaking in Messenger.talk_to_agent."""
+
+    @pytest.mark.asyncio
+    async def test_fails_fast_once_open(self, messenger_with):
+        """Test that calls stop reaching the agent after the breaker opens."""
+        messenger, send = messenger_with([httpx.ConnectError("down")], max_retries=1)
+        messenger.pool.failure_threshold = 3
+
+        for _ in range(3):
+            with pytest.raises(httpx.ConnectError):
+                await messenger.talk_to_agent("hi", URL)
+        with pytest.raises(CircuitOpenError):
+            await messenger.talk_to_agent("hi again", URL)
+
+        assert send.calls == 6
+        assert messenger.pool.breaker_stats()[URL]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_exhausted_call_counts_once(self, messenger_with):
+        """Test that a call failing every attempt is one failure towards the threshold."""
+        messenger, _ = messenger_with([httpx.ConnectError("down")], max_retries=2)
+
+        with pytest.raises(httpx.ConnectError):
+            await messenger.talk_to_agent("hi", URL)
+
+        assert messenger.pool.breaker_stats()[URL] == {
+            "state": "closed", "consecutive_failures": 1, "times_opened": 0, "rejected": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_is_not_hedged(self, messenger_with, clock):
+        """Test that a recovering agent gets a single probe even when hedging is on."""
+        messenger, send = messenger_with([(0.05, "ok")], hedge=True, min_hedge_samples=1)
+        messenger.pool.latency_for(URL).record(0.001)
+        breaker = messenger.pool.breakers[URL] = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 30
+
+        assert await messenger.talk_to_agent("probe", URL) == "ok"
+
+        assert send.calls == 1
+        assert messenger.hedges == []
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_late_success_keeps_breaker_open(self, messenger_with):
+        """Test that a slow call finishing after other calls opened the breaker leaves it open."""
+        messenger, _ = messenger_with([(0.05, "late"), httpx.ConnectError("down")])
+        messenger.pool.failure_threshold = 1
+
+        slow = asyncio.create_task(messenger.talk_to_agent("slow", URL))
+        await asyncio.sleep(0)
+        with pytest.raises(httpx.ConnectError):
+            await messenger.talk_to_agent("fails", URL)
+
+        assert await slow == "late"
+        assert messenger.pool.breaker_stats()[URL]["state"] == "open"
+        with pytest.raises(CircuitOpenError):
+            await messenger.talk_to_agent("rejected", URL)
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from src.a2a.concurrency import AdaptiveLimiter
+
+
+async def call(limiter, clock, latency, error=None):
+    async with limiter.slot():
+        clock.now += latency
+        if error:
+            raise error
+
+
+class TestAdaptiveLimiter:
+    """Test suite for the AIMD concurrency limiter."""
+
+    @pytest.mark.asyncio
+    async def test_grows_while_latency_is_flat(self, clock):
+        """Test additive increase when the limit is in use and latency holds."""
+        limiter = AdaptiveLimiter(initial_limit=1, clock=clock)
+
+        for _ in range(10):
+            await call(limiter, clock, 0.1)
+
+        assert limiter.current_limit > 1
+        assert limiter.decreases == 0
+
+    @pytest.mark.asyncio
+    async def test_latency_spike_shrinks_limit(self, clock):
+        """Test multiplicative decrease when a call is much slower than the baseline."""
+        limiter = AdaptiveLimiter(initial_limit=8, backoff_ratio=0.5, clock=clock)
+        await call(limiter, clock, 0.1)
+        before = limiter.limit
+
+        await call(limiter, clock, 1.0)
+
+        assert limiter.limit == pytest.approx(before * 0.5)
+        assert limiter.decreases == 1
+
+    @pytest.mark.asyncio
+    async def test_error_shrinks_limit(self, clock):
+        """Test that a failed call decreases the limit and re-raises."""
+        limiter = AdaptiveLimiter(initial_limit=8, backoff_ratio=0.5, clock=clock)
+
+        with pytest.raises(ConnectionError):
+            await call(limiter, clock, 0.1, ConnectionError("down"))
+
+        assert limiter.current_limit == 4
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_limit_stays_within_bounds(self, clock):
+        """Test the min/max limits."""
+        limiter = AdaptiveLimiter(initial_limit=2, min_limit=1, max_limit=3, clock=clock)
+
+        for _ in range(10):
+            with pytest.raises(ConnectionError):
+                await call(limiter, clock, 0.1, ConnectionError("down"))
+        assert limiter.current_limit == 1
+
+        for _ in range(50):
+            await call(limiter, clock, 0.1)
+        assert limiter.limit <= 3
+
+    @pytest.mark.asyncio
+    async def test_caps_in_flight_calls(self):
+        """Test that no more than the limit run at once."""
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=2)
+        running = 0
+        peak = 0
+
+        async def work():
+            nonlocal running, peak
+            async with limiter.slot():
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*[work() for _ in range(6)])
+
+        assert peak == 2
+        assert limiter.stats()["peak_in_flight"] == 2
+
+    @pytest.mark.asyncio
+    async def test_one_decrease_per_burst(self):
+        """Test that calls already in flight at a decrease don't decrease again."""
+        limiter = AdaptiveLimiter(initial_limit=4, backoff_ratio=0.5)
+        gate = asyncio.Event()
+
+        async def failing():
+            async with limiter.slot():
+                await gate.wait()
+                raise ConnectionError("down")
+
+        tasks = [asyncio.create_task(failing()) for _ in range(4)]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert limiter.decreases == 1
+        assert limiter.current_limit == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_frees_slot(self):
+        """Test that cancellation releases the slot without adjusting the limit."""
+        limiter = AdaptiveLimiter(initial_limit=1)
+
+        async def hang():
+            async with limiter.slot():
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(hang())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert limiter.in_flight == 0
+        assert limiter.decreases == 0
+        async with limiter.slot():
+            pass
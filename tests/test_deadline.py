@@ -0,0 +1,158 @@
+import asyncio
+
+import pytest
+
+from src.a2a.agent import GreenAgent
+from src.a2a.messenger import Messenger
+from src.game.analytics import compute_game_analytics
+from src.models.enum.Role import Role
+from src.services.deadline import Deadline, DeadlineExceeded, current_deadline, within_deadline
+
+
+class TestDeadline:
+    """Test suite for nested time budgets."""
+
+    def test_remaining_respects_parent(self, clock):
+        """Test that a game budget is capped by what is left of the evaluation's."""
+        evaluation = Deadline(100, clock=clock)
+        clock.now = 95
+        game = Deadline(30, parent=evaluation, clock=clock)
+
+        assert game.remaining() == 5
+        assert Deadline(clock=clock).remaining() is None
+        assert Deadline(parent=evaluation, clock=clock).remaining() == 5
+
+    def test_timeout_caps_default_and_raises_when_spent(self, clock):
+        """Test the per-call timeout derived from the budget."""
+        deadline = Deadline(10, clock=clock)
+
+        assert deadline.timeout(300) == 10
+        assert deadline.timeout(3) == 3
+        clock.now = 10
+        assert deadline.expired
+        with pytest.raises(DeadlineExceeded):
+            deadline.timeout(300)
+
+    @pytest.mark.asyncio
+    async def test_tasks_inherit_active_deadline(self):
+        """Test that tasks created inside activate() see the deadline."""
+        deadline = Deadline(60)
+
+        async def read_deadline():
+            return current_deadline()
+
+        with deadline.activate():
+            seen = await asyncio.create_task(read_deadline())
+
+        assert seen is deadline
+        assert current_deadline() is None
+
+    @pytest.mark.asyncio
+    async def test_within_deadline_interrupts_work(self):
+        """Test that running past the budget raises DeadlineExceeded."""
+        with Deadline(0.01).activate():
+            with pytest.raises(DeadlineExceeded):
+                async with within_deadline():
+                    await asyncio.sleep(1)
+
+    @pytest.mark.asyncio
+    async def test_within_deadline_without_budget(self):
+        """Test that without an active deadline nothing is bounded."""
+        async with within_deadline() as deadline:
+            await asyncio.sleep(0)
+
+        assert deadline is None
+
+    @pytest.mark.asyncio
+    async def test_inner_timeouts_pass_through(self):
+        """Test that a timeout not caused by the budget is re-raised as-is."""
+        with Deadline(60).activate():
+            with pytest.raises(asyncio.TimeoutError):
+                async with within_deadline():
+                    await asyncio.wait_for(asyncio.sleep(1), 0.01)
+
+
+class TestMessengerBudget:
+    """Test suite for budgets applied to Messenger.talk_to_agent."""
+
+    @pytest.fixture
+    def sent(self, monkeypatch):
+        sent = []
+
+        async def fake_send(client, message, context_id=None, timeout=None):
+            sent.append(timeout)
+            return {"response": "{}", "context_id": "ctx", "status": "completed"}
+
+        monkeypatch.setattr("src.a2a.messenger.send_with_client", fake_send)
+        return sent
+
+    @pytest.mark.asyncio
+    async def test_call_gets_remaining_budget_as_timeout(self, sent, fake_client):
+        """Test that the per-call timeout is the time left in the budget."""
+        messenger = Messenger()
+
+        with Deadline(20).activate():
+            await messenger.talk_to_agent("hi", "http://localhost:8001")
+        await messenger.talk_to_agent("hi", "http://localhost:8001")
+
+        assert 19 < sent[0] <= 20
+        assert sent[1] == 300
+
+    @pytest.mark.asyncio
+    async def test_spent_budget_fails_before_sending(self, sent, clock):
+        """Test that no call goes out once the budget is gone."""
+        deadline = Deadline(5, clock=clock)
+        clock.now = 5
+
+        with deadline.activate():
+            with pytest.raises(DeadlineExceeded):
+                await Messenger().talk_to_agent("hi", "http://localhost:8001")
+
+        assert sent == []
+
+
+class TestTimeoutOutcome:
+    """Test suite for games ended by their time budget."""
+
+    def test_analytics_report_timeout(self, game_data):
+        """Test that a timed-out game has no winner and is flagged."""
+        game_data.declare_timeout()
+
+        analytics = compute_game_analytics(game_data)
+
+        assert analytics["timed_out"] is True
+        assert analytics["winner"] is None
+
+    def test_aggregate_counts_timeouts_separately(self):
+        """Test that a timeout is neither a win nor a loss."""
+        games = [
+            {"winner": "villagers", "participant_role": "VILLAGER", "timed_out": False},
+            {"winner": None, "participant_role": "VILLAGER", "timed_out": True},
+            {"winner": "werewolf", "participant_role": "VILLAGER", "timed_out": False},
+        ]
+
+        aggregate = GreenAgent().compute_aggregate_analytics({Role.VILLAGER: games}, "http://localhost:8001")
+
+        stats = aggregate["by_role"]["VILLAGER"]
+        assert (stats["wins"], stats["losses"], stats["timeouts"]) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_game_ends_with_timeout_outcome(self, monkeypatch):
+        """Test that run_single_game turns an exhausted budget into a timed-out game."""
+        agent = GreenAgent()
+        agent.config = agent.config.model_copy(update={"game_time_budget": 0.05})
+
+        async def stuck_round(self):
+            await asyncio.sleep(0)
+            async with within_deadline():
+                await asyncio.sleep(10)
+
+        monkeypatch.setattr("src.game.Game.Game.run_round", stuck_round)
+        monkeypatch.setattr(GreenAgent, "init_game", lambda self, game, messenger, url, role: None)
+
+        updater = type("Updater", (), {"update_status": staticmethod(lambda *a, **k: asyncio.sleep(0))})()
+        analytics = await agent.run_single_game("http://localhost:8001", Role.VILLAGER, updater)
+
+        assert analytics["timed_out"] is True
+        assert analytics["winner"] is None
+        await agent.messenger.close()
@@ -1,8 +1,10 @@
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock
 
 from src.phases.debate import Debate
 from src.models.Message import Message
+from src.models.enum.DebateMode import DebateMode
 
 
 class TestDebatePhase:
@@ -161,3 +163,84 @@ class TestDebatePhase:
         # Verify get_debate_prompt was called on each participant
         for participant in sample_participants.values():
             participant.get_debate_prompt.assert_called()
+
+
+class TestSimultaneousDebate:
+    """Test suite for the simultaneous-statement debate mode."""
+
+    def setup_state(self, mock_game, participant_list, turns=1):
+        mock_game.state.debate_mode = DebateMode.SIMULTANEOUS
+        mock_game.state.current_round = 1
+        mock_game.state.turns_to_speak_per_round = turns
+        mock_game.state.participants = {1: participant_list}
+        mock_game.state.chat_history = {}
+
+    @pytest.mark.asyncio
+    async def test_speakers_run_concurrently(self, mock_game, mock_messenger, sample_participants):
+        """Test that every speaker in a turn is prompted at once."""
+        debate = Debate(mock_game, mock_messenger)
+        participant_list = list(sample_participants.values())
+        in_flight = 0
+        peak = 0
+
+        async def speak(prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"message": "hello"}
+
+        for participant in participant_list:
+            participant.talk_to_agent.side_effect = speak
+
+        self.setup_state(mock_game, participant_list)
+        mock_game.state.speaking_order = {1: [p.id for p in participant_list]}
+
+        await debate.run()
+
+        assert peak == len(participant_list)
+        assert len(mock_game.state.chat_history[1]) == len(participant_list)
+
+    @pytest.mark.asyncio
+    async def test_messages_appended_in_bid_order(self, mock_game, mock_messenger, sample_participants):
+        """Test that messages land in speaking order regardless of completion order."""
+        debate = Debate(mock_game, mock_messenger)
+        participant_list = list(sample_participants.values())
+        custom_order = ["seer_1", "werewolf_1", "villager_1", "villager_2", "villager_3"]
+
+        for participant in participant_list:
+            delay = 0.01 * (len(custom_order) - custom_order.index(participant.id))
+            async def speak(prompt, participant=participant, delay=delay):
+                await asyncio.sleep(delay)
+                return {"message": f"from {participant.id}"}
+            participant.talk_to_agent.side_effect = speak
+
+        self.setup_state(mock_game, participant_list)
+        mock_game.state.speaking_order = {1: custom_order}
+
+        await debate.run()
+
+        assert [m.sender_id for m in mock_game.state.chat_history[1]] == custom_order
+
+    @pytest.mark.asyncio
+    async def test_speakers_see_previous_turn_only(self, mock_game, mock_messenger, sample_participants):
+        """Test that prompts are built from the transcript as of the end of the previous turn."""
+        debate = Debate(mock_game, mock_messenger)
+        participant_list = list(sample_participants.values())
+        seen_history_sizes = []
+
+        for participant in participant_list:
+            def build_prompt():
+                seen_history_sizes.append(len(mock_game.state.chat_history.get(1, [])))
+                return "debate prompt"
+            participant.get_debate_prompt.side_effect = build_prompt
+            participant.talk_to_agent.return_value = {"message": "hello"}
+
+        self.setup_state(mock_game, participant_list, turns=2)
+        mock_game.state.speaking_order = {1: [p.id for p in participant_list]}
+
+        await debate.run()
+
+        count = len(participant_list)
+        assert seen_history_sizes == [0] * count + [count] * count
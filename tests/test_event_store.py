@@ -0,0 +1,70 @@
+from src.game.EventStore import EventStore
+from src.models.Event import Event
+from src.models.enum.EventType import EventType
+
+
+def make_store():
+    store = EventStore()
+    store.append(1, Event(type=EventType.SEER_INVESTIGATION, player="seer_1", description="checked villager_1"))
+    store.append(1, Event(type=EventType.WEREWOLF_ELIMINATION, eliminated_player="villager_1"))
+    store.append(1, Event(type=EventType.VILLAGE_ELIMINATION, eliminated_player="werewolf_2"))
+    store.append(2, Event(type=EventType.SEER_INVESTIGATION, player="seer_1", description="checked werewolf_1"))
+    store.append(2, Event(type=EventType.WEREWOLF_ELIMINATION, eliminated_player="seer_1"))
+    return store
+
+
+class TestEventStore:
+    """Test suite for the indexed event store."""
+
+    def test_of_type_across_and_within_rounds(self):
+        """Test that type queries keep append order and respect the round filter."""
+        store = make_store()
+
+        assert [e.eliminated_player for e in store.of_type(EventType.WEREWOLF_ELIMINATION)] == ["villager_1", "seer_1"]
+        assert [e.eliminated_player for e in store.of_type(EventType.WEREWOLF_ELIMINATION, 2)] == ["seer_1"]
+        assert store.of_type(EventType.VILLAGE_ELIMINATION, 2) == []
+
+    def test_latest_and_first_round(self):
+        """Test the latest-event and first-round lookups."""
+        store = make_store()
+
+        assert store.latest(EventType.SEER_INVESTIGATION).description == "checked werewolf_1"
+        assert store.latest(EventType.SEER_INVESTIGATION, 1).description == "checked villager_1"
+        assert store.latest(EventType.VILLAGE_ELIMINATION, 2) is None
+        assert store.first_round(EventType.SEER_INVESTIGATION) == 1
+        assert store.first_round(EventType.GAME_END) is None
+
+    def test_by_player_covers_actor_and_eliminated(self):
+        """Test that a player's events include both actions and their elimination."""
+        store = make_store()
+
+        events = store.by_player("seer_1")
+
+        assert [e.type for e in events] == [
+            EventType.SEER_INVESTIGATION,
+            EventType.SEER_INVESTIGATION,
+            EventType.WEREWOLF_ELIMINATION,
+        ]
+        assert store.by_player("nobody") == []
+
+    def test_in_round_and_count(self):
+        """Test round listing and counts."""
+        store = make_store()
+
+        assert len(store.in_round(1)) == 3
+        assert store.count(EventType.SEER_INVESTIGATION) == 2
+        assert store.count(EventType.WEREWOLF_ELIMINATION, 1) == 1
+        assert len(store) == 5
+
+
+class TestRecordEvent:
+    """Test suite for GameData.record_event."""
+
+    def test_event_lands_in_round_list_and_store(self, mock_game_data):
+        """Test that record_event feeds both the per-round dict and the store."""
+        event = Event(type=EventType.WEREWOLF_ELIMINATION, eliminated_player="villager_1")
+
+        mock_game_data.record_event(3, event)
+
+        assert mock_game_data.events[3] == [event]
+        assert mock_game_data.event_store.latest(EventType.WEREWOLF_ELIMINATION, 3) is event
@@ -0,0 +1,113 @@
+import pytest
+
+from src.game.Game import Game
+from src.models.enum.Role import Role
+from src.models.enum.Phase import Phase
+from src.models.enum.EliminationType import EliminationType
+from src.models.enum.EventType import EventType
+
+
+class TestEarlyWinCheck:
+    """Test suite for win-condition checks on every elimination."""
+
+    def test_no_winner_while_game_is_open(self, game_data):
+        """Test that a routine elimination does not end the game."""
+
+        game_data.eliminate_player("villager_1", EliminationType.NIGHT_KILL)
+
+        assert game_data.winner is None
+
+    def test_villagers_win_when_werewolf_eliminated(self, game_data):
+        """Test that eliminating the werewolf decides the game immediately."""
+
+        game_data.eliminate_player("werewolf_1", EliminationType.VOTED_OUT)
+
+        assert game_data.winner == "villagers"
+
+    def test_werewolf_wins_on_night_kill(self, game_data):
+        """Test that a night kill leaving one villager decides the game immediately."""
+        game_data.eliminate_player("villager_1", EliminationType.VOTED_OUT)
+        game_data.eliminate_player("villager_2", EliminationType.NIGHT_KILL)
+
+        game_data.eliminate_player("villager_3", EliminationType.NIGHT_KILL)
+
+        assert game_data.winner == "werewolf"
+
+    def test_first_decision_sticks(self, game_data):
+        """Test that a later elimination does not overwrite a declared winner."""
+        game_data.eliminate_player("werewolf_1", EliminationType.VOTED_OUT)
+
+        game_data.eliminate_player("seer_1", EliminationType.NIGHT_KILL)
+
+        assert game_data.winner == "villagers"
+
+
+class TestPackWinCheck:
+    """Test suite for win conditions with more than one werewolf."""
+
+    @pytest.fixture
+    def game_data(self, game_data):
+        """The shared game_data with villager_3 as a second werewolf."""
+        game_data.registry.set_role("villager_3", Role.WEREWOLF)
+        game_data.werewolves = [game_data.werewolf, game_data.get_participant("villager_3")]
+        return game_data
+
+    def test_lead_death_does_not_end_game(self, game_data):
+        """Test that eliminating the lead werewolf leaves the game open while the other lives."""
+        game_data.eliminate_player("werewolf_1", EliminationType.VOTED_OUT)
+
+        assert game_data.winner is None
+
+    def test_villagers_win_when_pack_eliminated(self, game_data):
+        """Test that voting out the second werewolf after the lead wins for the villagers."""
+        game_data.eliminate_player("werewolf_1", EliminationType.VOTED_OUT)
+
+        game_data.eliminate_player("villager_3", EliminationType.VOTED_OUT)
+
+        assert game_data.winner == "villagers"
+
+    def test_werewolves_win_at_parity(self, game_data):
+        """Test that werewolves win once they equal the villagers left."""
+        game_data.eliminate_player("villager_1", EliminationType.NIGHT_KILL)
+
+        assert game_data.winner == "werewolf"
+
+
+class TestRunRound:
+    """Test suite for short-circuiting a round once the game is decided."""
+
+    def stub_controllers(self, game, calls):
+        for name in ["night", "bidding", "debate", "voting", "round_end"]:
+            async def run(name=name):
+                calls.append(name)
+            getattr(game, f"{name}_controller").run = run
+
+    @pytest.mark.asyncio
+    async def test_skips_remaining_phases_after_decisive_night(self):
+        """Test that a decisive night kill skips bidding, debate, voting and round end."""
+        game = Game([])
+        calls = []
+        self.stub_controllers(game, calls)
+
+        async def decisive_night():
+            calls.append("night")
+            game.state.declare_winner("werewolf")
+
+        game.night_controller.run = decisive_night
+
+        await game.run_round()
+
+        assert calls == ["night"]
+        assert game.current_phase == Phase.GAME_END
+        assert [event.type for event in game.state.events[1]] == [EventType.ROUND_END]
+
+    @pytest.mark.asyncio
+    async def test_runs_all_phases_when_undecided(self):
+        """Test that an undecided round runs every phase in order."""
+        game = Game([])
+        calls = []
+        self.stub_controllers(game, calls)
+
+        await game.run_round()
+
+        assert calls == ["night", "bidding", "debate", "voting", "round_end"]
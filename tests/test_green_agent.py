@@ -0,0 +1,198 @@
+import asyncio
+import json
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+
+from src.a2a.agent import GreenAgent, EvaluationAborted, GAMES_PER_ROLE, ROLES_TO_EVALUATE
+from src.a2a.circuit_breaker import CircuitOpenError
+from src.models.EvalConfig import EvalConfig
+from src.models.EvalRequest import EvalRequest
+from src.models.enum.Role import Role
+
+
+PARTICIPANT_URL = "http://localhost:8001/"
+
+
+def fake_game_runner(delays):
+    """
+    Build a run_single_game stand-in. Each call sleeps for the next delay and returns
+    analytics derived from its call index, so out-of-order completion is observable.
+    """
+    calls = []
+
+    async def run_single_game(participant_url, participant_role, updater):
+        index = len(calls)
+        calls.append(participant_role)
+        await asyncio.sleep(delays[index % len(delays)])
+        won = index % 2 == 0
+        return {
+            "winner": ("werewolf" if won else "villagers") if participant_role == Role.WEREWOLF else ("villagers" if won else "werewolf"),
+            "rounds_played": index + 1,
+            "participant_role": participant_role.name,
+            "participant_score": index * 10,
+            "participant_survived": won,
+        }
+
+    return run_single_game, calls
+
+
+class TestConcurrentGames:
+    """Test suite for running the evaluation's games concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_aggregate_matches_sequential(self):
+        """Test that concurrent runs produce the same aggregate analytics as sequential runs."""
+        delays = [0.03, 0.0, 0.02, 0.01, 0.0, 0.025]
+
+        sequential = GreenAgent()
+        sequential.run_single_game, _ = fake_game_runner(delays)
+        sequential_results = await sequential.run_games(PARTICIPANT_URL, AsyncMock(), max_concurrent_games=1)
+
+        concurrent = GreenAgent()
+        concurrent.run_single_game, _ = fake_game_runner(delays)
+        concurrent_results = await concurrent.run_games(PARTICIPANT_URL, AsyncMock(), max_concurrent_games=6)
+
+        assert concurrent_results == sequential_results
+        assert (
+            concurrent.compute_aggregate_analytics(concurrent_results, PARTICIPANT_URL)
+            == sequential.compute_aggregate_analytics(sequential_results, PARTICIPANT_URL)
+        )
+
+    @pytest.mark.asyncio
+    async def test_plays_every_game(self):
+        """Test that every role plays GAMES_PER_ROLE games."""
+        agent = GreenAgent()
+        agent.run_single_game, calls = fake_game_runner([0.0])
+
+        results = await agent.run_games(PARTICIPANT_URL, AsyncMock(), max_concurrent_games=3)
+
+        assert len(calls) == GAMES_PER_ROLE * len(ROLES_TO_EVALUATE)
+        for role in ROLES_TO_EVALUATE:
+            assert len(results[role]) == GAMES_PER_ROLE
+
+    @pytest.mark.asyncio
+    async def test_respects_concurrency_limit(self):
+        """Test that no more than max_concurrent_games games are in flight at once."""
+        agent = GreenAgent()
+        in_flight = 0
+        peak = 0
+
+        async def run_single_game(participant_url, participant_role, updater):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"participant_role": participant_role.name}
+
+        agent.run_single_game = run_single_game
+
+        await agent.run_games(PARTICIPANT_URL, AsyncMock(), max_concurrent_games=2)
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_remaining_games(self):
+        """Test that one failing game cancels the others and propagates the error."""
+        agent = GreenAgent()
+        cancelled = []
+
+        async def run_single_game(participant_url, participant_role, updater):
+            if participant_role == Role.VILLAGER:
+                raise RuntimeError("participant unreachable")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(participant_role)
+                raise
+
+        agent.run_single_game = run_single_game
+
+        with pytest.raises(RuntimeError, match="participant unreachable"):
+            await agent.run_games(PARTICIPANT_URL, AsyncMock(), max_concurrent_games=6)
+
+        assert cancelled
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_aborts_with_partial_results(self):
+        """Test that an open circuit cancels the remaining games and keeps finished ones."""
+        agent = GreenAgent()
+        finished = asyncio.Event()
+
+        async def run_single_game(participant_url, participant_role, updater):
+            if participant_role == Role.VILLAGER:
+                return {"participant_role": participant_role.name, "winner": "villagers"}
+            await finished.wait()
+            raise CircuitOpenError(participant_url)
+
+        agent.run_single_game = run_single_game
+
+        async def release():
+            await asyncio.sleep(0.01)
+            finished.set()
+
+        asyncio.create_task(release())
+        with pytest.raises(EvaluationAborted) as aborted:
+            await agent.run_games(PARTICIPANT_URL, AsyncMock(), max_concurrent_games=6)
+
+        assert aborted.value.games_planned == GAMES_PER_ROLE * len(ROLES_TO_EVALUATE)
+        assert len(aborted.value.results[Role.VILLAGER]) == GAMES_PER_ROLE
+        assert aborted.value.results[Role.WEREWOLF] == []
+
+    @pytest.mark.asyncio
+    async def test_aborted_evaluation_publishes_partial_result(self):
+        """Test that run_evaluation reports an aborted run as a partial result and fails the task."""
+        agent = GreenAgent()
+        updater = AsyncMock()
+
+        async def run_games(participant_url, updater, max_concurrent_games=1):
+            raise EvaluationAborted("agent down", {role: [] for role in ROLES_TO_EVALUATE}, 6)
+
+        agent.run_games = run_games
+        request = EvalRequest(participants={"agent": PARTICIPANT_URL})
+
+        await agent.run_evaluation(request, updater)
+
+        artifact = updater.add_artifact.call_args.kwargs
+        assert artifact["name"] == "Partial Result"
+        assert "EVALUATION ABORTED" in artifact["parts"][0].root.text
+        assert artifact["parts"][1].root.data["aborted"] == {"reason": "agent down", "games_completed": 0, "games_planned": 6}
+        updater.failed.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unreachable_participant_aborts_real_games(self, monkeypatch, send_outcomes):
+        """Test that real games against an unreachable participant end in an abort once the breaker opens."""
+        async def filler_reply(self, model, prompt, settings=None):
+            return json.dumps({"player_id": "P1", "bid_amount": 1, "message": "hi", "reason": "r"})
+
+        send_outcomes([httpx.ConnectError("All connection attempts failed")])
+        monkeypatch.setattr("src.services.llm.LLMPool.generate_async", filler_reply)
+        agent = GreenAgent()
+        agent.config = EvalConfig(max_call_retries=0)
+
+        with pytest.raises(EvaluationAborted) as aborted:
+            await agent.run_games(PARTICIPANT_URL, AsyncMock(), max_concurrent_games=1)
+
+        # Failed calls are skipped until enough of them in a row open the breaker
+        assert isinstance(aborted.value.__cause__, CircuitOpenError)
+        assert agent.messenger.pool.breaker_stats()[PARTICIPANT_URL]["consecutive_failures"] == agent.config.breaker_failure_threshold
+        await agent.messenger.close()
+
+    @pytest.mark.asyncio
+    async def test_outside_cancel_is_not_an_abort(self):
+        """Test that cancelling the evaluation stays a cancellation even with the breaker open."""
+        agent = GreenAgent()
+        agent.messenger.pool.failure_threshold = 1
+        agent.messenger.pool.breaker_for(PARTICIPANT_URL).record_failure()
+
+        async def run_single_game(participant_url, participant_role, updater):
+            await asyncio.sleep(10)
+
+        agent.run_single_game = run_single_game
+        evaluation = asyncio.create_task(agent.run_games(PARTICIPANT_URL, AsyncMock(), max_concurrent_games=6))
+        await asyncio.sleep(0.01)
+        evaluation.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await evaluation
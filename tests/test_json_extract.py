@@ -0,0 +1,67 @@
+import pytest
+
+from src.services.json_extract import extract_json_object, find_json_object, repair_json
+
+
+class TestExtractJsonObject:
+    """Test suite for tolerant JSON extraction from agent replies."""
+
+    def test_bare_json(self):
+        """Test the fast path for a reply that is only the object."""
+        assert extract_json_object('{"bid_amount": 40, "reason": "r"}') == {"bid_amount": 40, "reason": "r"}
+
+    def test_fenced_json(self):
+        """Test that objects inside ```json fences are found."""
+        response = 'Sure!\n```json\n{"player_id": "P2", "reason": "quiet"}\n```'
+
+        assert extract_json_object(response)["player_id"] == "P2"
+
+    def test_prose_before_and_after(self):
+        """Test that leading prose and trailing commentary are ignored."""
+        response = 'Here is my vote: {"player_id": "P3", "reason": "they said {odd} things"} Hope that helps!'
+
+        assert extract_json_object(response) == {"player_id": "P3", "reason": "they said {odd} things"}
+
+    def test_nested_object(self):
+        """Test that nested braces are balanced."""
+        response = 'x {"a": {"b": {"c": 1}}, "d": 2} y'
+
+        assert extract_json_object(response) == {"a": {"b": {"c": 1}}, "d": 2}
+
+    def test_trailing_comma_and_single_quotes(self):
+        """Test that the light repair fixes the usual near-misses."""
+        response = "{'player_id': 'P1', 'reason': 'he said \"trust me\"',}"
+
+        assert extract_json_object(response) == {"player_id": "P1", "reason": 'he said "trust me"'}
+
+    def test_skips_unparseable_candidate(self):
+        """Test that a broken leading object does not hide a valid one after it."""
+        response = 'Thinking {not json at all} then {"message": "hi"}'
+
+        assert extract_json_object(response) == {"message": "hi"}
+
+    @pytest.mark.parametrize("response", ["no json here", '{"unterminated": "x"', "[1, 2, 3]", None])
+    def test_unrecoverable(self, response):
+        """Test that replies without an object raise ValueError."""
+        with pytest.raises(ValueError):
+            extract_json_object(response)
+
+
+class TestHelpers:
+    """Test suite for the scanner and repair helpers."""
+
+    def test_find_ignores_braces_in_strings(self):
+        """Test that quoted braces don't affect balancing."""
+        text = 'a {"k": "}{"} b'
+
+        assert find_json_object(text) == (2, 13)
+
+    def test_repair_keeps_valid_json(self):
+        """Test that valid JSON passes through repair unchanged."""
+        text = '{"a": [1, 2], "b": "x, }"}'
+
+        assert repair_json(text) == text
+
+    def test_repair_trailing_comma_in_list(self):
+        """Test that trailing commas in arrays are removed."""
+        assert repair_json('{"a": [1, 2, ], }') == '{"a": [1, 2 ] }'
@@ -0,0 +1,122 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.services.llm import LLM, LLMPool, get_llm_pool, init_llm_pool
+from src.models.Participant import Participant
+from src.models.enum.Role import Role
+
+
+def make_pool(generate_content, max_concurrent_requests=16):
+    """Create an LLMPool whose genai client is replaced by a stub async client."""
+    pool = LLMPool(max_concurrent_requests=max_concurrent_requests)
+    client = Mock()
+    client.aio.models.generate_content = generate_content
+    pool._client = client
+    return pool
+
+
+def make_llm(generate_content):
+    return LLM(pool=make_pool(generate_content))
+
+
+def tracking_generate_content():
+    """Stub generate_content that records the peak number of overlapping calls."""
+    stats = {"in_flight": 0, "peak": 0}
+
+    async def generate_content(model, contents):
+        stats["in_flight"] += 1
+        stats["peak"] = max(stats["peak"], stats["in_flight"])
+        await asyncio.sleep(0.01)
+        stats["in_flight"] -= 1
+        return Mock(text="{}")
+
+    return generate_content, stats
+
+
+class TestAsyncLLM:
+    """Test suite for the non-blocking LLM path used by filler participants."""
+
+    @pytest.mark.asyncio
+    async def test_execute_prompt_async_returns_text(self):
+        """Test that the async path returns the response text."""
+        generate_content = AsyncMock(return_value=Mock(text='{"bid_amount": 10, "reason": "x"}'))
+        llm = make_llm(generate_content)
+
+        result = await llm.execute_prompt_async("prompt")
+
+        assert result == '{"bid_amount": 10, "reason": "x"}'
+        generate_content.assert_awaited_once_with(model=llm.model, contents="prompt")
+
+    @pytest.mark.asyncio
+    async def test_calls_overlap(self):
+        """Test that several filler calls can be in flight at the same time."""
+        generate_content, stats = tracking_generate_content()
+        llm = make_llm(generate_content)
+
+        await asyncio.gather(*[llm.execute_prompt_async("prompt") for _ in range(5)])
+
+        assert stats["peak"] == 5
+
+    @pytest.mark.asyncio
+    async def test_participant_uses_async_path(self):
+        """Test that LLM participants await the async backend instead of the blocking one."""
+        llm = Mock(spec=LLM)
+        llm.execute_prompt_async = AsyncMock(return_value='{"message": "hello"}')
+        participant = Participant(
+            id="villager_1",
+            role=Role.VILLAGER,
+            game_data=None,
+            use_llm=True,
+            messenger=None,
+            llm=llm,
+        )
+
+        response = await participant.talk_to_agent("prompt")
+
+        assert response == {"message": "hello"}
+        llm.execute_prompt_async.assert_awaited_once_with(prompt="prompt")
+        llm.execute_prompt.assert_not_called()
+
+
+class TestLLMPool:
+    """Test suite for the process-wide LLM client pool."""
+
+    @pytest.mark.asyncio
+    async def test_global_concurrency_cap(self):
+        """Test that the pool caps in-flight requests across every LLM sharing it."""
+        generate_content, stats = tracking_generate_content()
+        pool = make_pool(generate_content, max_concurrent_requests=2)
+        llms = [LLM(pool=pool) for _ in range(4)]
+
+        await asyncio.gather(*[llm.execute_prompt_async("prompt") for llm in llms for _ in range(2)])
+
+        assert stats["peak"] == 2
+
+    def test_llms_share_one_client(self):
+        """Test that every LLM on a pool reuses the same genai client."""
+        pool = make_pool(AsyncMock())
+
+        assert LLM(pool=pool).client is LLM(pool=pool).client
+
+    def test_warm_up_without_api_key(self, monkeypatch):
+        """Test that warm-up reports failure instead of raising when no key is configured."""
+        monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+
+        assert LLMPool().warm_up() is False
+
+    def test_warm_up_creates_client(self, monkeypatch):
+        """Test that warm-up builds the shared client up front."""
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+        pool = LLMPool()
+
+        assert pool.warm_up() is True
+        assert pool._client is not None
+
+    def test_default_pool_is_process_wide(self):
+        """Test that LLMs without an explicit pool use the shared process-wide pool."""
+        pool = init_llm_pool(max_concurrent_requests=4)
+
+        assert get_llm_pool() is pool
+        assert LLM().get_pool() is pool
+        assert pool.max_concurrent_requests == 4
@@ -0,0 +1,94 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.services.llm import LLM, LLMPool
+from src.services.llm_cache import PromptCache
+
+
+class TestPromptCache:
+    """Test suite for the content-addressed LLM response cache."""
+
+    def test_key_depends_on_model_settings_and_prompt(self):
+        """Test that changing any key component changes the key."""
+        base = PromptCache.make_key("gemini-2.0-flash", "prompt", {"temperature": 0})
+
+        assert base == PromptCache.make_key("gemini-2.0-flash", "prompt", {"temperature": 0})
+        assert base != PromptCache.make_key("gemini-2.5-pro", "prompt", {"temperature": 0})
+        assert base != PromptCache.make_key("gemini-2.0-flash", "prompt", {"temperature": 1})
+        assert base != PromptCache.make_key("gemini-2.0-flash", "other prompt", {"temperature": 0})
+
+    def test_miss_then_hit(self):
+        """Test that a stored response is returned on the next lookup."""
+        cache = PromptCache()
+        key = PromptCache.make_key("m", "prompt")
+
+        assert cache.get(key) is None
+        cache.put(key, "response")
+
+        assert cache.get(key) == "response"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = PromptCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+    def test_disk_persistence_survives_restart(self, tmp_path):
+        """Test that entries written to disk are found by a fresh cache instance."""
+        key = PromptCache.make_key("m", "prompt")
+        PromptCache(cache_dir=str(tmp_path)).put(key, "response")
+
+        restarted = PromptCache(cache_dir=str(tmp_path))
+
+        assert restarted.get(key) == "response"
+        assert restarted.disk_hits == 1
+
+    def test_disk_backs_evicted_entries(self, tmp_path):
+        """Test that an entry evicted from memory is still served from disk."""
+        cache = PromptCache(max_entries=1, cache_dir=str(tmp_path))
+        cache.put("a" * 64, "1")
+        cache.put("b" * 64, "2")
+
+        assert cache.get("a" * 64) == "1"
+        assert cache.disk_hits == 1
+
+
+class TestLLMCaching:
+    """Test suite for the cache layer in front of LLM.execute_prompt."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_prompt_skips_gemini(self):
+        """Test that an identical prompt is answered from the cache."""
+        pool = LLMPool(cache=PromptCache())
+        pool._client = Mock()
+        pool._client.aio.models.generate_content = AsyncMock(return_value=Mock(text='{"message": "hi"}'))
+        llm = LLM(pool=pool)
+
+        first = await llm.execute_prompt_async("prompt")
+        second = await llm.execute_prompt_async("prompt")
+
+        assert first == second == '{"message": "hi"}'
+        pool._client.aio.models.generate_content.assert_awaited_once()
+        assert llm.cache_stats() == {"enabled": True, "hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    @pytest.mark.asyncio
+    async def test_no_cache_by_default(self):
+        """Test that without a cache every prompt goes to Gemini."""
+        pool = LLMPool()
+        pool._client = Mock()
+        pool._client.aio.models.generate_content = AsyncMock(return_value=Mock(text="{}"))
+        llm = LLM(pool=pool)
+
+        await llm.execute_prompt_async("prompt")
+        await llm.execute_prompt_async("prompt")
+
+        assert pool._client.aio.models.generate_content.await_count == 2
+        assert llm.cache_stats()["enabled"] is False
@@ -0,0 +1,317 @@
+import asyncio
+
+import pytest
+import httpx
+
+from a2a.types import (
+    Artifact,
+    Message,
+    Part,
+    Role,
+    Task,
+    TaskArtifactUpdateEvent,
+    TaskState,
+    TaskStatus,
+    TaskStatusUpdateEvent,
+    TextPart,
+)
+
+from src.a2a.messenger import AgentClientCache, ConnectionPool, Messenger, DEFAULT_POOL_LIMITS, stream_with_client
+
+
+class TestConnectionPool:
+    """Test suite for the pooled per-target HTTP clients."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_per_url(self):
+        """Test that the same keep-alive client is handed out for the same URL."""
+        pool = ConnectionPool()
+
+        first = pool.get_http_client("http://localhost:8001")
+        second = pool.get_http_client("http://localhost:8001")
+        other = pool.get_http_client("http://localhost:8002")
+
+        assert first is second
+        assert first is not other
+
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_all_clients(self):
+        """Test that closing the pool closes every client it created."""
+        pool = ConnectionPool()
+        clients = [pool.get_http_client(f"http://localhost:800{i}") for i in range(3)]
+
+        await pool.aclose()
+
+        assert all(c.is_closed for c in clients)
+
+    @pytest.mark.asyncio
+    async def test_recreates_closed_client(self):
+        """Test that a closed client is replaced on next use."""
+        pool = ConnectionPool()
+        client = pool.get_http_client("http://localhost:8001")
+        await client.aclose()
+
+        replacement = pool.get_http_client("http://localhost:8001")
+
+        assert replacement is not client
+        assert not replacement.is_closed
+
+        await pool.aclose()
+
+    def test_custom_limits(self):
+        """Test that pool limits are configurable."""
+        limits = httpx.Limits(max_connections=3, max_keepalive_connections=1)
+
+        assert ConnectionPool(limits).limits == limits
+        assert ConnectionPool().limits == DEFAULT_POOL_LIMITS
+
+
+class TestMessengerPooling:
+    """Test suite for Messenger pool ownership."""
+
+    @pytest.mark.asyncio
+    async def test_close_owned_pool(self):
+        """Test that a messenger closes the pool it created."""
+        messenger = Messenger()
+        client = messenger.pool.get_http_client("http://localhost:8001")
+
+        await messenger.close()
+
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_shared_pool_left_open(self):
+        """Test that a messenger does not close a pool it was given."""
+        pool = ConnectionPool()
+        messenger = Messenger(pool=pool)
+        client = pool.get_http_client("http://localhost:8001")
+
+        await messenger.close()
+
+        assert not client.is_closed
+        await pool.aclose()
+
+    def test_reset_keeps_pool(self):
+        """Test that resetting conversation state keeps pooled connections."""
+        messenger = Messenger()
+        pool = messenger.pool
+        messenger._context_ids["http://localhost:8001"] = "ctx"
+
+        messenger.reset()
+
+        assert messenger._context_ids == {}
+        assert messenger.pool is pool
+
+
+class TestAgentClientCache:
+    """Test suite for the TTL agent-card/client cache."""
+
+    @pytest.fixture
+    def created(self, monkeypatch):
+        """Replace card fetching with a counter of created clients."""
+        created = []
+
+        async def fake_create_client(httpx_client, base_url, streaming=False, timeout=None):
+            client = object()
+            created.append((base_url, client))
+            return client
+
+        monkeypatch.setattr("src.a2a.messenger.create_client", fake_create_client)
+        return created
+
+    @pytest.mark.asyncio
+    async def test_hit_after_miss(self, created):
+        """Test that the card is fetched once and then served from cache."""
+        cache = AgentClientCache(ttl=60)
+
+        first = await cache.get(None, "http://localhost:8001")
+        second = await cache.get(None, "http://localhost:8001")
+
+        assert first is second
+        assert len(created) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_entry_expires_after_ttl(self, created, clock):
+        """Test that an expired entry triggers a new card fetch."""
+        cache = AgentClientCache(ttl=60, clock=clock)
+
+        await cache.get(None, "http://localhost:8001")
+        clock.now = 61
+        await cache.get(None, "http://localhost:8001")
+
+        assert len(created) == 2
+        assert cache.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self, created):
+        """Test that invalidation forces a refetch for that URL only."""
+        cache = AgentClientCache(ttl=60)
+
+        await cache.get(None, "http://localhost:8001")
+        await cache.get(None, "http://localhost:8002")
+        cache.invalidate("http://localhost:8001")
+        await cache.get(None, "http://localhost:8001")
+        await cache.get(None, "http://localhost:8002")
+
+        assert [url for url, _ in created] == [
+            "http://localhost:8001",
+            "http://localhost:8002",
+            "http://localhost:8001",
+        ]
+        assert cache.invalidations == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_fetch(self, created):
+        """Test that concurrent first calls to one URL fetch the card once."""
+        cache = AgentClientCache(ttl=60)
+
+        results = await asyncio.gather(*[cache.get(None, "http://localhost:8001") for _ in range(5)])
+
+        assert len(created) == 1
+        assert all(r is results[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_messenger_invalidates_on_failure(self, created, monkeypatch):
+        """Test that a failed call drops the cached client for that URL."""
+        async def failing_send(client, message, context_id=None, timeout=None):
+            raise httpx.ConnectError("down")
+
+        monkeypatch.setattr("src.a2a.messenger.send_with_client", failing_send)
+        messenger = Messenger()
+
+        with pytest.raises(httpx.ConnectError):
+            await messenger.talk_to_agent("hi", "http://localhost:8001")
+
+        assert messenger.pool.clients.stats()["cached"] == 0
+        assert messenger.pool.clients.invalidations == 1
+        await messenger.close()
+
+
+def artifact_event(task, text, append=True):
+    update = TaskArtifactUpdateEvent(
+        task_id=task.id,
+        context_id=task.context_id,
+        artifact=Artifact(artifact_id="answer", parts=[Part(root=TextPart(text=text))]),
+        append=append,
+    )
+    return task, update
+
+
+class FakeStreamingClient:
+    """A2A client stand-in that yields a fixed sequence of stream events."""
+
+    def __init__(self, events):
+        self.events = events
+        self.sent = 0
+        self.closed = False
+
+    def send_message(self, message, context=None):
+        async def stream():
+            try:
+                for event in self.events:
+                    self.sent += 1
+                    yield event
+            finally:
+                self.closed = True
+        return stream()
+
+
+def make_task(state=TaskState.working):
+    return Task(id="task-1", context_id="ctx-1", status=TaskStatus(state=state))
+
+
+class TestStreaming:
+    """Test suite for streamed replies."""
+
+    def chunked_events(self):
+        working, done = make_task(), make_task(TaskState.completed)
+        return [
+            (working, None),
+            artifact_event(working, '{"player_', append=False),
+            artifact_event(working, 'id": "P3", '),
+            artifact_event(working, '"reason": "quiet"}'),
+            artifact_event(working, " and some trailing prose"),
+            (done, TaskStatusUpdateEvent(task_id="task-1", context_id="ctx-1", final=True,
+                                         status=TaskStatus(state=TaskState.completed))),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_concatenated(self):
+        """Test that appended chunks are joined without separators."""
+        client = FakeStreamingClient(self.chunked_events())
+
+        outputs = await stream_with_client(client, "prompt")
+
+        assert outputs["response"] == '{"player_id": "P3", "reason": "quiet"} and some trailing prose'
+        assert outputs["status"] == "completed"
+        assert outputs["context_id"] == "ctx-1"
+        assert outputs["chunks"] == 4
+        assert outputs["stopped_early"] is False
+
+    @pytest.mark.asyncio
+    async def test_stop_on_json_closes_stream(self):
+        """Test that reading stops at the chunk that completes the JSON object."""
+        client = FakeStreamingClient(self.chunked_events())
+
+        outputs = await stream_with_client(client, "prompt", stop_on_json=True)
+
+        assert outputs["response"] == '{"player_id": "P3", "reason": "quiet"}'
+        assert outputs["stopped_early"] is True
+        assert client.sent == 4
+        assert client.closed
+
+    @pytest.mark.asyncio
+    async def test_chunk_timings(self, clock):
+        """Test time-to-first and time-to-last chunk against the call start."""
+        events = self.chunked_events()
+
+        class TickingClient(FakeStreamingClient):
+            def send_message(self, message, context=None):
+                async def stream():
+                    for event in self.events:
+                        clock.now += 1
+                        yield event
+                return stream()
+
+        outputs = await stream_with_client(TickingClient(events), "prompt", clock=clock)
+
+        # The task snapshot at t=1 carries no text; chunks arrive at t=2..5
+        assert outputs["first_chunk_s"] == 2
+        assert outputs["last_chunk_s"] == 5
+
+    @pytest.mark.asyncio
+    async def test_message_reply(self):
+        """Test that an agent answering with a plain Message is handled."""
+        reply = Message(role=Role.agent, parts=[Part(root=TextPart(text='{"bid_amount": 5}'))],
+                        message_id="m", context_id="ctx-9")
+
+        outputs = await stream_with_client(FakeStreamingClient([reply]), "prompt", stop_on_json=True)
+
+        assert outputs["response"] == '{"bid_amount": 5}'
+        assert outputs["context_id"] == "ctx-9"
+        assert "status" not in outputs
+
+    @pytest.mark.asyncio
+    async def test_messenger_accepts_early_stop(self, monkeypatch):
+        """Test that a stream stopped before the task completed is not treated as a failure."""
+        messenger = Messenger(streaming=True, stop_on_json=True)
+        client = FakeStreamingClient(self.chunked_events())
+
+        async def fake_get_client(url, streaming=False, timeout=None):
+            assert streaming
+            return client
+
+        monkeypatch.setattr(messenger.pool, "get_client", fake_get_client)
+
+        response = await messenger.talk_to_agent("prompt", "http://localhost:8001")
+
+        assert response == '{"player_id": "P3", "reason": "quiet"}'
+        stats = messenger.call_stats()
+        assert stats["calls"] == 1
+        assert stats["stopped_early"] == 1
+        assert stats["avg_first_chunk_s"] is not None
+        await messenger.close()
@@ -1,7 +1,9 @@
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock
 
 from src.phases.night import Night
+from src.models.response.KillResponse import KillResponse
 from src.models.enum.EventType import EventType
 from src.models.enum.EliminationType import EliminationType
 
@@ -138,3 +140,172 @@ class TestNightPhase:
 
         # Verify latest kill was updated
         assert mock_game.state.latest_werewolf_kill == "villager_1"
+
+
+class TestConcurrentNight:
+    """Test suite for concurrent night actions and multi-werewolf kills."""
+
+    @pytest.fixture
+    def pack(self, sample_participants, mock_game):
+        """Make villager_3 a second werewolf."""
+        second = sample_participants["villager3"]
+        mock_game.state.werewolf = sample_participants["werewolf"]
+        mock_game.state.werewolves = [sample_participants["werewolf"], second]
+        mock_game.state.seer = sample_participants["seer"]
+        return mock_game.state.werewolves
+
+    @pytest.mark.asyncio
+    async def test_night_actors_run_concurrently(self, mock_game, mock_messenger, sample_participants, pack):
+        """Test that every werewolf and the seer are prompted at the same time."""
+        night = Night(mock_game, mock_messenger)
+        in_flight = 0
+        peak = 0
+
+        def actor(response):
+            async def act(prompt):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return response
+            return act
+
+        for werewolf in pack:
+            werewolf.talk_to_agent.side_effect = actor({"player_id": "villager_1", "reason": "quiet"})
+        sample_participants["seer"].talk_to_agent.side_effect = actor({"player_id": "werewolf_1", "reason": "hunch"})
+
+        await night.run()
+
+        assert peak == 3
+        mock_game.state.eliminate_player.assert_called_once_with("villager_1", EliminationType.NIGHT_KILL)
+
+    @pytest.mark.asyncio
+    async def test_events_logged_in_fixed_order(self, mock_game, mock_messenger, sample_participants, pack):
+        """Test that the kill is logged before the investigation even if the seer answers first."""
+        night = Night(mock_game, mock_messenger)
+
+        async def slow_kill(prompt):
+            await asyncio.sleep(0.02)
+            return {"player_id": "villager_1", "reason": "quiet"}
+
+        for werewolf in pack:
+            werewolf.talk_to_agent.side_effect = slow_kill
+        sample_participants["seer"].talk_to_agent.return_value = {"player_id": "villager_2", "reason": "hunch"}
+
+        await night.run()
+
+        logged_types = [call.args[1].type for call in mock_game.log_event.call_args_list]
+        assert logged_types == [EventType.WEREWOLF_ELIMINATION, EventType.SEER_INVESTIGATION, EventType.NIGHT_END]
+
+    def test_choose_kill_majority(self, mock_game, mock_messenger, sample_participants):
+        """Test that the most proposed target is chosen."""
+        night = Night(mock_game, mock_messenger)
+        pack = [sample_participants["werewolf"], sample_participants["villager2"], sample_participants["villager3"]]
+        responses = [
+            KillResponse(player_id="seer_1", reason="a"),
+            KillResponse(player_id="villager_1", reason="b"),
+            KillResponse(player_id="villager_1", reason="c"),
+        ]
+
+        werewolf, target, rationale = night.choose_kill(pack, responses)
+
+        assert target == "villager_1"
+        assert werewolf is sample_participants["villager2"]
+        assert rationale == "b"
+
+    def test_choose_kill_tie_rotates_by_round(self, mock_game, mock_messenger, pack):
+        """Test that a split vote goes to each werewolf's pick in turn, round by round."""
+        night = Night(mock_game, mock_messenger)
+        responses = [
+            KillResponse(player_id="seer_1", reason="first"),
+            KillResponse(player_id="villager_1", reason="second"),
+        ]
+
+        chosen = []
+        for round_number in (1, 2, 3):
+            mock_game.state.current_round = round_number
+            chosen.append(night.choose_kill(pack, responses))
+
+        assert chosen == [
+            (pack[0], "seer_1", "first"),
+            (pack[1], "villager_1", "second"),
+            (pack[0], "seer_1", "first"),
+        ]
+
+    def test_choose_kill_tie_skips_silent_werewolf(self, mock_game, mock_messenger, sample_participants, pack):
+        """Test that the turn passes on when the werewolf whose turn it is did not answer."""
+        night = Night(mock_game, mock_messenger)
+        pack = pack + [sample_participants["villager2"]]
+        mock_game.state.current_round = 2
+        responses = [
+            KillResponse(player_id="seer_1", reason="first"),
+            None,
+            KillResponse(player_id="villager_1", reason="third"),
+        ]
+
+        assert night.choose_kill(pack, responses) == (pack[2], "villager_1", "third")
+
+    def test_choose_kill_ignores_timeouts(self, mock_game, mock_messenger, pack):
+        """Test that a werewolf who timed out does not block the kill."""
+        night = Night(mock_game, mock_messenger)
+
+        _, target, _ = night.choose_kill(pack, [None, KillResponse(player_id="villager_1", reason="x")])
+
+        assert target == "villager_1"
+        assert night.choose_kill(pack, [None, None]) is None
+
+    @pytest.mark.asyncio
+    async def test_dead_werewolf_does_not_act(self, mock_game, mock_messenger, sample_participants, pack):
+        """Test that only living werewolves are asked for a kill."""
+        night = Night(mock_game, mock_messenger)
+        mock_game.state.participants = {1: [p for p in sample_participants.values() if p.id != "werewolf_1"]}
+        pack[1].talk_to_agent.return_value = {"player_id": "villager_1", "reason": "x"}
+        sample_participants["seer"].talk_to_agent.return_value = {"player_id": "villager_2", "reason": "y"}
+
+        await night.run()
+
+        pack[0].talk_to_agent.assert_not_called()
+        pack[1].talk_to_agent.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_seer_identifies_any_werewolf(self, mock_game, mock_messenger, sample_participants, pack):
+        """Test that investigating the second werewolf reveals a werewolf."""
+        night = Night(mock_game, mock_messenger)
+        mock_game.state.seer_checks = []
+        sample_participants["seer"].talk_to_agent.return_value = {"player_id": "villager_3", "reason": "x"}
+
+        await night.execute_seer_investigation()
+
+        assert mock_game.state.seer_checks == [("villager_3", True)]
+
+
+class TestSeerSkip:
+    """Test suite for skipping seer calls once the werewolf is known."""
+
+    @pytest.mark.asyncio
+    async def test_seer_skipped_after_finding_werewolf(self, mock_game, mock_messenger, sample_participants, werewolf_elimination_response):
+        """Test that the seer is not prompted once every living werewolf is revealed."""
+        night = Night(mock_game, mock_messenger)
+        sample_participants["werewolf"].talk_to_agent.return_value = werewolf_elimination_response
+        mock_game.state.seer_checks = [("werewolf_1", True)]
+
+        await night.run()
+
+        sample_participants["seer"].talk_to_agent.assert_not_called()
+        logged_types = [call.args[1].type for call in mock_game.log_event.call_args_list]
+        assert EventType.SEER_INVESTIGATION not in logged_types
+
+    @pytest.mark.asyncio
+    async def test_seer_keeps_investigating_other_werewolves(self, mock_game, mock_messenger, sample_participants, werewolf_elimination_response):
+        """Test that finding one werewolf does not stop the seer while another is hidden."""
+        night = Night(mock_game, mock_messenger)
+        mock_game.state.werewolves = [sample_participants["werewolf"], sample_participants["villager3"]]
+        for werewolf in mock_game.state.werewolves:
+            werewolf.talk_to_agent.return_value = werewolf_elimination_response
+        sample_participants["seer"].talk_to_agent.return_value = {"player_id": "villager_3", "reason": "x"}
+        mock_game.state.seer_checks = [("werewolf_1", True)]
+
+        await night.run()
+
+        sample_participants["seer"].talk_to_agent.assert_called_once()
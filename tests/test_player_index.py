@@ -0,0 +1,89 @@
+import pytest
+
+from src.game.PlayerIndex import PlayerIndex, edit_distance
+from src.phases.night import Night
+from src.models.enum.EliminationType import EliminationType
+
+
+UUIDS = [
+    "3f2b9c1e-7a41-4d2e-9c55-0b6e1f8a2d34",
+    "3f2b1111-0000-4aaa-8bbb-ccccdddd0001",
+    "a9e07d52-51c3-4b0f-8f4e-2d6c9b1a7e10",
+]
+
+
+class TestPlayerIndex:
+    """Test suite for resolving player references in replies."""
+
+    def test_exact_and_alias(self):
+        """Test exact IDs (case-insensitive, quoted) and aliases."""
+        index = PlayerIndex(UUIDS, aliases={"P3": UUIDS[2]})
+
+        assert index.resolve(UUIDS[0].upper()) == UUIDS[0]
+        assert index.resolve(f'"{UUIDS[1]}"') == UUIDS[1]
+        assert index.resolve("p3") == UUIDS[2]
+
+    def test_unique_prefix(self):
+        """Test that the 8-character log prefix resolves when it is unique."""
+        index = PlayerIndex(UUIDS)
+
+        assert index.resolve("a9e07d52") == UUIDS[2]
+        assert index.resolve("3f2b9c1e") == UUIDS[0]
+
+    def test_ambiguous_prefix(self):
+        """Test that a prefix shared by two players does not resolve."""
+        assert PlayerIndex(UUIDS).resolve("3f2b") is None
+
+    def test_mangled_uuid(self):
+        """Test that a UUID with a couple of typos resolves to the closest player."""
+        mangled = UUIDS[2].replace("51c3", "5lc3").replace("7e10", "7e1")
+
+        assert PlayerIndex(UUIDS).resolve(mangled) == UUIDS[2]
+
+    def test_no_match(self):
+        """Test that unrelated text does not resolve."""
+        index = PlayerIndex(UUIDS)
+
+        assert index.resolve("the quiet one") is None
+        assert index.resolve("") is None
+        assert index.resolve(None) is None
+
+    def test_ties_do_not_resolve(self):
+        """Test that a reference equally close to two players is left alone."""
+        assert PlayerIndex(["villager_1", "villager_2"]).resolve("villager_3") is None
+
+    def test_edit_distance_limit(self):
+        """Test that the distance is capped once it exceeds the limit."""
+        assert edit_distance("kitten", "sitting", 5) == 3
+        assert edit_distance("kitten", "sitting", 1) == 2
+
+
+class TestIndexInGame:
+    """Test suite for the index behind Night, Voting and the seer flow."""
+
+    def test_dead_player_is_not_bent_into_living_one(self, game_data):
+        """Test that an eliminated player's ID resolves to that player, not a lookalike."""
+        game_data.eliminate_player("villager_3", EliminationType.NIGHT_KILL)
+
+        assert game_data.get_player_index().resolve("villager_3") == "villager_3"
+
+    def test_index_rebuilt_after_elimination(self, game_data):
+        """Test that the cached index follows the living players."""
+        first = game_data.get_player_index()
+
+        assert game_data.get_player_index() is first
+        game_data.eliminate_player("villager_1", EliminationType.VOTED_OUT)
+        assert game_data.get_player_index() is not first
+
+    @pytest.mark.asyncio
+    async def test_kill_by_prefix(self, mock_game, mock_messenger, sample_participants):
+        """Test that a werewolf naming a victim by prefix kills without a retry."""
+        mock_game.state.participants = {1: list(sample_participants.values())}
+        werewolf = sample_participants["werewolf"]
+        werewolf.talk_to_agent.return_value = {"player_id": "seer", "reason": "r"}
+        night = Night(mock_game, mock_messenger)
+
+        await night.execute_werewolf_kill()
+
+        werewolf.talk_to_agent.assert_called_once()
+        mock_game.state.eliminate_player.assert_called_once_with("seer_1", EliminationType.NIGHT_KILL)
@@ -0,0 +1,93 @@
+import pytest
+
+from src.game.PlayerRegistry import PlayerRegistry
+from src.models.enum.Role import Role
+from src.models.enum.EliminationType import EliminationType
+
+
+class FakePlayer:
+    def __init__(self, id, role):
+        self.id = id
+        self.role = role
+
+
+def make_registry():
+    registry = PlayerRegistry()
+    players = [FakePlayer("w", Role.WEREWOLF), FakePlayer("s", Role.SEER), FakePlayer("v1", Role.VILLAGER), FakePlayer("v2", Role.VILLAGER)]
+    registry.register_all(players, 1)
+    return registry, players
+
+
+class TestPlayerRegistry:
+    """Test suite for integer handles, the alive bitset and role counts."""
+
+    def test_handles_follow_registration_order(self):
+        """Test that handles are dense and stable."""
+        registry, players = make_registry()
+
+        assert [registry.handle(p.id) for p in players] == [0, 1, 2, 3]
+        assert registry.get("s") is players[1]
+        assert registry.handle("nobody") is None
+
+    def test_eliminate_updates_alive_and_counts(self):
+        """Test that elimination clears the alive bit and the role count."""
+        registry, _ = make_registry()
+
+        assert registry.eliminate("v1", 1) is True
+        assert registry.eliminate("v1", 1) is False
+
+        assert not registry.is_alive("v1")
+        assert registry.count_alive() == 3
+        assert registry.count_alive(Role.VILLAGER) == 1
+        assert registry.count_alive(Role.VILLAGER, Role.SEER) == 2
+
+    def test_round_snapshots(self):
+        """Test that a finished round keeps its members when later rounds change."""
+        registry, _ = make_registry()
+        registry.eliminate("v1", 1)
+        registry.start_round(2)
+        registry.eliminate("s", 2)
+
+        assert [p.id for p in registry.members(1)] == ["w", "s", "v2"]
+        assert [p.id for p in registry.members(2)] == ["w", "v2"]
+        assert registry.rounds() == [1, 2]
+
+    def test_set_role_moves_count(self):
+        """Test that reassigning a living player's role keeps counts right."""
+        registry, _ = make_registry()
+
+        registry.set_role("v2", Role.SEER)
+
+        assert registry.count_alive(Role.SEER) == 2
+        assert registry.count_alive(Role.VILLAGER) == 1
+
+
+class TestParticipantsView:
+    """Test suite for the read-only dict-of-lists view in GameData."""
+
+    def test_reads_like_a_dict(self, game_data):
+        """Test the lookups the phases and prompts rely on."""
+
+        assert 1 in game_data.participants
+        assert 2 not in game_data.participants
+        assert len(game_data.participants[1]) == 5
+        assert game_data.participants.get(2, []) == []
+        assert list(game_data.participants.keys()) == [1]
+
+    def test_is_read_only(self, game_data):
+        """Test that the view can't be written to."""
+
+        with pytest.raises(TypeError):
+            game_data.participants[2] = []
+
+    def test_next_round_starts_with_survivors(self, game_data):
+        """Test that round transitions carry the living players without copying lists."""
+        game_data.eliminate_player("villager_1", EliminationType.VOTED_OUT)
+
+        game_data.initialize_next_round()
+        game_data.current_round = 2
+
+        assert [p.id for p in game_data.participants[2]] == ["werewolf_1", "seer_1", "villager_2", "villager_3"]
+        assert game_data.is_alive("seer_1")
+        assert not game_data.is_alive("villager_1")
+        assert game_data.count_alive(Role.VILLAGER, Role.SEER) == 3
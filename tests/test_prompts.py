@@ -0,0 +1,78 @@
+from src.game.analytics import compute_game_analytics
+from src.models.enum.PromptStyle import PromptStyle
+from src.prompts import PromptTemplate, VOTE_PROMPT, estimate_tokens
+
+
+class TestPromptTemplate:
+    """Test suite for compiled prompt templates."""
+
+    def test_strips_indentation(self):
+        """Test that no rendered line keeps the source indentation."""
+        prompt = VOTE_PROMPT.render(PromptStyle.VERBOSE, player_id="p1", role="VILLAGER", transcript="p2 - hi", candidates="p2")
+
+        assert not any(line.startswith(" ") and not line.startswith('    "') for line in prompt.splitlines())
+        assert prompt == prompt.strip()
+
+    def test_drops_empty_optional_lines(self):
+        """Test that a line holding only an empty field is removed without leaving a double gap."""
+        template = PromptTemplate("t", verbose="""
+            Before
+
+            {optional}
+
+            After
+        """, context=False)
+
+        assert template.render(optional="") == "Before\n\nAfter"
+        assert template.render(optional="Middle") == "Before\n\nMiddle\n\nAfter"
+
+    def test_response_block_renders_literal_braces(self):
+        """Test that the JSON example survives formatting with single braces."""
+        prompt = VOTE_PROMPT.render(PromptStyle.VERBOSE, player_id="p1", role="VILLAGER", transcript="", candidates="p2")
+
+        assert '{\n    "player_id"' in prompt
+        assert "}}" not in prompt
+
+    def test_compact_is_smaller(self):
+        """Test that compact rendering keeps the content but costs fewer tokens."""
+        fields = dict(player_id="p1", role="VILLAGER", transcript="p2 - I trust p3", candidates="p2\np3")
+
+        verbose = VOTE_PROMPT.render(PromptStyle.VERBOSE, **fields)
+        compact = VOTE_PROMPT.render(PromptStyle.COMPACT, **fields)
+
+        assert "p2 - I trust p3" in compact
+        assert '"player_id"' in compact
+        assert estimate_tokens(compact) < estimate_tokens(verbose)
+
+
+class TestPromptTokenReporting:
+    """Test suite for per-call prompt token counts."""
+
+    def test_prompts_record_token_counts(self, game_data):
+        """Test that every rendered prompt records its estimated token count."""
+        villager = game_data.participants[1][2]
+
+        prompt = villager.get_bid_prompt()
+        villager.get_bid_prompt()
+
+        assert game_data.prompt_tokens["bid"] == [estimate_tokens(prompt)] * 2
+
+    def test_analytics_report_token_counts(self, game_data):
+        """Test that game analytics summarize prompt tokens per prompt name."""
+        game_data.prompt_tokens = {"bid": [100, 50], "vote": [80]}
+
+        analytics = compute_game_analytics(game_data)
+
+        assert analytics["prompt_tokens"]["bid"] == {"calls": 2, "total": 150, "avg": 75, "max": 100}
+        assert analytics["prompt_tokens_total"] == 230
+
+    def test_style_follows_game_data(self, game_data):
+        """Test that participants render in the game's configured style."""
+        villager = game_data.participants[1][2]
+
+        verbose = villager.get_bid_prompt()
+        game_data.prompt_style = PromptStyle.COMPACT
+        compact = villager.get_bid_prompt()
+
+        assert "IMPORTANT" in verbose
+        assert "IMPORTANT" not in compact
@@ -0,0 +1,77 @@
+import pytest
+from pydantic import ValidationError
+
+from src.models.Bid import Bid
+from src.models.Elimination import Elimination
+from src.models.Event import Event
+from src.models.Message import Message
+from src.models.Vote import Vote
+from src.models.enum.EliminationType import EliminationType
+from src.models.enum.EventType import EventType
+from src.models.enum.Phase import Phase
+
+
+class TestRecords:
+    """Test suite for the slotted game records."""
+
+    def test_records_have_no_instance_dict(self):
+        """Test that records are slotted."""
+        vote = Vote(voter_id="seer_1", voted_for_id="werewolf_1", rationale="Checked them")
+
+        assert not hasattr(vote, "__dict__")
+        with pytest.raises(AttributeError):
+            vote.extra = "value"
+
+    def test_equality_and_repr(self):
+        """Test field-wise equality and a readable repr."""
+        bid = Bid(participant_id="villager_1", amount=30)
+
+        assert bid == Bid(participant_id="villager_1", amount=30)
+        assert bid != Bid(participant_id="villager_1", amount=31)
+        assert repr(bid) == "Bid(participant_id='villager_1', amount=30)"
+
+    def test_to_dict_validates_at_the_boundary(self):
+        """Test that construction skips validation but to_dict enforces the field types."""
+        bid = Bid(participant_id="villager_1", amount="not a number")
+
+        with pytest.raises(ValidationError):
+            bid.to_dict()
+
+    def test_to_dict_serializes_enums(self):
+        """Test JSON-compatible output for enum fields."""
+        elimination = Elimination(eliminated_participant="villager_1", elimination_type=EliminationType.NIGHT_KILL)
+        message = Message(sender_id="seer_1", content="hello", phase=Phase.DISCUSSION)
+
+        assert elimination.to_dict()["elimination_type"] == EliminationType.NIGHT_KILL.value
+        assert message.to_dict() == {"sender_id": "seer_1", "content": "hello", "phase": Phase.DISCUSSION.value}
+
+
+class TestEventDescription:
+    """Test suite for lazily rendered event descriptions."""
+
+    def test_template_rendered_on_first_read(self):
+        """Test that args are formatted into the description when it is read."""
+        event = Event(type=EventType.VOTE, player="seer_1",
+                      description="Voted for {} for rationale: {}", args=("werewolf_1", "found {them}"))
+
+        assert event._args
+        assert event.description == "Voted for werewolf_1 for rationale: found {them}"
+        assert event._args == ()
+
+    def test_plain_description_is_not_formatted(self):
+        """Test that a description without args is kept verbatim, braces included."""
+        event = Event(type=EventType.SEER_INVESTIGATION, player="seer_1", description="Checked {P3}")
+
+        assert event.description == "Checked {P3}"
+
+    def test_to_dict_includes_rendered_description(self):
+        """Test that serialization renders the description."""
+        event = Event(type=EventType.BID_PLACED, player="seer_1",
+                      description="Placed a bid of {} points for rationale: {}", args=(40, "I know something"))
+
+        assert event.to_dict() == {
+            "type": EventType.BID_PLACED.value,
+            "eliminated_player": None,
+            "player": "seer_1",
+            "description": "Placed a bid of 40 points for rationale: I know something",
+        }
@@ -0,0 +1,144 @@
+import httpx
+import pytest
+from a2a.client.errors import A2AClientHTTPError
+from pydantic import ValidationError
+
+from src.phases.bidding import Bidding
+from src.phases.voting import Voting
+from src.a2a.circuit_breaker import CircuitOpenError
+from src.models.response.BidResponse import BidResponse
+from src.models.response.DebateResponse import DebateResponse
+from src.models.response.VoteResponse import VoteResponse
+
+
+class TestResponseModels:
+    """Test suite for the typed action replies."""
+
+    def test_bid_range(self):
+        """Test that bids outside 0-100 are rejected."""
+        assert BidResponse.model_validate({"bid_amount": "40", "reason": "r"}).bid_amount == 40
+        with pytest.raises(ValidationError):
+            BidResponse.model_validate({"bid_amount": 150})
+        with pytest.raises(ValidationError):
+            BidResponse.model_validate({"bid_amount": -1})
+
+    def test_target_must_be_valid(self):
+        """Test that a player outside valid_ids is rejected."""
+        context = {"valid_ids": {"villager_1", "villager_2"}}
+
+        assert VoteResponse.model_validate({"player_id": "villager_1"}, context=context).reason == ""
+        with pytest.raises(ValidationError):
+            VoteResponse.model_validate({"player_id": "ghost"}, context=context)
+
+    def test_debate_needs_message(self):
+        """Test that an empty debate message is rejected."""
+        with pytest.raises(ValidationError):
+            DebateResponse.model_validate({"message": ""})
+
+    def test_fallbacks(self):
+        """Test the defaults used when retries run out."""
+        assert BidResponse.fallback().bid_amount == 0
+        assert VoteResponse.fallback() is None
+        assert DebateResponse.fallback() is None
+
+
+class TestRepairLoop:
+    """Test suite for corrective re-prompts in Phase.ask."""
+
+    @pytest.mark.asyncio
+    async def test_invalid_reply_is_reprompted(self, mock_game, mock_messenger, sample_participants):
+        """Test that an invalid bid gets a corrective prompt and the retry is used."""
+        bidding = Bidding(mock_game, mock_messenger)
+        villager = sample_participants["villager1"]
+        villager.talk_to_agent.side_effect = [{"bid_amount": 500}, {"bid_amount": 60, "reason": "fixed"}]
+
+        response = await bidding.ask(villager, "bid prompt", BidResponse)
+
+        assert response.bid_amount == 60
+        retry_prompt = villager.talk_to_agent.call_args_list[1].kwargs["prompt"]
+        assert retry_prompt.startswith("bid prompt")
+        assert "bid_amount" in retry_prompt
+        assert mock_game.state.response_repairs == {"bid": {"retries": 1, "repaired": 1, "fallbacks": 0}}
+
+    @pytest.mark.asyncio
+    async def test_unparseable_reply_is_reprompted(self, mock_game, mock_messenger, sample_participants):
+        """Test that a reply without JSON is retried instead of crashing the game."""
+        bidding = Bidding(mock_game, mock_messenger)
+        villager = sample_participants["villager1"]
+        villager.talk_to_agent.side_effect = [ValueError("Could not parse JSON"), {"bid_amount": 10}]
+
+        response = await bidding.ask(villager, "bid prompt", BidResponse)
+
+        assert response.bid_amount == 10
+
+    @pytest.mark.asyncio
+    async def test_fallback_after_retries(self, mock_game, mock_messenger, sample_participants):
+        """Test that retries are bounded and the fallback is used afterwards."""
+        mock_game.state.max_response_retries = 2
+        bidding = Bidding(mock_game, mock_messenger)
+        villager = sample_participants["villager1"]
+        villager.talk_to_agent.return_value = {"bid_amount": "lots"}
+
+        response = await bidding.ask(villager, "bid prompt", BidResponse)
+
+        assert villager.talk_to_agent.call_count == 3
+        assert response.bid_amount == 0
+        assert mock_game.state.response_repairs["bid"] == {"retries": 2, "repaired": 0, "fallbacks": 1}
+
+    @pytest.mark.asyncio
+    async def test_unreachable_agent_is_skipped(self, mock_game, mock_messenger, sample_participants):
+        """Test that a call that failed all its retries yields None instead of ending the game."""
+        bidding = Bidding(mock_game, mock_messenger)
+        villager = sample_participants["villager1"]
+        villager.talk_to_agent.side_effect = httpx.ConnectError("down")
+
+        assert await bidding.ask(villager, "bid prompt", BidResponse) is None
+        villager.talk_to_agent.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_retryable_http_status_is_skipped(self, mock_game, mock_messenger, sample_participants):
+        """Test that a call still answered with 503 after its retries yields None."""
+        bidding = Bidding(mock_game, mock_messenger)
+        villager = sample_participants["villager1"]
+        villager.talk_to_agent.side_effect = A2AClientHTTPError(503, "unavailable")
+
+        assert await bidding.ask(villager, "bid prompt", BidResponse) is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error", [A2AClientHTTPError(400, "bad request"), RuntimeError("bug")])
+    async def test_non_retryable_error_propagates(self, mock_game, mock_messenger, sample_participants, error):
+        """Test that only transient transport errors are skipped; anything else still fails the phase."""
+        bidding = Bidding(mock_game, mock_messenger)
+        villager = sample_participants["villager1"]
+        villager.talk_to_agent.side_effect = error
+
+        with pytest.raises(type(error)):
+            await bidding.ask(villager, "bid prompt", BidResponse)
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_ends_the_game(self, mock_game, mock_messenger, sample_participants):
+        """Test that an open circuit breaker is not treated as a skipped turn."""
+        bidding = Bidding(mock_game, mock_messenger)
+        villager = sample_participants["villager1"]
+        villager.talk_to_agent.side_effect = CircuitOpenError("http://localhost:8003")
+
+        with pytest.raises(CircuitOpenError):
+            await bidding.ask(villager, "bid prompt", BidResponse)
+
+    @pytest.mark.asyncio
+    async def test_vote_for_dead_player_abstains(self, mock_game, mock_messenger, sample_participants):
+        """Test that a voter who keeps naming an eliminated player abstains instead of crashing."""
+        mock_game.state.participants = {1: list(sample_participants.values())}
+        mock_game.state.votes = {1: []}
+        mock_game.state.max_response_retries = 1
+        for participant in sample_participants.values():
+            participant.talk_to_agent.return_value = {"player_id": "villager_2", "reason": "r"}
+        sample_participants["seer"].talk_to_agent.return_value = {"player_id": "long_gone", "reason": "r"}
+        voting = Voting(mock_game, mock_messenger)
+
+        await voting.collect_round_votes()
+
+        voters = [vote.voter_id for vote in mock_game.state.votes[1]]
+        assert "seer_1" not in voters
+        assert len(voters) == len(sample_participants) - 1
+        assert sample_participants["seer"].talk_to_agent.call_count == 2
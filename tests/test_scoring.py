@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+from src.evaluation.scoring import Scoring
+from src.models.Event import Event
+from src.models.Vote import Vote
+from src.models.enum.EventType import EventType
+from src.phases.game_end import GameEnd
+
+
+PLAYERS = ["werewolf_1", "seer_1", "villager_1", "villager_2", "villager_3"]
+
+
+def play_random_game(game_data, seed: int):
+    """Record random votes and seer checks on game_data through the hooks."""
+    rng = random.Random(seed)
+    game_data.villagers = [game_data.get_participant(pid) for pid in PLAYERS[2:]]
+    rounds = rng.randint(1, 9)
+    for round_num in range(1, rounds + 1):
+        game_data.current_round = round_num
+        if rng.random() < 0.6:
+            game_data.record_event(round_num, Event(type=EventType.SEER_INVESTIGATION, player="seer_1"))
+        for voter in PLAYERS:
+            if rng.random() < 0.5:
+                game_data.cast_vote(voter, rng.choice(PLAYERS), "because")
+            else:
+                game_data.record_vote(Vote(voter_id=voter, voted_for_id=rng.choice(PLAYERS), rationale="because"))
+    game_data.winner = rng.choice([None, "werewolf", "villagers"])
+    if rng.random() < 0.2:
+        game_data.declare_timeout()
+
+
+class TestScoreTally:
+    """Test suite for the incremental score totals."""
+
+    @pytest.mark.parametrize("seed", range(50))
+    def test_parity_with_scoring(self, game_data, seed):
+        """Test that the running totals give the same scores as a full rescan."""
+        play_random_game(game_data, seed)
+        scoring = Scoring(game_state=game_data)
+        tally = game_data.score_tally
+
+        assert tally.score_werewolf(game_data) == scoring.score_werewolf()
+        assert tally.score_seer(game_data) == scoring.score_seer()
+        assert tally.score_villager(game_data) == scoring.score_villager()
+
+    def test_no_votes_or_investigations(self, game_data):
+        """Test the scores of a game where nothing was recorded."""
+        game_data.villagers = [game_data.get_participant(pid) for pid in PLAYERS[2:]]
+        scoring = Scoring(game_state=game_data)
+
+        assert game_data.score_tally.scores(game_data) == {
+            "werewolf_1": scoring.score_werewolf(),
+            "seer_1": scoring.score_seer(),
+            "villager_1": scoring.score_villager(),
+            "villager_2": scoring.score_villager(),
+            "villager_3": scoring.score_villager(),
+        }
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_parity_with_two_werewolves(self, game_data, seed):
+        """Test that votes against either werewolf count the same in both scorers."""
+        play_random_game(game_data, seed)
+        game_data.werewolves = [game_data.werewolf, game_data.get_participant("villager_3")]
+        game_data.villagers = game_data.villagers[:2]
+        scoring = Scoring(game_state=game_data)
+        scores = game_data.score_tally.scores(game_data)
+
+        assert scores["werewolf_1"] == scores["villager_3"] == scoring.score_werewolf()
+        assert scores["villager_1"] == scoring.score_villager()
+
+    def test_votes_against_second_werewolf_count(self, game_data):
+        """Test that a vote for the second werewolf scores for the villagers."""
+        game_data.werewolves = [game_data.werewolf, game_data.get_participant("villager_3")]
+        game_data.cast_vote("seer_1", "villager_3", "exposed")
+
+        assert game_data.score_tally.score_villager(game_data) == 10 + (10 - 1) * 3
+        assert game_data.score_tally.score_werewolf(game_data) == 10
+
+    def test_game_end_reads_tally(self, mock_game, mock_messenger, game_data):
+        """Test that GameEnd reports the tallied scores."""
+        play_random_game(game_data, 7)
+        mock_game.state = game_data
+        scoring = Scoring(game_state=game_data)
+
+        scores = GameEnd(mock_game, mock_messenger).compute_scores()
+
+        assert scores["werewolf_1"] == scoring.score_werewolf()
+        assert scores["seer_1"] == scoring.score_seer()
+        assert scores["villager_2"] == scoring.score_villager()
@@ -0,0 +1,81 @@
+from src.game.Transcript import Transcript
+from src.models.Message import Message
+from src.models.enum.Phase import Phase
+
+
+def message(sender_id, content):
+    return Message(sender_id=sender_id, content=content, phase=Phase.DISCUSSION)
+
+
+class TestTranscript:
+    """Test suite for the incrementally rendered round transcript."""
+
+    def test_renders_both_layouts(self):
+        """Test that debate and vote prompts get their own line format."""
+        transcript = Transcript([message("p1", "hello"), message("p2", "hi")])
+
+        assert transcript.debate_text == "p1: hello\np2: hi"
+        assert transcript.vote_text == "p1 - hello\np2 - hi"
+        assert len(transcript) == 2
+
+    def test_renders_sender_through_render_id(self):
+        """Test that senders are shown as render_id maps them."""
+        transcript = Transcript([message("uuid-1", "hello")], render_id={"uuid-1": "P1"}.get)
+
+        assert transcript.debate_text == "P1: hello"
+
+    def test_empty_transcript(self):
+        """Test that an empty round renders as an empty string."""
+        transcript = Transcript()
+
+        assert transcript.debate_text == ""
+        assert transcript.vote_text == ""
+
+    def test_matches_full_rerender(self):
+        """Test that appending one message at a time matches joining the whole history."""
+        messages = [message(f"p{i % 4}", f"message {i}") for i in range(20)]
+        transcript = Transcript()
+
+        for i, msg in enumerate(messages, start=1):
+            transcript.append(msg)
+            assert transcript.debate_text == "\n".join(f"{m.sender_id}: {m.content}" for m in messages[:i])
+
+
+    def test_text_cached_until_next_append(self):
+        """Test that repeated reads reuse the joined text and an append refreshes it."""
+        transcript = Transcript([message("p1", "hello")])
+
+        first = transcript.debate_text
+        assert transcript.debate_text is first
+
+        transcript.append(message("p2", "hi"))
+
+        assert transcript.debate_text == "p1: hello\np2: hi"
+        assert transcript.vote_text == "p1 - hello\np2 - hi"
+
+class TestGameDataTranscript:
+    """Test suite for transcript bookkeeping in GameData."""
+
+    def test_record_message_updates_history_and_transcript(self, game_data):
+        """Test that record_message stores the message and renders it."""
+
+        game_data.record_message(message("villager_1", "I suspect seer_1"))
+
+        assert game_data.chat_history[1][0].content == "I suspect seer_1"
+        assert game_data.get_transcript(1).debate_text == "P3: I suspect seer_1"
+
+    def test_catches_up_on_direct_appends(self, game_data):
+        """Test that messages added straight to chat_history still reach the transcript."""
+        game_data.record_message(message("villager_1", "first"))
+        game_data.chat_history[1].append(message("villager_2", "second"))
+
+        assert game_data.get_transcript(1).vote_text == "P3 - first\nP4 - second"
+
+    def test_prompts_use_transcript(self, game_data):
+        """Test that debate and vote prompts include the rendered transcript."""
+        game_data.speaking_order[1] = ["villager_1"]
+        game_data.record_message(message("villager_2", "watch P1"))
+        speaker = game_data.participants[1][2]
+
+        assert "P4: watch P1" in speaker.get_debate_prompt()
+        assert "P4 - watch P1" in speaker.get_vote_prompt()
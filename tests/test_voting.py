@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock
 
@@ -165,3 +166,58 @@ class TestVotingPhase:
         total_calls = sum(p.talk_to_agent.call_count for p in active_participants)
         assert total_calls == len(active_participants)
         assert len(mock_game.state.votes[1]) == len(active_participants)
+
+
+class TestSealedVoting:
+    """Test suite for sealed (concurrent) voting."""
+
+    @pytest.mark.asyncio
+    async def test_sealed_votes_match_sequential(self, mock_game, mock_messenger, sample_participants):
+        """Test that sealed votes are committed in participant order and tallied the same way."""
+        voting = Voting(mock_game, mock_messenger)
+        participants = list(sample_participants.values())
+        choices = ["villager_1", "villager_2", "villager_2", "villager_1", "seer_1"]
+
+        for index, participant in enumerate(participants):
+            async def vote(prompt, index=index):
+                await asyncio.sleep(0.01 * (len(participants) - index))
+                return {"player_id": choices[index], "reason": "sealed"}
+            participant.talk_to_agent.side_effect = vote
+
+        mock_game.state.sealed_voting = True
+        mock_game.state.current_round = 1
+        mock_game.state.participants = {1: participants}
+        mock_game.state.votes = {1: []}
+
+        await voting.run()
+
+        assert [v.voter_id for v in mock_game.state.votes[1]] == [p.id for p in participants]
+        assert [v.voted_for_id for v in mock_game.state.votes[1]] == choices
+        # villager_1 and villager_2 tie; the first to reach the max count wins, as before
+        mock_game.state.eliminate_player.assert_called_once()
+        assert mock_game.state.eliminate_player.call_args[0][0] == "villager_1"
+
+    @pytest.mark.asyncio
+    async def test_sealed_vote_timeout_abstains(self, mock_game, mock_messenger, vote_response, sample_participants):
+        """Test that a participant who misses the timeout does not vote."""
+        voting = Voting(mock_game, mock_messenger)
+        participants = list(sample_participants.values())
+
+        for participant in participants:
+            participant.talk_to_agent.return_value = vote_response
+
+        async def hang(prompt):
+            await asyncio.sleep(10)
+
+        sample_participants["seer"].talk_to_agent.side_effect = hang
+
+        mock_game.state.sealed_voting = True
+        mock_game.state.action_timeout = 0.05
+        mock_game.state.current_round = 1
+        mock_game.state.participants = {1: participants}
+        mock_game.state.votes = {1: []}
+
+        await voting.collect_round_votes()
+
+        assert len(mock_game.state.votes[1]) == len(participants) - 1
+        assert "seer_1" not in [v.voter_id for v in mock_game.state.votes[1]]